@@ -1,71 +1,214 @@
 import pygame
 import random
 import sys
-import os  # Ensure os is imported
-from pygame.locals import *
-
-# Set the working directory to the script's directory
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
+import time
+import os
 
 from core.settings import GameSettings
-from core.entity import Entity
+from core.assets import assets, GAME_IMAGES, ROOT_DIR
+from core.hud import TextCache, HudPanel
+from core.dirty_renderer import DirtyRectRenderer
+from core.dynamic_resolution import ResolutionController
+from core.background import ParallaxBackground
+from core.render_pipeline import FrameSnapshot, SnapshotRenderer, RenderPipeline
+from core import profiler
+from core.profiler import FrameProfiler
+from core.recording import Recording, RecordingWriter, quantize_dt, settings_overrides, state_hash, INPUT_LEFT, INPUT_RIGHT
+from core import time_scale
+from core.time_scale import TimeScale
+from core.telemetry import TelemetryStore, CRASH_CODES, CRASH_NONE, LEGACY_HIGH_SCORE_FILE
+from core.spectator import SpectatorServer, run_viewer
 from objects.balloon import Balloon
-from objects.obstacle import *
-from objects.power_up import *
-from core.game_managers import *
+from core.game_managers import PowerUpManager, CollisionManager, create_obstacle_manager
+
+# ---------------------------
+# Session States
+# ---------------------------
+PLAYING = "playing"        # frame loop running until the balloon crashes
+GAME_OVER = "game_over"    # game over screen waiting for restart or quit
+RESTARTING = "restarting"  # resetting the session in place before PLAYING
+QUITTING = "quitting"      # leaving run() and shutting down
 
 class GameLoop:
     """Main game controller class managing the game lifecycle and subsystems."""
     
-    def __init__(self):
+    def __init__(self, headless=False, settings=GameSettings, seed=None):
         """Initialize game systems including:
-        - Pygame window
+        - Pygame window (skipped in headless mode)
         - Game objects (balloon, managers)
         - Game state tracking
+
+        Args:
+            headless (bool): Run the simulation without a display, clock or fonts
+            settings (type): GameSettings class or one derived with GameSettings.derive()
+            seed (int): Seed of the session random generator, random if omitted
         """
-        pygame.init()
-        self.screen = pygame.display.set_mode((GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 24)
-        self.slowdown_font = pygame.font.SysFont(None, 48)  # Font for slowdown text
-        pygame.display.set_caption("Balloon Game")
+        self.headless = headless
+        self.settings = settings
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng = random.Random(self.seed)
+        self.recorder = None
+        self.profiler = FrameProfiler(settings.PROFILER_FRAMES, enabled=settings.PROFILER_ENABLED)
+        self.pipeline = None  # RenderPipeline while run() draws on the render thread
+        self.spectator_server = None
+        self.show_profiler = False
+        self.startup_times = {}  # phase -> seconds spent constructing the game, see --startup-timing
+        started = time.perf_counter()
+        if not headless and self.settings.ASSET_PRELOAD_THREAD:
+            assets.start_preload(GAME_IMAGES)  # decode sprites while the window opens
+        if headless:
+            self.screen = None
+            self.clock = None
+            self.font = None
+            self.slowdown_font = None
+            self.text_cache = None
+            self.hud_panel = None
+            self.dirty_renderer = None
+            self.background = None
+            self.resolution = None
+            self.renderer = None
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode((self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT))
+            self.clock = pygame.time.Clock()
+            self.font = pygame.font.SysFont(None, 24)
+            self.slowdown_font = pygame.font.SysFont(None, 48)  # Font for slowdown text
+            self.text_cache = TextCache()
+            self.hud_panel = HudPanel(self.font, self.text_cache)
+            self.background = ParallaxBackground(self.settings) if self.settings.PARALLAX_ENABLED else None
+            self.dirty_renderer = None
+            if self.settings.RENDER_MODE == "dirty":
+                self.dirty_renderer = DirtyRectRenderer(self.screen, self.settings.SKY_COLOR,
+                                                        self.settings.DIRTY_RECT_MAX_COVERAGE)
+            self.resolution = None
+            if self.settings.DYNAMIC_RESOLUTION and self.dirty_renderer is None:
+                self.resolution = ResolutionController(self.settings.RESOLUTION_SCALES,
+                                                       self.settings.RESOLUTION_BUDGET_MS,
+                                                       self.settings.RESOLUTION_WINDOW)
+            self.renderer = SnapshotRenderer(self.screen, self.settings, self.font, self.slowdown_font,
+                                             self.text_cache, self.hud_panel, self.profiler,
+                                             self.background, self.dirty_renderer, self.resolution)
+            pygame.display.set_caption("Balloon Game")
+        self.startup_times["display"] = time.perf_counter() - started
+
+        # Decode every sprite once; with a display, convert them to its pixel format
+        started = time.perf_counter()
+        assets.wait_preload()
+        assets.preload(GAME_IMAGES)
+        if not headless:
+            assets.convert()
+            if self.settings.USE_SPRITE_ATLAS and assets.atlas is None:
+                assets.build_atlas()
+        self.startup_times["assets"] = time.perf_counter() - started
 
-        self.balloon = Balloon()
-        self.obstacle_manager = ObstacleManager()
-        self.powerup_manager = PowerUpManager()
-        self.collision_manager = CollisionManager(self.balloon, self.obstacle_manager, self.powerup_manager)
+        started = time.perf_counter()
+        self.time_scale = TimeScale()
+        self.balloon = Balloon(self.settings, self.time_scale)
+        self.obstacle_manager = create_obstacle_manager(settings=self.settings, rng=self.rng,
+                                                        time_scale=self.time_scale)
+        self.powerup_manager = PowerUpManager(self.settings, self.rng, time_scale=self.time_scale)
+        self.collision_manager = CollisionManager(self.balloon, self.obstacle_manager, self.powerup_manager, self.settings)
 
-        self.running = True
+        self.state = PLAYING
         self.current_height = 0
+        self.previous_height = 0  # height at the start of the tick, for background interpolation
+        # Headless sessions never touch the telemetry store or the high score
+        self.store = None
+        self.telemetry = None
+        if not headless:
+            # relative to the project like the assets, whatever the working directory
+            self.store = TelemetryStore(os.path.join(ROOT_DIR, self.settings.TELEMETRY_DIR))
+            if self.settings.TELEMETRY_ENABLED:
+                self.telemetry = self.store.open_log(self.settings.TELEMETRY_QUEUE_SIZE)
         self.highest_height = self.load_highest_height()
+        self.startup_times["session"] = time.perf_counter() - started
 
     def load_highest_height(self):
-        """Load the highest height from a file."""
-        if os.path.exists("highest_height.txt"):
-            with open("highest_height.txt", "r") as file:
-                return float(file.read())
-        return 0
+        """Load the highest height from the telemetry store (migrating highest_height.txt)."""
+        if self.store is None:
+            return 0
+        return self.store.load_high_score(os.path.join(ROOT_DIR, LEGACY_HIGH_SCORE_FILE))
 
     def save_highest_height(self):
-        """Save the highest height to a file."""
-        with open("highest_height.txt", "w") as file:
-            file.write(str(self.highest_height))
+        """Save the highest height crash-safely to the telemetry store."""
+        if self.store is not None:
+            self.store.save_high_score(self.highest_height)
 
-    def handle_input(self, dt):
-        """Process user input for balloon movement and game control.
-        
-        Args:
-            dt (float): Delta time in seconds
+    def close_telemetry(self):
+        """Flush and close the telemetry log."""
+        if self.telemetry is not None:
+            self.telemetry.close()
+            self.telemetry = None
+
+    def handle_input(self):
+        """Process window events and read the movement keys.
+
+        Returns:
+            tuple: (left, right) movement pressed this frame
         """
         for event in pygame.event.get():
-            if event.type == QUIT:
-                self.running = False
+            if event.type == pygame.QUIT:
+                self.state = QUITTING
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.toggle_profiler()
+                elif event.key == pygame.K_F4:
+                    self.export_profile()
         keys = pygame.key.get_pressed()
-        if keys[K_a] or keys[K_LEFT]:
+        left = keys[pygame.K_a] or keys[pygame.K_LEFT]
+        right = keys[pygame.K_d] or keys[pygame.K_RIGHT]
+        return left, right
+
+    def step(self, left, right, dt):
+        """Advance the simulation by one tick: record it, apply input and update.
+
+        Args:
+            left (bool): Move left this tick
+            right (bool): Move right this tick
+            dt (float): Tick length in seconds
+        """
+        if self.recorder is not None:
+            self.recorder.record(dt, left, right)
+        self.balloon.save_position()
+        self.previous_height = self.current_height
+        self.apply_input(left, right, dt)
+        self.profiler.lap(profiler.INPUT)
+        self.update(dt)
+
+    def apply_input(self, left, right, dt):
+        """Move the balloon according to the pressed directions.
+
+        Args:
+            left (bool): Move left this frame
+            right (bool): Move right this frame
+            dt (float): Delta time in seconds
+        """
+        dt = self.time_scale.dt(time_scale.BALLOON, dt)
+        if left:
             self.balloon.move_left(dt)
-        if keys[K_d] or keys[K_RIGHT]:
+        if right:
             self.balloon.move_right(dt)
 
+    def toggle_profiler(self):
+        """Show or hide the profiler overlay, recording frames only while it is shown."""
+        self.show_profiler = not self.show_profiler
+        self.profiler.set_enabled(self.show_profiler or self.settings.PROFILER_ENABLED)
+
+    def export_profile(self, basename=None):
+        """Write the profiler ring buffer as a Chrome trace and a CSV file.
+
+        Args:
+            basename (str): Output path without extension, defaults to a timestamped name
+
+        Returns:
+            tuple: Paths of the written .json and .csv files
+        """
+        basename = basename or time.strftime("profile-%Y%m%d-%H%M%S")
+        self.profiler.export_chrome_trace(basename + ".json")
+        self.profiler.export_csv(basename + ".csv")
+        print("Profile exported to {}.json / .csv".format(basename))
+        return basename + ".json", basename + ".csv"
+
     def update(self, dt):
         """Update all game systems:
         - Balloon state
@@ -77,103 +220,384 @@ class GameLoop:
         Args:
             dt (float): Delta time in seconds
         """
-        self.balloon.update(dt)
-        self.obstacle_manager.update(dt)
-        self.powerup_manager.update(dt)
+        lap = self.profiler.lap
+        height = self.current_height / 10  # meters, as shown in the HUD
+        self.time_scale.update(dt)  # count down slowdown and other timed effects
+        world_dt = self.time_scale.world_dt(dt)
+        self.balloon.update(self.time_scale.dt(time_scale.BALLOON, dt))
+        lap(profiler.BALLOON)
+        self.obstacle_manager.update(world_dt, height)
+        lap(profiler.OBSTACLES)
+        self.powerup_manager.update(world_dt, height)
+        lap(profiler.POWERUPS)
         self.collision_manager.check_collisions()
+        lap(profiler.COLLISIONS)
 
-        self.current_height += GameSettings.BACKGROUND_SPEED * dt
+        self.current_height += self.settings.BACKGROUND_SPEED * world_dt
         if self.current_height > self.highest_height:
             self.highest_height = self.current_height
 
         if self.balloon.has_crashed():
-            self.running = False
+            self.state = GAME_OVER
+
+        if self.telemetry is not None:
+            crash = CRASH_CODES.get(self.balloon.crash_cause, CRASH_NONE)  # set on the crash frame only
+            self.telemetry.record(dt, self.current_height / 10, len(self.obstacle_manager.obstacles),
+                                  len(self.powerup_manager.powerups), self.collision_manager.collisions,
+                                  self.collision_manager.pickups, crash)
 
-    def render(self):
+    def render(self, alpha=1.0):
         """Render all game elements:
         - Background
         - Game objects
         - HUD (heights, fuel, shield)
-        """
-        self.screen.fill((135, 206, 235))
 
-        self.balloon.draw(self.screen)
-        self.obstacle_manager.draw(self.screen)
-        self.powerup_manager.draw(self.screen)
+        The frame is captured as a FrameSnapshot and drawn by the SnapshotRenderer,
+        on this thread or, with RENDER_THREADED, on the render thread while the
+        next frame is simulated. Entities and the background are drawn
+        interpolated between the last two simulation ticks. In "dirty" render
+        mode only the regions touched this or last frame are cleared and pushed
+        to the display; the scrolling scenery layers would dirty the whole
+        screen, so that mode shows the static sky gradient only.
 
-        self.draw_hud()
-        self.draw_slowdown_text()  # Draw slowdown text if active
+        Args:
+            alpha (float): Fraction of the next tick already elapsed, 1.0 draws the current state
+        """
+        snapshot = self.snapshot(alpha)
+        if self.pipeline is not None:
+            self.profiler.lap(profiler.RENDER)
+            self.pipeline.submit(snapshot)
+            self.profiler.lap(profiler.FLIP)  # time spent waiting for the render thread
+        else:
+            self.renderer.draw(snapshot, self.profiler.lap)
 
-        pygame.display.flip()
+    def snapshot(self, alpha=1.0):
+        """Capture the state needed to draw the current frame.
 
-    def draw_hud(self):
-        """Draw the HUD elements on the screen."""
-        height_text = self.font.render(f"Current Height: {int(self.current_height/10)}m", True, (0, 0, 0))
-        best_text = self.font.render(f"Highest Height: {int(self.highest_height/10)}m", True, (0, 0, 0))
-        fuel_text = self.font.render(f"Fuel: {int(self.balloon.fuel)}", True, (0, 0, 0))
-        shield_text = self.font.render(f"Shield: {int(self.balloon.shield_timer/1000)}s", True, (0, 0, 0))
-        self.screen.blit(height_text, (10, 10))
-        self.screen.blit(best_text, (10, 30))
-        self.screen.blit(fuel_text, (10, 50))
-        self.screen.blit(shield_text, (10, 70))
-
-    def draw_slowdown_text(self):
-        """Draw the slowdown text in the middle of the screen if slowdown is active."""
+        Args:
+            alpha (float): Interpolation factor between the previous and current tick
+
+        Returns:
+            FrameSnapshot: Sprites in draw order plus background and HUD values
+        """
+        sprites = self.balloon.collect([], alpha)  # layers in draw order, off-screen sprites culled
+        self.obstacle_manager.collect(sprites, alpha)
+        self.powerup_manager.collect(sprites, alpha)
+        background_height = self.previous_height + (self.current_height - self.previous_height) * min(alpha, 1.0)
+        slowdown_text = None
         if self.balloon.slowdown_active:
-            slowdown_text = self.slowdown_font.render(f"Slow Motion: {int(self.balloon.slowdown_timer / 1000)}s", True, (255, 0, 0))
-            text_rect = slowdown_text.get_rect(center=(GameSettings.SCREEN_WIDTH // 2, GameSettings.SCREEN_HEIGHT // 2))
-            self.screen.blit(slowdown_text, text_rect)
+            slowdown_text = f"Slow Motion: {int(self.balloon.slowdown_timer / 1000)}s"
+        return FrameSnapshot(sprites, self.current_height, background_height, self.hud_lines(),
+                             slowdown_text, self.profiler.overlay_lines() if self.show_profiler else None)
+
+    def hud_lines(self):
+        """Return the HUD text; the panel is only re-rendered when one of the displayed integers changes.
+
+        Returns:
+            tuple[str]: Height, highest height, fuel and shield lines
+        """
+        return (f"Current Height: {int(self.current_height/10)}m",
+                f"Highest Height: {int(self.highest_height/10)}m",
+                f"Fuel: {int(self.balloon.fuel)}",
+                f"Shield: {int(self.balloon.shield_timer/1000)}s")
+
+    def host_spectators(self, host="127.0.0.1", port=None):
+        """Stream this game to spectators; run() publishes a snapshot every frame, rate-limited by SPECTATOR_RATE.
+
+        Args:
+            host (str): Interface to listen on, "0.0.0.0" for other machines
+            port (int): TCP port, SPECTATOR_PORT if omitted and 0 for any free port
+
+        Returns:
+            tuple: (host, port) the server listens on
+        """
+        self.spectator_server = SpectatorServer(self, host, self.settings.SPECTATOR_PORT if port is None else port,
+                                                self.settings.SPECTATOR_RATE)
+        return self.spectator_server.address
+
+    def start_recording(self, path):
+        """Record this session's per-frame dt and input to a file for later replay.
+
+        Only the current session is recorded; the file is finalized when it ends.
+
+        Args:
+            path (str): Output file path
+        """
+        self.recorder = RecordingWriter(path, self.seed, settings_overrides(self.settings, GameSettings))
+
+    def stop_recording(self):
+        """Finalize the recording with the final height and state hash."""
+        if self.recorder is not None:
+            self.recorder.close(self.current_height, state_hash(self))
+            self.recorder = None
 
     def run(self):
-        """Execute main game loop with fixed FPS timing."""
-        while self.running:
-            dt = self.clock.tick(GameSettings.FPS) / 1000.0  # dt in seconds
-            self.handle_input(dt)
-            self.update(dt)
-            self.render()
-        self.game_over()
+        """Drive the session state machine until the player quits.
 
-    def game_over(self):
-        """Handle game termination sequence including:
-        - Displaying game over screen
-        - Waiting for user input
-        - Cleaning up resources
+        PLAYING runs the frame loop until the balloon crashes, GAME_OVER shows
+        the game over screen and waits for R or Q, and RESTARTING resets the
+        session in place. The states follow each other in this loop instead of
+        calling back into run(), so restarts never deepen the stack and the
+        window, fonts, caches and entity pools live for the whole process.
+        """
+        while self.state != QUITTING:
+            if self.state == PLAYING:
+                self.play()
+            elif self.state == GAME_OVER:
+                self.game_over()
+            elif self.state == RESTARTING:
+                self.reset_game()
+        self.shutdown()
+
+    def play(self):
+        """Run one session's frame loop: fixed-rate simulation ticks, rendering once per frame.
+
+        Real frame time is accumulated and consumed in TICK_RATE ticks, at most
+        MAX_CATCH_UP_STEPS per frame; time beyond that is dropped so a stall
+        slows the game briefly instead of spiralling. Rendering interpolates
+        between the last two ticks with the leftover fraction of a tick.
+        """
+        tick = quantize_dt(1.0 / self.settings.TICK_RATE)  # exact float32 value for recordings
+        accumulator = 0.0
+        if self.settings.RENDER_THREADED:
+            self.pipeline = RenderPipeline(self.renderer)
+        while self.state == PLAYING:
+            accumulator += self.clock.tick(self.settings.FPS) / 1000.0  # frame time in seconds
+            self.profiler.begin_frame()
+            left, right = self.handle_input()
+            self.profiler.lap(profiler.INPUT)
+            steps = 0
+            while accumulator >= tick and self.state == PLAYING:
+                self.step(left, right, tick)
+                accumulator -= tick
+                steps += 1
+                if steps == self.settings.MAX_CATCH_UP_STEPS:
+                    accumulator = min(accumulator, tick * 0.999)
+                    break
+            alpha = accumulator / tick if self.settings.RENDER_INTERPOLATION else 1.0
+            self.render(alpha)
+            if self.spectator_server is not None:
+                self.spectator_server.publish()
+            self.profiler.end_frame(len(self.obstacle_manager.obstacles), len(self.powerup_manager.powerups))
+        if self.pipeline is not None:
+            self.pipeline.close()  # the game over screen is drawn on this thread
+            self.pipeline = None
+        self.stop_recording()
+
+    def run_headless(self, max_frames, dt=None, input_source=None):
+        """Run the simulation without display, rendering or frame cap.
+
+        Frames are stepped with a fixed dt as fast as the CPU allows until the
+        balloon crashes or max_frames is reached.
+
+        Args:
+            max_frames (int): Upper bound on simulated frames
+            dt (float): Fixed delta time in seconds, defaults to the TICK_RATE tick play() uses
+            input_source (callable | sequence): Either a callable
+                ``(frame, game) -> (left, right)`` or a sequence of
+                ``(left, right)`` pairs; frames past its end get no input
+
+        Returns:
+            int: Number of frames simulated
         """
+        if dt is None:
+            dt = quantize_dt(1.0 / self.settings.TICK_RATE)  # live play's tick, whatever the render FPS
+        if self.recorder is not None:
+            dt = quantize_dt(dt)
+        if input_source is None or callable(input_source):
+            next_input = input_source
+        else:
+            script = input_source
+            next_input = lambda frame, game: script[frame] if frame < len(script) else (False, False)
+
+        frame = 0
+        while self.state == PLAYING and frame < max_frames:
+            left = right = False
+            if next_input is not None:
+                left, right = next_input(frame, self)
+            self.profiler.begin_frame()
+            self.step(left, right, dt)
+            self.profiler.end_frame(len(self.obstacle_manager.obstacles), len(self.powerup_manager.powerups))
+            frame += 1
+        self.stop_recording()
+        return frame
+
+    def run_replay(self, recording):
+        """Re-run a recording headless at maximum speed.
+
+        The game must have been created with the recording's seed and settings,
+        see replay_session().
+
+        Args:
+            recording (Recording): Loaded recording
+
+        Returns:
+            int: Number of frames replayed
+        """
+        frames = 0
+        for dt, bits in zip(recording.dts, recording.inputs):
+            if self.state != PLAYING:
+                break
+            self.step(bits & INPUT_LEFT, bits & INPUT_RIGHT, dt)
+            frames += 1
+        return frames
+
+    def game_over(self):
+        """Show the game over screen and wait for the player's choice (GAME_OVER -> RESTARTING or QUITTING)."""
         print("Game Over!")
+        self.save_highest_height()  # persist now, the player may never quit cleanly
+        if self.spectator_server is not None:
+            self.spectator_server.publish(force=True)  # let spectators see the crash
         self.screen.fill((0, 0, 0))
         over_text = self.font.render("Game Over! Press R to restart or Q to quit.", True, (255, 255, 255))
-        self.screen.blit(over_text, (GameSettings.SCREEN_WIDTH // 2 - 150, GameSettings.SCREEN_HEIGHT // 2))
+        self.screen.blit(over_text, (self.settings.SCREEN_WIDTH // 2 - 150, self.settings.SCREEN_HEIGHT // 2))
         pygame.display.flip()
-        self.wait_for_input()
+        self.state = self.wait_for_input()
 
     def wait_for_input(self):
-        """Wait for user input to restart or quit the game."""
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    waiting = False
-                    self.running = False
-                elif event.type == KEYDOWN:
-                    if event.key == K_r:
-                        self.reset_game()  # Reset the game state
-                        self.run()
-                    elif event.key == K_q:
-                        waiting = False
-                        self.running = False
-        self.save_highest_height()
-        pygame.quit()
-        sys.exit()
+        """Block until the player restarts or quits the game.
+
+        Returns:
+            str: RESTARTING for R, QUITTING for Q or a closed window
+        """
+        while True:
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                return QUITTING
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    return RESTARTING
+                if event.key == pygame.K_q:
+                    return QUITTING
 
     def reset_game(self):
-        """Reset the game state to start a new game."""
+        """Start a new session in place (RESTARTING -> PLAYING).
+
+        The balloon, managers and time scale are reset instead of replaced:
+        entities go back to the managers' pools, so nothing of the previous
+        session stays reachable and later sessions allocate nothing new.
+        """
         self.current_height = 0
-        self.balloon = Balloon()
-        self.obstacle_manager = ObstacleManager()
-        self.powerup_manager = PowerUpManager()
-        self.collision_manager = CollisionManager(self.balloon, self.obstacle_manager, self.powerup_manager)
-        self.running = True
+        self.previous_height = 0
+        self.time_scale.reset()  # effects, shield and spawn timers; the managers re-arm their spawners
+        self.balloon.reset()
+        self.obstacle_manager.reset()
+        self.powerup_manager.reset()
+        self.collision_manager.reset()
+        self.state = PLAYING
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.invalidate()  # the game over screen covered everything
+
+    def close(self):
+        """Release the telemetry log, render thread and spectator server; safe to call twice.
+
+        run() does this on quit. Code that builds a GameLoop without calling
+        run() (benchmarks, tools) must close it so no writer thread is left behind.
+        """
+        self.close_telemetry()
+        if self.pipeline is not None:
+            self.pipeline.close()
+            self.pipeline = None
+        if self.spectator_server is not None:
+            self.spectator_server.close()
+            self.spectator_server = None
+
+    def shutdown(self):
+        """Persist the high score, close the game and the window."""
+        self.save_highest_height()
+        self.close()
+        pygame.quit()
+
+def replay_session(path):
+    """Replay a recording headless and verify it reproduces the recorded session.
+
+    Args:
+        path (str): Recording file
+
+    Returns:
+        tuple: (matches, game) where matches is True if the final height and state hash agree
+    """
+    recording = Recording.load(path)
+    game = GameLoop(headless=True, settings=GameSettings.derive(**recording.overrides), seed=recording.seed)
+    game.run_replay(recording)
+    matches = (game.current_height == recording.final_height and
+               state_hash(game) == recording.final_hash)
+    return matches, game
+
+
+def startup_timing():
+    """Measure the cost of importing the game and of constructing a GameLoop.
+
+    Module import is timed in a fresh interpreter with ``-X importtime``, as a
+    tool or worker process would pay it.
+
+    Returns:
+        list[tuple]: (label, milliseconds) rows in startup order
+    """
+    import subprocess
+
+    rows = []
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import balloon_game"],
+                            cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    rows.append(("interpreter + import", (time.perf_counter() - started) * 1000))
+    imports = []
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        # "import time: self [us] | cumulative | imported package"; direct imports are indented by three
+        if len(fields) == 3 and fields[2].startswith("   ") and not fields[2].startswith("    "):
+            imports.append((int(fields[1]) / 1000, fields[2].strip()))
+        elif len(fields) == 3 and fields[2].strip() == "balloon_game":
+            rows.append(("import balloon_game", int(fields[1]) / 1000))
+    for cumulative, name in sorted(imports, reverse=True)[:5]:
+        rows.append(("  import " + name, cumulative))
+
+    settings = GameSettings.derive(TELEMETRY_ENABLED=False)
+    for headless in (False, True):  # the headless game finds the sprites already decoded
+        started = time.perf_counter()
+        game = GameLoop(headless=headless, settings=settings, seed=0)
+        label = "GameLoop(headless, warm)" if headless else "GameLoop(window)"
+        rows.append((label, (time.perf_counter() - started) * 1000))
+        game.close()
+        for phase, seconds in game.startup_times.items():
+            rows.append(("  " + phase, seconds * 1000))
+    pygame.quit()
+    return rows
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Hot air balloon game")
+    parser.add_argument("--seed", type=int, help="seed of the session random generator")
+    parser.add_argument("--record", metavar="PATH", help="record the first session for replay")
+    parser.add_argument("--replay", metavar="PATH", help="replay and verify a recording without a display")
+    parser.add_argument("--host-spectators", metavar="PORT", type=int, nargs="?", const=GameSettings.SPECTATOR_PORT,
+                        help="stream the game to spectators on a local TCP port")
+    parser.add_argument("--watch", metavar="HOST:PORT", help="spectate a hosted game instead of playing")
+    parser.add_argument("--startup-timing", action="store_true", help="report import and startup times and exit")
+    args = parser.parse_args(argv)
+
+    if args.startup_timing:
+        for label, milliseconds in startup_timing():
+            print("{:<32}{:>9.1f} ms".format(label, milliseconds))
+        return
+
+    if args.watch:
+        host, _, port = args.watch.rpartition(":")
+        run_viewer(host or "127.0.0.1", int(port))
+        return
+
+    if args.replay:
+        matches, game = replay_session(args.replay)
+        print("Replayed to {}m: {}".format(int(game.current_height / 10), "OK" if matches else "MISMATCH"))
+        sys.exit(0 if matches else 1)
+
+    game = GameLoop(seed=args.seed)
+    if args.record:
+        game.start_recording(args.record)
+    if args.host_spectators is not None:
+        print("Spectators can watch on {}:{}".format(*game.host_spectators(port=args.host_spectators)))
+    game.run()
 
 if __name__ == "__main__":
-    game = GameLoop()
-    game.run()
\ No newline at end of file
+    main()
\ No newline at end of file
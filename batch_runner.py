@@ -0,0 +1,212 @@
+"""Run many seeded headless game sessions in parallel across all CPU cores.
+
+Example:
+    python batch_runner.py --sessions 10000 --set OBSTACLE_SPAWN_INTERVAL=1500 \
+        --sweep FUEL_CONSUMPTION_RATE=1,2 --output results.jsonl
+"""
+import argparse
+import ast
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+# ------------------------------
+# Input Policies
+# ------------------------------
+def sweep_policy(frame, game):
+    """Drift left and right in two second sweeps."""
+    period = 2 * game.settings.TICK_RATE
+    return frame % (2 * period) < period, frame % (2 * period) >= period
+
+
+def dodge_policy(frame, game):
+    """Steer away from the closest obstacle above the balloon that shares its columns."""
+    balloon = game.balloon
+    threat = None
+    for obstacle in game.obstacle_manager.obstacles:
+        if (obstacle.y + obstacle.height <= balloon.y + balloon.height and
+                obstacle.x < balloon.x + balloon.width and obstacle.x + obstacle.width > balloon.x):
+            if threat is None or obstacle.y > threat.y:
+                threat = obstacle
+    if threat is None:
+        return False, False
+    go_left = threat.x + threat.width / 2 > balloon.x + balloon.width / 2
+    return go_left, not go_left
+
+
+# Policies are referenced by name so jobs stay picklable
+POLICIES = {
+    "idle": None,
+    "sweep": sweep_policy,
+    "dodge": dodge_policy,
+}
+
+# ------------------------------
+# Sessions
+# ------------------------------
+def make_jobs(sessions, base_seed=0, variants=({},), max_seconds=600, policy="dodge"):
+    """Build the job list: every settings variant is run with the same seeds.
+
+    Args:
+        sessions (int): Seeded sessions per variant
+        base_seed (int): Seed of the first session
+        variants (sequence[dict]): Settings overrides, one dict per variant
+        max_seconds (float): Simulated time limit per session
+        policy (str): Name of the input policy in POLICIES
+
+    Returns:
+        list[dict]: Picklable job descriptions
+    """
+    if policy not in POLICIES:
+        raise ValueError("Unknown policy: {}".format(policy))
+    jobs = []
+    for variant, overrides in enumerate(variants):
+        for i in range(sessions):
+            jobs.append({
+                "session": len(jobs),
+                "variant": variant,
+                "seed": base_seed + i,
+                "overrides": dict(overrides),
+                "max_seconds": max_seconds,
+                "policy": policy,
+            })
+    return jobs
+
+
+def run_session(job):
+    """Run one headless session in the current process.
+
+    Args:
+        job (dict): Job description produced by make_jobs
+
+    Returns:
+        dict: The job fields plus height (m), time_of_death (s), cause and frames
+    """
+    from balloon_game import GameLoop
+    from core.recording import quantize_dt
+    from core.settings import GameSettings
+
+    settings = GameSettings.derive(**job["overrides"])  # session-local copy, GameSettings stays untouched
+    game = GameLoop(headless=True, settings=settings, seed=job["seed"])
+    dt = quantize_dt(1.0 / settings.TICK_RATE)  # the tick of live play, independent of the render FPS
+    frames = game.run_headless(int(job["max_seconds"] * settings.TICK_RATE), dt, POLICIES[job["policy"]])
+
+    result = dict(job)
+    result.update({
+        "height": game.current_height / 10,
+        "time_of_death": frames * dt,
+        "cause": game.balloon.crash_cause or "timeout",
+        "frames": frames,
+    })
+    return result
+
+
+def _quiet_worker():
+    """Silence the per-event prints of the game objects inside worker processes."""
+    sys.stdout = open(os.devnull, "w")
+
+
+def run_batch(jobs, workers=None, chunksize=16):
+    """Run jobs across a process pool and yield results as sessions finish.
+
+    Args:
+        jobs (list[dict]): Jobs from make_jobs
+        workers (int): Process count, defaults to all cores
+        chunksize (int): Jobs handed to a worker at a time
+
+    Yields:
+        dict: Session results in completion order
+    """
+    # Import the game and decode the sprites once here: forked workers inherit
+    # both and start without touching the disk
+    import balloon_game  # noqa: F401
+    from core.assets import assets, GAME_IMAGES
+    assets.preload(GAME_IMAGES)
+
+    with multiprocessing.Pool(workers, initializer=_quiet_worker) as pool:
+        for result in pool.imap_unordered(run_session, jobs, chunksize):
+            yield result
+
+
+# ------------------------------
+# Command Line
+# ------------------------------
+def _parse_assignment(text):
+    name, _, value = text.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError("expected NAME=VALUE, got {!r}".format(text))
+    return name, value
+
+
+def _literal(value):
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+def build_variants(fixed, sweeps):
+    """Combine fixed overrides with the cartesian product of swept values.
+
+    Args:
+        fixed (list[tuple]): (name, value) pairs applied to every variant
+        sweeps (list[tuple]): (name, "v1,v2,...") pairs
+
+    Returns:
+        list[dict]: One overrides dict per variant
+    """
+    variants = [{name: _literal(value) for name, value in fixed}]
+    for name, values in sweeps:
+        variants = [dict(v, **{name: _literal(value)}) for v in variants for value in values.split(",")]
+    return variants
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100, help="seeded sessions per variant")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first session")
+    parser.add_argument("--max-seconds", type=float, default=600, help="simulated time limit per session")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="dodge")
+    parser.add_argument("--set", dest="fixed", type=_parse_assignment, action="append", default=[],
+                        metavar="NAME=VALUE", help="settings override for every session")
+    parser.add_argument("--sweep", type=_parse_assignment, action="append", default=[],
+                        metavar="NAME=V1,V2", help="run one variant per listed value")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--output", help="write one JSON result per line to this file")
+    args = parser.parse_args(argv)
+
+    variants = build_variants(args.fixed, args.sweep)
+    from core.settings import GameSettings
+    for overrides in variants:
+        GameSettings.derive(**overrides)  # fail fast on unknown setting names
+    jobs = make_jobs(args.sessions, args.seed, variants, args.max_seconds, args.policy)
+
+    output = open(args.output, "w") if args.output else None
+    totals = [[0, 0.0] for _ in variants]
+    start = time.perf_counter()
+    try:
+        for done, result in enumerate(run_batch(jobs, args.workers), 1):
+            totals[result["variant"]][0] += 1
+            totals[result["variant"]][1] += result["height"]
+            line = json.dumps(result)
+            if output:
+                output.write(line + "\n")
+                if done % 100 == 0:
+                    print("{}/{} sessions".format(done, len(jobs)), file=sys.stderr)
+            else:
+                print(line)
+    finally:
+        if output:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print("{} sessions in {:.1f}s".format(len(jobs), elapsed), file=sys.stderr)
+    for overrides, (count, height) in zip(variants, totals):
+        print("{}: mean height {:.1f}m over {} sessions".format(overrides or "defaults", height / max(count, 1), count),
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
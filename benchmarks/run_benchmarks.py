@@ -0,0 +1,250 @@
+"""Benchmark obstacle/power-up update, collision and draw cost at scaled entity counts.
+
+Runs headless with the SDL dummy video driver, writes machine-readable JSON and
+optionally compares it with a stored baseline.
+
+Example:
+    python benchmarks/run_benchmarks.py --output bench.json --baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import platform
+import random
+import time
+
+import pygame
+
+from balloon_game import GameLoop
+from core.settings import GameSettings
+from objects.obstacle import Bird, Cloud
+from objects.power_up import FuelPowerUp, ShieldPowerUp, SlowdownPowerUp
+from benchmarks.spatial_hash import SpatialHash
+
+COUNTS = (10, 100, 1000, 10000)
+MAX_PAIR_COUNT = 1000  # the linear all-pairs scan is quadratic
+PAIR_CELL_SIZE = 100  # SpatialHash cell size in pixels, about two obstacle widths
+STEP_DT = 1e-4  # tiny step so entities stay on screen across repeats
+
+# Spawning is disabled so every repeat measures the same population; no telemetry logs are written
+BENCH_SETTINGS = GameSettings.derive(OBSTACLE_SPAWN_INTERVAL=float("inf"),
+                                     POWERUP_SPAWN_INTERVAL=float("inf"),
+                                     TELEMETRY_ENABLED=False)
+
+
+def available_backends():
+    """Obstacle backends that can run in this environment."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return ("objects",)
+    return ("objects", "numpy")
+
+
+def populate(game, count, seed=0):
+    """Fill the game's managers with count obstacles and count power-ups spread over the screen.
+
+    Entities are kept above the balloon so collision checks never remove them
+    and every repeat sees the same population.
+
+    Args:
+        game (GameLoop): Game whose managers are filled
+        count (int): Entities per manager
+        seed (int): Seed for the positions
+    """
+    rng = random.Random(seed)
+    settings = game.settings
+    max_x = settings.SCREEN_WIDTH - 100
+    max_y = game.balloon.y - 100
+    obstacles = game.obstacle_manager
+    for _ in range(count):
+        x, y = rng.uniform(0, max_x), rng.uniform(0, max_y)
+        if hasattr(obstacles, "add_obstacle"):
+            obstacles.add_obstacle(rng.randint(0, 1), x, y)
+        else:
+            obstacles.obstacles.append(obstacles.pool.acquire(rng.choice((Bird, Cloud)), x, y, settings))
+    powerups = game.powerup_manager
+    for _ in range(count):
+        powerup_type = rng.choice((FuelPowerUp, ShieldPowerUp, SlowdownPowerUp))
+        powerups.powerups.append(powerups.pool.acquire(powerup_type, rng.uniform(0, max_x),
+                                                       rng.uniform(0, max_y), settings))
+
+
+def grid_pairs(entities, cell_size):
+    """Return the colliding entity pairs using a SpatialHash broad phase.
+
+    Args:
+        entities (list[Entity]): Entities to check against each other
+        cell_size (int): Grid cell size in pixels
+
+    Returns:
+        list[tuple]: Overlapping (a, b) pairs
+    """
+    grid = SpatialHash(cell_size)
+    grid.rebuild(entities)
+    return [(a, b) for a, b in grid.candidate_pairs() if a.collides_with(b)]
+
+
+def linear_pairs(entities):
+    """Return the colliding entity pairs by testing every pair.
+
+    Args:
+        entities (list[Entity]): Entities to check against each other
+
+    Returns:
+        list[tuple]: Overlapping (a, b) pairs
+    """
+    return [(a, b) for i, a in enumerate(entities) for b in entities[i + 1:] if a.collides_with(b)]
+
+
+def measure(function, min_time=0.2, repeats=5):
+    """Return the median milliseconds per call of function.
+
+    Args:
+        function (callable): Code under test
+        min_time (float): Seconds each repeat should run at least
+        repeats (int): Number of timed repeats
+
+    Returns:
+        float: Median milliseconds per call
+    """
+    start = time.perf_counter()
+    function()
+    single = max(time.perf_counter() - start, 1e-7)
+    calls = max(1, int(min_time / repeats / single))
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        samples.append((time.perf_counter() - start) * 1000 / calls)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def run_suite(counts=COUNTS, backends=None, min_time=0.2):
+    """Time update, collision and draw for every backend and entity count.
+
+    Args:
+        counts (sequence[int]): Entities per manager
+        backends (sequence[str]): Obstacle backends, defaults to all available
+        min_time (float): Seconds spent per measurement
+
+    Returns:
+        dict: Benchmark name -> milliseconds per call
+    """
+    results = {}
+    for backend in backends or available_backends():
+        settings = BENCH_SETTINGS.derive(OBSTACLE_BACKEND=backend)
+        for count in counts:
+            game = GameLoop(settings=settings, seed=0)
+            populate(game, count)
+            screen = game.screen
+
+            def update():
+                game.obstacle_manager.update(STEP_DT)
+                game.powerup_manager.update(STEP_DT)
+
+            def draw():
+                game.obstacle_manager.draw(screen)
+                game.powerup_manager.draw(screen)
+
+            name = "{}/{}".format(backend, count)
+            results["update/" + name] = measure(update, min_time)
+            results["collision/" + name] = measure(game.collision_manager.check_collisions, min_time)
+            results["draw/" + name] = measure(draw, min_time)
+            print("{:<10} update {:9.4f} ms  collision {:9.4f} ms  draw {:9.4f} ms".format(
+                name, results["update/" + name], results["collision/" + name], results["draw/" + name]),
+                file=sys.stderr)
+            game.close()
+
+            # obstacle-versus-obstacle: the broad phase the spatial hash is for
+            if backend != "objects" or count > MAX_PAIR_COUNT:
+                continue
+            obstacles = game.obstacle_manager.obstacles
+            cell_size = PAIR_CELL_SIZE
+            if len(grid_pairs(obstacles, cell_size)) != len(linear_pairs(obstacles)):
+                raise AssertionError("broad phase missed pairs at {} obstacles".format(count))
+            results["pairs-grid/" + name] = measure(lambda: grid_pairs(obstacles, cell_size), min_time)
+            results["pairs-linear/" + name] = measure(lambda: linear_pairs(obstacles), min_time)
+            print("{:<10} pairs grid {:9.4f} ms  pairs linear {:9.4f} ms".format(
+                name, results["pairs-grid/" + name], results["pairs-linear/" + name]), file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the benchmarks that got slower than baseline by more than threshold.
+
+    Args:
+        results (dict): Current name -> ms
+        baseline (dict): Baseline name -> ms
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%
+
+    Returns:
+        list[tuple]: (name, baseline ms, current ms, ratio) per regression
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous and current > previous * (1 + threshold):
+            regressions.append((name, previous, current, current / previous))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=list(COUNTS))
+    parser.add_argument("--backend", action="append", choices=("objects", "numpy"),
+                        help="obstacle backend to benchmark (default: all available)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per measurement")
+    parser.add_argument("--output", help="write results JSON to this file (default: stdout)")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown")
+    parser.add_argument("--save-baseline", metavar="PATH", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.counts, args.backend, args.min_time)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        },
+        "results": results,
+    }
+    pygame.quit()
+
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            file.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, previous, current, ratio in regressions:
+            print("REGRESSION {}: {:.4f} ms -> {:.4f} ms ({:.0%} slower)".format(
+                name, previous, current, ratio - 1), file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions above {:.0%}".format(args.threshold), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
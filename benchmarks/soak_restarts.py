@@ -0,0 +1,196 @@
+"""Soak test: restart the game many times and check that memory and stack depth stay flat.
+
+Drives the real GameLoop.run() state machine with the SDL dummy video driver.
+A small screen and short spawn intervals make every session spawn obstacles
+and power-ups that reach the balloon, so sessions collect shields, fuel and
+slowdowns, absorb or crash into obstacles and release entities to the pools;
+a session that survives is crashed after a fixed number of ticks. The frame
+clock reports a fixed frame time instead of waiting for it, and a timer keeps
+posting the R key so the game over screen restarts at once. Every restart
+samples the stack depth and, at checkpoints, the memory traced by tracemalloc
+and the entities the managers ever allocated. The test fails if the stack
+depth changes, memory grows past a threshold after the first checkpoint or
+the allocations exceed what a single session can spawn.
+
+Example:
+    python benchmarks/soak_restarts.py --restarts 100000
+"""
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import contextlib
+import gc
+import math
+import time
+import tracemalloc
+
+import pygame
+
+from balloon_game import GameLoop
+from core.settings import GameSettings
+
+TICK_RATE = 30              # coarser ticks keep the simulation cheap per game second
+SESSION_TICKS = 90          # ticks before a surviving session is crashed (3 s of game time)
+TICKS_PER_FRAME = 10        # simulated ticks between two rendered frames
+SPAWN_INTERVAL = 100        # milliseconds between obstacle spawns
+POWERUP_SPAWN_INTERVAL = 120
+OBSTACLE_SPEED = 100        # pixels per second, slow enough for power-ups to arrive first
+OBSTACLE_KINDS = 2          # Bird, Cloud
+POWERUP_KINDS = 3           # fuel, shield, slowdown
+
+
+class SteppedClock:
+    """Stands in for pygame.time.Clock: every frame takes a fixed time, without waiting."""
+
+    def __init__(self, frame_ms):
+        self.frame_ms = frame_ms
+
+    def tick(self, framerate=0):
+        return self.frame_ms
+
+
+def stack_depth():
+    """Return the number of frames on the calling thread's stack."""
+    depth = 0
+    frame = sys._getframe(1)
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def allocated(manager):
+    """Return how many entities a manager ever allocated: pool instances or array rows."""
+    pool = getattr(manager, "pool", None)
+    return pool.created if pool is not None else len(manager.x)
+
+
+def soak(restarts, checkpoints, backend):
+    """Run restarts sessions through GameLoop.run() and sample stack depth, memory and allocations.
+
+    Args:
+        restarts (int): Number of restarts before the game quits
+        checkpoints (int): Number of samples taken along the way
+        backend (str): Obstacle backend, "objects" or "numpy"
+
+    Returns:
+        tuple: (depths, samples, stats) with the set of stack depths seen by
+            the restart hook, (restart, traced bytes, live objects, allocated
+            entities) rows and counts of what the sessions went through
+    """
+    settings = GameSettings.derive(SCREEN_WIDTH=400, SCREEN_HEIGHT=400, PARALLAX_ENABLED=False,
+                                   TICK_RATE=TICK_RATE, MAX_CATCH_UP_STEPS=TICKS_PER_FRAME,
+                                   OBSTACLE_SPEED=OBSTACLE_SPEED, OBSTACLE_SPAWN_INTERVAL=SPAWN_INTERVAL,
+                                   POWERUP_SPAWN_INTERVAL=POWERUP_SPAWN_INTERVAL, OBSTACLE_BACKEND=backend,
+                                   TELEMETRY_ENABLED=False, TELEMETRY_DIR=tempfile.mkdtemp(prefix="soak-"))
+    game = GameLoop(settings=settings, seed=0)
+    game.clock = SteppedClock(TICKS_PER_FRAME * 1000.0 / settings.TICK_RATE)
+    every = max(1, restarts // checkpoints)
+    depths = set()
+    samples = []
+    stats = {"collision": 0, "timeout": 0, "shield": 0, "slowdown": 0, "released": 0}
+    effects = set()  # timed effects seen during the current session
+    step, reset_game = game.step, game.reset_game
+
+    def session_step(left, right, dt):
+        session_step.ticks += 1
+        if session_step.ticks == SESSION_TICKS:
+            game.balloon.crash("timeout")
+        step(left, right, dt)
+        if game.balloon.shield_active:
+            effects.add("shield")
+        if game.balloon.slowdown_active:
+            effects.add("slowdown")
+
+    def restart():
+        stats[game.balloon.crash_cause] = stats.get(game.balloon.crash_cause, 0) + 1
+        for effect in effects:
+            stats[effect] += 1
+        effects.clear()
+        stats["released"] += len(game.obstacle_manager.obstacles) + len(game.powerup_manager.powerups)
+        reset_game()
+        session_step.ticks = 0
+        restart.count += 1
+        depths.add(stack_depth())
+        if restart.count % every == 0 or restart.count == restarts:
+            gc.collect()
+            samples.append((restart.count, tracemalloc.get_traced_memory()[0], len(gc.get_objects()),
+                            allocated(game.obstacle_manager) + allocated(game.powerup_manager)))
+        if restart.count == restarts:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    session_step.ticks = 0
+    restart.count = 0
+    game.step = session_step
+    game.reset_game = restart
+    pygame.time.set_timer(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r), 1)
+    tracemalloc.start()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):  # "Game Over!" per session
+        game.run()
+    tracemalloc.stop()
+    return depths, samples, stats
+
+
+def allocation_bound(tick_rate=TICK_RATE):
+    """Return the most entities the managers may allocate: every kind filled with one session's spawns.
+
+    Entities only outlive a session in the pools' free lists, so no kind ever
+    needs more instances than a single session can spawn.
+
+    Args:
+        tick_rate (int): Simulation ticks per second
+
+    Returns:
+        int: Upper bound on allocated entities
+    """
+    session_ms = SESSION_TICKS * 1000.0 / tick_rate
+    return (OBSTACLE_KINDS * (math.floor(session_ms / SPAWN_INTERVAL) + 1) +
+            POWERUP_KINDS * (math.floor(session_ms / POWERUP_SPAWN_INTERVAL) + 1))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--restarts", type=int, default=100000)
+    parser.add_argument("--checkpoints", type=int, default=10, help="samples along the run")
+    parser.add_argument("--backend", choices=("objects", "numpy"), default="objects")
+    parser.add_argument("--max-growth-kb", type=float, default=256.0,
+                        help="allowed traced memory growth after the first checkpoint")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    depths, samples, stats = soak(args.restarts, args.checkpoints, args.backend)
+    elapsed = time.perf_counter() - started
+
+    print("{:>10} {:>14} {:>12} {:>10}".format("restart", "traced KiB", "objects", "allocated"))
+    for count, traced, objects, entities in samples:
+        print("{:>10} {:>14.1f} {:>12} {:>10}".format(count, traced / 1024, objects, entities))
+    growth = (samples[-1][1] - samples[0][1]) / 1024
+    print("{} restarts in {:.1f} s, stack depth {}, memory growth {:+.1f} KiB".format(
+        samples[-1][0], elapsed, "/".join(str(depth) for depth in sorted(depths)), growth))
+    print("sessions ended by collision {collision}, by timeout {timeout}; sessions with a shield {shield}, "
+          "with a slowdown {slowdown}; {released} entities released on restart".format(**stats))
+
+    failures = []
+    if samples[-1][0] != args.restarts:
+        failures.append("only {} of {} restarts ran".format(samples[-1][0], args.restarts))
+    if len(depths) != 1:
+        failures.append("stack depth changed between restarts")
+    if growth > args.max_growth_kb:
+        failures.append("memory grew by {:.1f} KiB".format(growth))
+    if samples[-1][3] > allocation_bound():
+        failures.append("managers allocated {} entities, more than the {} one session can spawn".format(
+            samples[-1][3], allocation_bound()))
+    for failure in failures:
+        print("FAIL " + failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# ---------------------------
+# Uniform Grid Broad Phase
+# ---------------------------
+class SpatialHash:
+    """Uniform-grid spatial hash bucketing entities by the cells their AABB covers.
+
+    A broad phase for many-versus-many checks such as obstacle-versus-obstacle:
+    candidate_pairs() hands only entities sharing a cell to the exact
+    Entity.collides_with check instead of all n * (n - 1) / 2 pairs. The game
+    has no such check, so only run_benchmarks.py uses the grid. The balloon,
+    a single rectangle against each list, is cheaper as a linear scan than a
+    grid rebuilt every tick, see CollisionManager.
+    """
+
+    def __init__(self, cell_size):
+        """Initialize an empty grid.
+
+        Args:
+            cell_size (int): Cell edge length in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entities = []
+
+    def clear(self):
+        """Remove all entities from the grid."""
+        self.cells.clear()
+        self.entities.clear()
+
+    def rebuild(self, entities):
+        """Clear the grid and insert all given entities.
+
+        Args:
+            entities (iterable): Entities with x, y, width and height
+        """
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def _cell_range(self, x, y, width, height):
+        size = self.cell_size
+        return (int(x // size), int((x + width) // size),
+                int(y // size), int((y + height) // size))
+
+    def insert(self, entity):
+        """Add an entity to every cell its bounding box touches.
+
+        Args:
+            entity (Entity): Entity to insert
+        """
+        index = len(self.entities)
+        self.entities.append(entity)
+        cells = self.cells
+        x0, x1, y0, y1 = self._cell_range(entity.x, entity.y, entity.width, entity.height)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [index]
+                else:
+                    bucket.append(index)
+
+    def candidate_pairs(self):
+        """Return index-ordered pairs of entities that may overlap.
+
+        Within each cell the boxes are swept in x order, so a box is only
+        compared with the boxes starting before its right edge. A pair is
+        reported only from the cell holding the top-left corner of the two
+        boxes' intersection: overlapping entities both cover that cell, so
+        each pair comes out exactly once without a set of seen pairs.
+
+        Returns:
+            list[tuple]: Unique (a, b) entity pairs for a narrow-phase check
+        """
+        size = self.cell_size
+        entities = self.entities
+        pairs = []
+        for (cx, cy), bucket in self.cells.items():
+            count = len(bucket)
+            if count < 2:
+                continue
+            boxes = []
+            for i in bucket:
+                entity = entities[i]
+                boxes.append((entity.x, entity.y, entity.x + entity.width, i))
+            boxes.sort()
+            for n in range(count - 1):
+                ax, ay, right, i = boxes[n]
+                for k in range(n + 1, count):
+                    bx, by, _, j = boxes[k]
+                    if bx >= right:
+                        break  # this and every later box start right of a
+                    if int(bx // size) == cx and int((ay if ay > by else by) // size) == cy:
+                        pairs.append((i, j) if i < j else (j, i))
+        pairs.sort()
+        return [(entities[a], entities[b]) for a, b in pairs]
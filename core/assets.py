@@ -0,0 +1,231 @@
+import os
+import threading
+import time
+import pygame
+
+# Project root, so assets resolve independently of the working directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ---------------------------
+# Asset Manager
+# ---------------------------
+class AssetStats:
+    """Counters describing asset loading and blit cost.
+
+    Attributes:
+        loads (int): Images decoded from disk
+        cache_hits (int): Lookups served from the cache
+        load_time (float): Seconds spent decoding images
+        convert_time (float): Seconds spent converting images to the display format
+        atlas_time (float): Seconds spent packing the sprite atlas
+        mask_time (float): Seconds spent building collision masks
+    """
+
+    def __init__(self):
+        self.loads = 0
+        self.cache_hits = 0
+        self.load_time = 0.0
+        self.convert_time = 0.0
+        self.atlas_time = 0.0
+        self.mask_time = 0.0
+
+    def as_dict(self):
+        """Return the counters as a plain dictionary."""
+        return dict(vars(self))
+
+
+class AssetManager:
+    """Loads every image once, converts it to the display format and optionally packs a sprite atlas.
+
+    Images are decoded lazily on first request. Once a display exists, convert()
+    turns all cached images into display-format surfaces so blits skip the
+    per-call pixel-format conversion; images requested afterwards are converted
+    on load. A collision mask is built from each image's alpha channel when it
+    is loaded. Creating the manager touches no files, and start_preload() can
+    decode images on a background thread while the window is being created.
+    """
+    ATLAS_MAX_WIDTH = 1024
+    ATLAS_PADDING = 1
+
+    def __init__(self, directory):
+        """Initialize an empty asset cache.
+
+        Args:
+            directory (str): Directory containing the image files
+        """
+        self.directory = directory
+        self.images = {}
+        self.converted = False
+        self.atlas = None
+        self.atlas_rects = {}
+        self.masks = {}  # name or (name, size) -> pygame.mask.Mask
+        self.stats = AssetStats()
+        self.lock = threading.Lock()  # serializes loads with the preload thread
+        self.preload_thread = None
+
+    def get(self, name):
+        """Return the cached image, loading it on first use.
+
+        Args:
+            name (str): Image file name inside the asset directory
+
+        Returns:
+            pygame.Surface: Image surface
+        """
+        image = self.images.get(name)
+        if image is not None:
+            self.stats.cache_hits += 1
+            return image
+        with self.lock:
+            image = self.images.get(name)
+            if image is not None:  # loaded by the preload thread meanwhile
+                return image
+            start = time.perf_counter()
+            image = pygame.image.load(os.path.join(self.directory, name))
+            self.stats.load_time += time.perf_counter() - start
+            self.stats.loads += 1
+            start = time.perf_counter()
+            self.masks[name] = pygame.mask.from_surface(image)
+            self.stats.mask_time += time.perf_counter() - start
+            if self.converted:
+                image = self._convert(image)
+            self.images[name] = image
+        return image
+
+    def mask(self, name, size=None):
+        """Return the cached collision mask of an image.
+
+        Args:
+            name (str): Image file name inside the asset directory
+            size (tuple): Hitbox (width, height); opaque pixels outside it are dropped
+                so the mask only ever refines the entity's AABB
+
+        Returns:
+            pygame.mask.Mask: Mask of the opaque pixels
+        """
+        if name not in self.masks:
+            self.get(name)
+        mask = self.masks[name]
+        if size is None or tuple(size) == mask.get_size():
+            return mask
+        key = (name, tuple(size))
+        cropped = self.masks.get(key)
+        if cropped is None:
+            cropped = pygame.mask.Mask(key[1])
+            cropped.draw(mask, (0, 0))
+            self.masks[key] = cropped
+        return cropped
+
+    def preload(self, names):
+        """Load a set of images up front so the first spawn does not stall.
+
+        Args:
+            names (iterable[str]): Image file names
+        """
+        for name in names:
+            self.get(name)
+
+    def start_preload(self, names):
+        """Decode images on a background thread; pygame releases the GIL while decoding.
+
+        Call wait_preload() before convert() so no image is converted twice.
+
+        Args:
+            names (iterable[str]): Image file names
+        """
+        self.preload_thread = threading.Thread(target=self.preload, args=(tuple(names),),
+                                               name="asset-preload", daemon=True)
+        self.preload_thread.start()
+
+    def wait_preload(self):
+        """Wait for the preload thread started by start_preload(), if any.
+
+        A file that failed to load in the background is loaded again, raising
+        its error, on the next get().
+        """
+        if self.preload_thread is not None:
+            self.preload_thread.join()
+            self.preload_thread = None
+
+    def _convert(self, image):
+        start = time.perf_counter()
+        image = image.convert_alpha()
+        self.stats.convert_time += time.perf_counter() - start
+        return image
+
+    def convert(self):
+        """Convert all cached images to the display pixel format.
+
+        Must be called after pygame.display.set_mode(); does nothing without a display.
+        """
+        if pygame.display.get_surface() is None:
+            return
+        for name, image in self.images.items():
+            self.images[name] = self._convert(image)
+        self.converted = True
+
+    def build_atlas(self):
+        """Pack all cached images into one surface and serve them as subsurfaces.
+
+        Uses simple shelf packing ordered by height. Entities created afterwards
+        blit from the shared atlas surface.
+
+        Returns:
+            pygame.Surface: The atlas surface
+        """
+        start = time.perf_counter()
+        padding = self.ATLAS_PADDING
+        names = sorted(self.images, key=lambda n: self.images[n].get_height(), reverse=True)
+
+        rects = {}
+        shelf_x = shelf_y = shelf_height = atlas_width = 0
+        for name in names:
+            width, height = self.images[name].get_size()
+            if shelf_x and shelf_x + width > self.ATLAS_MAX_WIDTH:
+                shelf_y += shelf_height + padding
+                shelf_x = shelf_height = 0
+            rects[name] = pygame.Rect(shelf_x, shelf_y, width, height)
+            shelf_x += width + padding
+            shelf_height = max(shelf_height, height)
+            atlas_width = max(atlas_width, shelf_x)
+        atlas_height = shelf_y + shelf_height
+
+        atlas = pygame.Surface((max(atlas_width, 1), max(atlas_height, 1)), pygame.SRCALPHA)
+        if self.converted:
+            atlas = atlas.convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        for name, rect in rects.items():
+            # Adding onto a fully transparent atlas copies the pixels exactly
+            atlas.blit(self.images[name], rect, special_flags=pygame.BLEND_RGBA_ADD)
+        for name, rect in rects.items():
+            self.images[name] = atlas.subsurface(rect)
+
+        self.atlas = atlas
+        self.atlas_rects = rects
+        self.stats.atlas_time += time.perf_counter() - start
+        return atlas
+
+    def measure_blit_cost(self, surface, iterations=1000):
+        """Time blitting each cached image onto a surface.
+
+        Args:
+            surface (pygame.Surface): Destination surface, usually the display
+            iterations (int): Blits per image
+
+        Returns:
+            dict: Image name -> microseconds per blit
+        """
+        costs = {}
+        for name, image in self.images.items():
+            start = time.perf_counter()
+            for _ in range(iterations):
+                surface.blit(image, (0, 0))
+            costs[name] = (time.perf_counter() - start) * 1e6 / iterations
+        return costs
+
+
+# Image files used by the game objects
+GAME_IMAGES = ("balloon.png", "balloon-shield.png", "bird.png", "cloud.png",
+               "fuel.png", "shield.png", "slowdown.png")
+
+assets = AssetManager(os.path.join(ROOT_DIR, "assets"))
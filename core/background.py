@@ -0,0 +1,212 @@
+import random
+import threading
+
+import pygame
+
+from core.settings import GameSettings
+
+
+def _lerp_color(a, b, t):
+    return tuple(int(round(x + (y - x) * t)) for x, y in zip(a, b))
+
+
+# ---------------------------
+# Parallax Background
+# ---------------------------
+class ParallaxBackground:
+    """Pre-rendered sky gradient and scrolling scenery layers.
+
+    The sky of each altitude band and one wrap-around tile per scenery layer
+    are rendered once and reused until the band changes. Every frame costs
+    one sky blit plus two blits per layer, however detailed the layers are.
+    While the player climbs through a band, a background thread renders the
+    pixels of the next one, so crossing the boundary only converts the ready
+    surfaces instead of stalling the frame. Layers scroll with the climbed
+    height times their parallax factor, so nearer layers move faster.
+    """
+    COLORKEY = (255, 0, 255)
+
+    def __init__(self, settings=GameSettings):
+        """Initialize the background; surfaces are built lazily on the first draw.
+
+        Args:
+            settings (type): GameSettings class or a class derived from it
+        """
+        self.settings = settings
+        self.size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        self.factors = tuple(settings.PARALLAX_FACTORS)
+        self.band = None
+        self.sky_surface = None
+        self.tiles = ()
+        self.scaled = {}  # scale -> (sky, tiles) of the current band, for dynamic resolution
+        self.builds = 0  # number of band (re)builds, for profiling
+        self.prepared = None  # [band, thread, (sky, tiles) or None] rendered ahead of time
+
+    def band_at(self, height):
+        """Return the altitude band of a height.
+
+        Args:
+            height (float): Climbed height in pixels
+
+        Returns:
+            int: Band index, 0 at the ground
+        """
+        return int(height / 10 // self.settings.BACKGROUND_BAND_HEIGHT)
+
+    def _band_progress(self, band):
+        """How far a band is between the low and the high sky, from 0 to 1."""
+        return min(1.0, band / max(1, self.settings.SKY_BANDS - 1))
+
+    def _ensure_band(self, height):
+        band = self.band_at(height)
+        if band != self.band:
+            sky, tiles = self._take_prepared(band) or self._render_band(band, pygame.display.get_surface())
+            self.band = band
+            self.sky_surface = sky
+            self.tiles = tuple(self._finish_tile(tile, factor) for tile, factor in zip(tiles, self.factors))
+            self.scaled = {}
+            self.builds += 1
+        elif self.prepared is None:
+            self._prepare(band + 1)  # a frame after the crossing, which already paid for the new band
+
+    def sky(self, height):
+        """Return the static sky gradient of the band containing height.
+
+        Args:
+            height (float): Climbed height in pixels
+
+        Returns:
+            pygame.Surface: Screen-sized sky surface
+        """
+        self._ensure_band(height)
+        return self.sky_surface
+
+    def draw(self, surface, height, scale=1.0):
+        """Draw the sky and the scrolling layers.
+
+        Args:
+            surface (pygame.Surface): Target surface
+            height (float): Climbed height in pixels, drives the scroll offsets
+            scale (float): Resolution scale of the target, below 1 for a reduced internal surface
+        """
+        self._ensure_band(height)
+        if scale == 1.0:
+            sky, tiles = self.sky_surface, self.tiles
+        else:
+            sky, tiles = self._scaled_band(scale)
+        surface.blit(sky, (0, 0))
+        tile_height = sky.get_height()
+        for factor, tile in zip(self.factors, tiles):
+            offset = int(height * factor * scale) % tile_height
+            surface.blit(tile, (0, offset - tile_height))
+            surface.blit(tile, (0, offset))
+
+    # ---------------------------
+    # Pre-rendering
+    # ---------------------------
+    def _prepare(self, band):
+        """Start rendering a band's pixels on a background thread."""
+        prepared = [band, None, None]
+        display = pygame.display.get_surface()
+
+        def render():
+            prepared[2] = self._render_band(band, display)
+
+        prepared[1] = threading.Thread(target=render, name="background-prerender", daemon=True)
+        self.prepared = prepared
+        prepared[1].start()
+
+    def _take_prepared(self, band):
+        """Return the pixels rendered ahead for a band, None if another band was prepared."""
+        prepared, self.prepared = self.prepared, None
+        if prepared is None or prepared[0] != band:
+            return None
+        prepared[1].join()  # normally finished long ago; waiting still beats rendering again
+        return prepared[2]
+
+    def _render_band(self, band, display=None):
+        """Render the sky and the layer tiles of a band.
+
+        Makes no display calls, so it can run on any thread. The surfaces are
+        created in the display's pixel format, which spares the convert() a
+        blit-ready surface would otherwise need on the main thread.
+
+        Args:
+            band (int): Altitude band
+            display (pygame.Surface): Display surface whose format to use, None for the default format
+
+        Returns:
+            tuple: (sky, tiles) surfaces
+        """
+        return (self._render_sky(band, display),
+                tuple(self._render_tile(i, factor, band, display) for i, factor in enumerate(self.factors)))
+
+    def _finish_tile(self, tile, factor):
+        """Make a rendered tile transparent for its layer.
+
+        Tiles use a colorkey plus one alpha per layer with RLE acceleration,
+        so the blit skips the transparent runs instead of blending every pixel.
+        """
+        tile.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+        tile.set_alpha(int(255 * min(1.0, 0.35 + 0.5 * factor)), pygame.RLEACCEL)
+        return tile
+
+    def _scaled_band(self, scale):
+        """Return the current band's sky and tiles resized for a resolution scale."""
+        band = self.scaled.get(scale)
+        if band is None:
+            size = (max(1, round(self.size[0] * scale)), max(1, round(self.size[1] * scale)))
+            sky = pygame.transform.scale(self.sky_surface, size)
+            tiles = []
+            for tile in self.tiles:
+                source = tile.copy()  # plain pixels: scaling the RLE-encoded tile garbles its colors
+                source.set_colorkey(None)
+                source.set_alpha(None)
+                scaled = pygame.transform.scale(source, size)  # nearest neighbour keeps the colorkey exact
+                scaled.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+                scaled.set_alpha(tile.get_alpha(), pygame.RLEACCEL)
+                tiles.append(scaled)
+            band = self.scaled[scale] = (sky, tuple(tiles))
+        return band
+
+    @staticmethod
+    def _surface(size, display):
+        return pygame.Surface(size) if display is None else pygame.Surface(size, 0, display)
+
+    def _render_sky(self, band, display=None):
+        """Render the vertical sky gradient of a band by stretching a one pixel wide column."""
+        t = self._band_progress(band)
+        low_top, low_bottom = self.settings.SKY_GRADIENT_LOW
+        high_top, high_bottom = self.settings.SKY_GRADIENT_HIGH
+        top = _lerp_color(low_top, high_top, t)
+        bottom = _lerp_color(low_bottom, high_bottom, t)
+        height = self.size[1]
+        column = self._surface((1, height), display)
+        for y in range(height):
+            column.set_at((0, y), _lerp_color(top, bottom, y / (height - 1)))
+        return pygame.transform.scale(column, self.size)
+
+    def _render_tile(self, layer, factor, band, display=None):
+        """Render one vertically wrapping scenery tile: clouds thinning out and stars appearing with altitude."""
+        rng = random.Random(layer * 7919 + band)  # stable per layer and band, independent of the session
+        width, height = self.size
+        tile = self._surface(self.size, display)
+        tile.fill(self.COLORKEY)
+        t = self._band_progress(band)
+
+        # Haze clouds, larger on nearer layers
+        for _ in range(int(12 * (1 - t) + 2)):
+            w = int(rng.uniform(80, 240) * (0.5 + factor))
+            h = int(w * rng.uniform(0.25, 0.45))
+            x = rng.randrange(-w // 2, width)
+            y = rng.randrange(0, height)
+            shade = rng.randrange(215, 256)
+            for dy in (-height, 0, height):  # wrap so the tile edges match
+                pygame.draw.ellipse(tile, (shade, shade, shade), (x, y + dy, w, h))
+
+        # Stars on the farthest layer once the sky darkens
+        if layer == 0 and t > 0.3:
+            for _ in range(int(300 * t)):
+                shade = int(rng.uniform(160, 255))
+                tile.fill((shade, shade, shade), (rng.randrange(width), rng.randrange(height), 2, 2))
+        return tile
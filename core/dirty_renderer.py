@@ -0,0 +1,110 @@
+import pygame
+
+# ---------------------------
+# Dirty Rectangle Rendering
+# ---------------------------
+class RecordingSurface:
+    """Surface proxy that forwards blits to a target surface and records the touched rects."""
+
+    def __init__(self, target):
+        self.target = target
+        self.rects = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = self.target.blit(source, dest, area, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = self.target.blits(blit_sequence)
+        self.rects.extend(rects)
+        return rects if doreturn else None
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+class DirtyRectRenderer:
+    """Redraws only the regions that changed since the previous frame.
+
+    Everything that is not background was blitted last frame inside a recorded
+    rect, so clearing those rects restores a clean background (a color or a
+    static surface such as the sky gradient) before the new frame is drawn.
+    Only the old and new rects are pushed to the display, with a full flip
+    once they cover too much of the screen.
+    """
+
+    def __init__(self, screen, background, max_coverage):
+        """Initialize the renderer.
+
+        Args:
+            screen (pygame.Surface): Display surface
+            background (tuple | pygame.Surface): RGB color or screen-sized surface used to clear regions
+            max_coverage (float): Screen fraction above which a full flip is used
+        """
+        self.screen = screen
+        self.background = background
+        self.max_coverage = max_coverage
+        self.screen_area = screen.get_width() * screen.get_height()
+        self.previous_rects = None
+        self.recorder = None
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def begin_frame(self):
+        """Clear last frame's rects and return the surface to draw this frame on.
+
+        Returns:
+            RecordingSurface: Proxy recording every blit of the frame
+        """
+        background = self.background
+        if self.previous_rects is None or self._coverage(self.previous_rects) > self.max_coverage:
+            if isinstance(background, pygame.Surface):
+                self.screen.blit(background, (0, 0))
+            else:
+                self.screen.fill(background)
+        elif isinstance(background, pygame.Surface):
+            for rect in self.previous_rects:
+                self.screen.blit(background, rect, rect)
+        else:
+            for rect in self.previous_rects:
+                self.screen.fill(background, rect)
+        self.recorder = RecordingSurface(self.screen)
+        return self.recorder
+
+    def present(self):
+        """Push the changed regions to the display, falling back to a full flip."""
+        new_rects = self.recorder.rects
+        if self.previous_rects is None:
+            dirty = None
+        else:
+            dirty = self.previous_rects + new_rects
+            if self._coverage(dirty) > self.max_coverage:
+                dirty = None
+
+        if dirty is None:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self.previous_rects = new_rects
+        self.recorder = None
+
+    def invalidate(self):
+        """Force the next frame to clear and flip the whole screen."""
+        self.previous_rects = None
+
+    def set_background(self, background):
+        """Replace the background and redraw the whole screen next frame.
+
+        Args:
+            background (tuple | pygame.Surface): RGB color or screen-sized surface
+        """
+        if background is not self.background:
+            self.background = background
+            self.invalidate()
+
+    def _coverage(self, rects):
+        """Upper bound of the screen fraction covered by rects (overlaps counted twice)."""
+        return sum(rect.width * rect.height for rect in rects) / self.screen_area
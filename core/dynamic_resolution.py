@@ -0,0 +1,159 @@
+import pygame
+
+
+# ---------------------------
+# Resolution Controller
+# ---------------------------
+class ResolutionController:
+    """Picks the internal render scale from recent render times.
+
+    Render cost is taken to grow with the pixel count, i.e. with the square
+    of the scale. The controller steps down once the average of the last
+    ``window`` frames exceeds the budget, and steps up only when the cost
+    predicted at the next larger scale fits the budget with some headroom,
+    so it settles instead of oscillating between two steps. When a step down
+    does not make frames cheaper (the frame is bound by per-blit overhead
+    rather than fill rate), it is undone and further step downs are held
+    off for ``hold`` windows.
+    """
+
+    def __init__(self, scales=(1.0, 0.75, 0.5), budget_ms=12.0, window=30, headroom=0.85, hold=10):
+        """Initialize the controller at the largest scale.
+
+        Args:
+            scales (tuple[float]): Allowed scales, largest first
+            budget_ms (float): Target render time per frame in milliseconds
+            window (int): Frames averaged before each decision
+            headroom (float): Budget fraction the predicted cost must stay below to step up
+            hold (int): Windows without step downs after one that did not help
+        """
+        self.scales = tuple(sorted(scales, reverse=True))
+        self.budget_ms = budget_ms
+        self.window = window
+        self.headroom = headroom
+        self.hold = hold
+        self.step = 0
+        self.samples = []
+        self.held = 0              # windows left before the next step down is allowed
+        self.stepped_from = None   # average that caused the last step down, until it is judged
+        self.changes = 0  # number of scale changes, for profiling
+
+    @property
+    def scale(self):
+        """float: Current internal render scale."""
+        return self.scales[self.step]
+
+    def record(self, frame_ms):
+        """Add one frame's render time and adjust the scale once the window is full.
+
+        Args:
+            frame_ms (float): Render time of the frame in milliseconds
+
+        Returns:
+            float: Scale to render the next frame at
+        """
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.window:
+            return self.scale
+        average = sum(self.samples) / len(self.samples)
+        self.samples.clear()  # the next decision only sees frames drawn at the new scale
+        stepped_from, self.stepped_from = self.stepped_from, None
+        self.held = max(0, self.held - 1)
+        if stepped_from is not None and average >= stepped_from:
+            self.step -= 1
+            self.changes += 1
+            self.held = self.hold
+        elif average > self.budget_ms and self.step + 1 < len(self.scales) and not self.held:
+            self.step += 1
+            self.changes += 1
+            self.stepped_from = average
+        elif self.step > 0:
+            predicted = average * (self.scales[self.step - 1] / self.scale) ** 2
+            if predicted < self.budget_ms * self.headroom:
+                self.step -= 1
+                self.changes += 1
+        return self.scale
+
+
+# ---------------------------
+# Scaled World Surface
+# ---------------------------
+class WorldScaler:
+    """Internal world surfaces and scaled sprite copies for each render scale.
+
+    The world is drawn into a surface of the scaled size with positions and
+    sprites scaled alike, then stretched onto the window in one blit. Only
+    drawing changes: entities keep their full-resolution world coordinates.
+    """
+
+    def __init__(self, size):
+        """Initialize the scaler.
+
+        Args:
+            size (tuple): Window size in pixels
+        """
+        self.size = size
+        self.surfaces = {}  # scale -> internal world surface
+        self.sprites = {}   # (id(image), scale) -> (image, scaled image)
+
+    def surface(self, scale):
+        """Return the internal world surface of a scale, the window size scaled down.
+
+        Args:
+            scale (float): Render scale
+
+        Returns:
+            pygame.Surface: Surface to draw the world into
+        """
+        surface = self.surfaces.get(scale)
+        if surface is None:
+            size = (max(1, round(self.size[0] * scale)), max(1, round(self.size[1] * scale)))
+            surface = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self.surfaces[scale] = surface
+        return surface
+
+    def sprite(self, image, scale):
+        """Return a sprite resized for a scale, scaling it on first use.
+
+        Args:
+            image (pygame.Surface): Full-resolution sprite
+            scale (float): Render scale
+
+        Returns:
+            pygame.Surface: Scaled sprite
+        """
+        entry = self.sprites.get((id(image), scale))
+        if entry is None or entry[0] is not image:
+            width, height = image.get_size()
+            resize = pygame.transform.smoothscale if image.get_bitsize() in (24, 32) else pygame.transform.scale
+            scaled = resize(image, (max(1, round(width * scale)), max(1, round(height * scale))))
+            if pygame.display.get_surface() is not None:
+                scaled = scaled.convert_alpha()  # smoothscale output is not in the display's pixel format
+            entry = self.sprites[(id(image), scale)] = (image, scaled)  # the original keeps its id() valid
+        return entry[1]
+
+    def draw_sprites(self, surface, sprites, scale):
+        """Blit a display list onto an internal surface with scaled positions.
+
+        Args:
+            surface (pygame.Surface): Internal world surface
+            sprites (tuple): (image, (x, y)) pairs in world coordinates
+            scale (float): Render scale
+        """
+        sprite = self.sprite
+        surface.blits([(sprite(image, scale), (round(x * scale), round(y * scale))) for image, (x, y) in sprites],
+                      doreturn=False)
+
+    def present(self, surface, screen):
+        """Stretch an internal world surface over the whole window.
+
+        Args:
+            surface (pygame.Surface): Internal world surface
+            screen (pygame.Surface): Window surface
+        """
+        if surface.get_size() == screen.get_size():
+            screen.blit(surface, (0, 0))
+        else:
+            pygame.transform.scale(surface, screen.get_size(), screen)
@@ -1,10 +1,9 @@
-import pygame
-
 # ---------------------------
 # Entity Base Class
 # ---------------------------
 class Entity:
     """Template class for all game entities providing position, collision, and rendering capabilities."""
+    __slots__ = ("x", "y", "width", "height", "prev_x", "prev_y")
 
     def __init__(self, x, y, width, height):
         """Initialize entity with position and dimensions.
@@ -19,7 +18,27 @@ class Entity:
         self.y = y
         self.width = width
         self.height = height
-    
+        self.prev_x = x  # position at the start of the current simulation tick
+        self.prev_y = y
+
+    def save_position(self):
+        """Remember the current position as the start of a simulation tick."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def render_position(self, alpha=1.0):
+        """Interpolate between the previous and the current tick's position.
+
+        Args:
+            alpha (float): Fraction of the next tick already elapsed, 1.0 for the current position
+
+        Returns:
+            tuple: (x, y) to draw the entity at
+        """
+        if alpha >= 1.0:
+            return self.x, self.y
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
 
     def update(self, dt):
         """Abstract method to update entity state. To be overridden by subclasses.
@@ -31,11 +50,12 @@ class Entity:
 
     
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         """Abstract method to draw an entity on specified surface. To be overridden by subclasses.
         
         Args:
             surface (pygame.Surface): Game display surface
+            alpha (float): Interpolation factor between the previous and current tick
         """
         raise NotImplementedError("Subclasses must implement apply method.")
     
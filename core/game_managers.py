@@ -1,126 +1,354 @@
-import pygame
 import random
 
 from core.settings import GameSettings
-from objects.obstacle import *
-from objects.power_up import *
+from core.pool import EntityPool
+from core.spawn_scheduler import SpawnScheduler
+from core.time_scale import TimeScale, OBSTACLES, POWERUPS
+from objects.obstacle import Bird, Cloud
+from objects.power_up import FuelPowerUp, ShieldPowerUp, SlowdownPowerUp
+
+def compact(entities, pool, keep):
+    """Drop entities failing keep from a list in place, releasing them to the pool.
+
+    Preserves the order of the kept entities and allocates no new list.
+
+    Args:
+        entities (list): Active entity list of a manager
+        pool (EntityPool): Pool receiving the dropped entities
+        keep (callable): Predicate selecting the entities to keep
+    """
+    write = 0
+    for entity in entities:
+        if keep(entity):
+            entities[write] = entity
+            write += 1
+        else:
+            pool.release(entity)
+    del entities[write:]
+
+def collect_sprites(entities, items, alpha, screen_width, screen_height):
+    """Append the (image, position) pairs of the on-screen entities to a display list.
+
+    Positions are interpolated like Entity.render_position, inlined to save a
+    method call per sprite. Entities entirely outside the screen are skipped;
+    blitting them would draw nothing.
+
+    Args:
+        entities (iterable): Entities with image, x, y, prev_x and prev_y
+        items (list): Display list to extend, in draw order
+        alpha (float): Interpolation factor between the previous and current tick
+        screen_width (int): Screen width in pixels
+        screen_height (int): Screen height in pixels
+    """
+    append = items.append
+    interpolate = alpha < 1.0
+    for entity in entities:
+        if interpolate:
+            x = entity.prev_x + (entity.x - entity.prev_x) * alpha
+            y = entity.prev_y + (entity.y - entity.prev_y) * alpha
+        else:
+            x, y = entity.x, entity.y
+        if x < screen_width and y < screen_height:
+            image = entity.image
+            if x < 0 or y < 0:  # only sprites crossing the top or left edge can end before it
+                width, height = image.get_size()
+                if x + width <= 0 or y + height <= 0:
+                    continue
+            append((image, (x, y)))
+
+def masks_overlap(a, b):
+    """Narrow phase: check whether the opaque pixels of two AABB-overlapping entities touch.
+
+    Entities without a mask count as solid boxes.
+
+    Args:
+        a (Entity): First entity
+        b (Entity): Second entity
+
+    Returns:
+        bool: True if the masks overlap at the entities' drawn positions
+    """
+    if a.mask is None or b.mask is None:
+        return True
+    return a.mask.overlap(b.mask, (int(b.x) - int(a.x), int(b.y) - int(a.y))) is not None
 
 class ObstacleManager:
     """Factory class managing obstacle spawning and lifecycle using Factory Method pattern."""
-    def __init__(self):
+    def __init__(self, settings=GameSettings, rng=None, pool=None, time_scale=None):
+        self.settings = settings
+        self.rng = rng or random  # per-session random.Random, or the global module
+        self.pool = pool or EntityPool()
+        self.time_scale = time_scale or TimeScale()
+        self.owns_time_scale = time_scale is None  # a private time scale is advanced by update()
         self.obstacles = []
-        self.spawn_timer = 0
+        self.spawner = SpawnScheduler(settings.OBSTACLE_SPAWN_INTERVAL, settings.OBSTACLE_SPAWN_CURVE,
+                                      self.time_scale.timers, ("spawn", OBSTACLES))
 
-    def update(self, dt):
+    def update(self, dt, height=0):
         """Update obstacle state including:
-        - Spawning new obstacles at intervals
-        - Updating existing obstacles
-        - Removing off-screen obstacles
+        - Advancing the time scale if the manager created its own
+        - Spawning every obstacle whose spawn timer expired
+        - Updating existing obstacles with the obstacle group's scaled dt
+        - Removing off-screen obstacles (compacted in place, released to the pool)
         
         Args:
-            dt (float): Delta time in seconds
+            dt (float): World delta time in seconds
+            height (float): Climbed height in meters, selects the spawn rate on the curve
         """
-        self.spawn_timer += dt * 1000  # convert dt to milliseconds
-        if self.spawn_timer >= GameSettings.OBSTACLE_SPAWN_INTERVAL:
-            self.spawn_timer = 0
-            self.spawn_obstacle()
+        if self.owns_time_scale:
+            self.time_scale.update(dt)
+        due = self.spawner.take(height)
+        if due:
+            self.spawn_many(due)
 
+        move_dt = dt * self.time_scale.factor(OBSTACLES)
         for obstacle in self.obstacles:
-            obstacle.update(dt)
+            obstacle.update(move_dt)
 
-        self.obstacles = [o for o in self.obstacles if o.y <= GameSettings.SCREEN_HEIGHT]
+        compact(self.obstacles, self.pool, lambda o, limit=self.settings.SCREEN_HEIGHT: o.y <= limit)
 
     def spawn_obstacle(self):
         """Spawn a randomly chosen obstacle at a random x and y = -50"""
         y = -50
-        x = random.randint(0, GameSettings.SCREEN_WIDTH - 50)
-        if random.choice([True, False]):
-            obstacle = Bird(x, y)
-        else:
-            obstacle = Cloud(x, y)
-        self.obstacles.append(obstacle)
+        x = self.rng.randint(0, self.settings.SCREEN_WIDTH - 50)
+        obstacle_type = Bird if self.rng.choice([True, False]) else Cloud
+        self.obstacles.append(self.pool.acquire(obstacle_type, x, y, self.settings))
+
+    def spawn_many(self, count):
+        """Spawn a batch of obstacles; instances come from the pool once it is warm.
+
+        Args:
+            count (int): Number of obstacles to spawn
+        """
+        for _ in range(count):
+            self.spawn_obstacle()
+
+    def remove_many(self, obstacles):
+        """Remove several obstacles in a single pass over the active list.
+
+        Args:
+            obstacles (iterable): Obstacles to remove
+        """
+        removed = set(obstacles)
+        compact(self.obstacles, self.pool, lambda o: o not in removed)
+
+    def reset(self):
+        """Release every obstacle to the pool and restart the spawn timer for a new session."""
+        compact(self.obstacles, self.pool, lambda o: False)
+        self.spawner.reset()
+
+    def collect(self, items, alpha=1.0):
+        """Append the visible obstacles to a display list, see collect_sprites().
+
+        Args:
+            items (list): Display list of (image, position) pairs
+            alpha (float): Interpolation factor between the previous and current tick
+
+        Returns:
+            list: items
+        """
+        collect_sprites(self.obstacles, items, alpha, self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT)
+        return items
+
+    def draw(self, surface, alpha=1.0):
+        """Draw the visible obstacles in one Surface.blits() call.
 
-    def draw(self, surface):
-        """Abstract draw entity on specified surface.
-        
         Args:
             surface (pygame.Surface): Game display surface
+            alpha (float): Interpolation factor between the previous and current tick
         """
-        for obstacle in self.obstacles:
-            obstacle.draw(surface)
+        surface.blits(self.collect([], alpha), doreturn=False)
+
+def create_obstacle_manager(backend=None, settings=GameSettings, rng=None, time_scale=None):
+    """Create the obstacle manager for the configured storage backend.
+
+    Args:
+        backend (str): "objects" or "numpy", defaults to settings.OBSTACLE_BACKEND
+        settings (type): GameSettings class or a class derived from it
+        rng (random.Random): Session random generator, defaults to the global random module
+        time_scale (TimeScale): Session time scale, a private one advanced by update() if omitted
+
+    Returns:
+        ObstacleManager | VectorObstacleManager: New obstacle manager
+    """
+    backend = backend or settings.OBSTACLE_BACKEND
+    if backend == "objects":
+        return ObstacleManager(settings, rng, time_scale=time_scale)
+    if backend == "numpy":
+        from core.vector_obstacles import VectorObstacleManager
+        return VectorObstacleManager(settings, rng, time_scale)
+    raise ValueError("Unknown obstacle backend: {}".format(backend))
 
 class PowerUpManager:
     """Factory class managing power-up spawning and lifecycle using Factory Method pattern."""
-    def __init__(self):
+    def __init__(self, settings=GameSettings, rng=None, pool=None, time_scale=None):
+        self.settings = settings
+        self.rng = rng or random  # per-session random.Random, or the global module
+        self.pool = pool or EntityPool()
+        self.time_scale = time_scale or TimeScale()
+        self.owns_time_scale = time_scale is None  # a private time scale is advanced by update()
         self.powerups = []
-        self.spawn_timer = 0
+        self.spawner = SpawnScheduler(settings.POWERUP_SPAWN_INTERVAL, settings.POWERUP_SPAWN_CURVE,
+                                      self.time_scale.timers, ("spawn", POWERUPS))
 
-    def update(self, dt):
+    def update(self, dt, height=0):
         """Update power-up state including:
-        - Spawning new power-ups at intervals
-        - Updating existing power-ups
-        - Removing off-screen power-ups
+        - Advancing the time scale if the manager created its own
+        - Spawning every power-up whose spawn timer expired
+        - Updating existing power-ups with the power-up group's scaled dt
+        - Removing off-screen power-ups (compacted in place, released to the pool)
 
         Args:
-            dt (float): Delta time in seconds
+            dt (float): World delta time in seconds
+            height (float): Climbed height in meters, selects the spawn rate on the curve
         """
-        self.spawn_timer += dt * 1000  # milliseconds
-        if self.spawn_timer >= GameSettings.POWERUP_SPAWN_INTERVAL:
-            self.spawn_timer = 0
-            self.spawn_powerup()
+        if self.owns_time_scale:
+            self.time_scale.update(dt)
+        due = self.spawner.take(height)
+        if due:
+            self.spawn_many(due)
 
+        move_dt = dt * self.time_scale.factor(POWERUPS)
         for powerup in self.powerups:
-            powerup.update(dt)
+            powerup.update(move_dt)
 
-        self.powerups = [p for p in self.powerups if p.y <= GameSettings.SCREEN_HEIGHT]
+        compact(self.powerups, self.pool, lambda p, limit=self.settings.SCREEN_HEIGHT: p.y <= limit)
 
     def spawn_powerup(self):
         """Spawn a randomly chosen power-up at a random x and y = -50"""
-        x = random.randint(50, GameSettings.SCREEN_WIDTH - 50)
+        x = self.rng.randint(50, self.settings.SCREEN_WIDTH - 50)
         y = -50  # spawn just above the screen
-        powerup_type = random.choice([FuelPowerUp, ShieldPowerUp, SlowdownPowerUp])
-        powerup = powerup_type(x, y)
-        self.powerups.append(powerup)
+        powerup_type = self.rng.choice([FuelPowerUp, ShieldPowerUp, SlowdownPowerUp])
+        self.powerups.append(self.pool.acquire(powerup_type, x, y, self.settings))
+
+    def spawn_many(self, count):
+        """Spawn a batch of power-ups; instances come from the pool once it is warm.
+
+        Args:
+            count (int): Number of power-ups to spawn
+        """
+        for _ in range(count):
+            self.spawn_powerup()
+
+    def remove_many(self, powerups):
+        """Remove several power-ups in a single pass over the active list.
+
+        Args:
+            powerups (iterable): Power-ups to remove
+        """
+        removed = set(powerups)
+        compact(self.powerups, self.pool, lambda p: p not in removed)
+
+    def reset(self):
+        """Release every power-up to the pool and restart the spawn timer for a new session."""
+        compact(self.powerups, self.pool, lambda p: False)
+        self.spawner.reset()
+
+    def collect(self, items, alpha=1.0):
+        """Append the visible power-ups to a display list, see collect_sprites().
+
+        Args:
+            items (list): Display list of (image, position) pairs
+            alpha (float): Interpolation factor between the previous and current tick
+
+        Returns:
+            list: items
+        """
+        collect_sprites(self.powerups, items, alpha, self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT)
+        return items
+
+    def draw(self, surface, alpha=1.0):
+        """Draw the visible power-ups in one Surface.blits() call.
 
-    def draw(self, surface):
-        """Abstract draw entity on specified surface.
-        
         Args:
             surface (pygame.Surface): Game display surface
+            alpha (float): Interpolation factor between the previous and current tick
         """
-        for powerup in self.powerups:
-            powerup.draw(surface)
+        surface.blits(self.collect([], alpha), doreturn=False)
 
 class CollisionManager:
     """Mediator class handling collision detection between game objects using Mediator pattern."""
-    def __init__(self, balloon, obstacle_manager, powerup_manager):
+    def __init__(self, balloon, obstacle_manager, powerup_manager, settings=GameSettings):
         """Initialize collision manager with game components.
         
         Args:
             balloon (Balloon): Player-controlled balloon instance
             obstacle_manager (ObstacleManager): Manager for obstacle objects
             powerup_manager (PowerUpManager): Manager for power-up objects
+            settings (type): GameSettings class or a class derived from it
         """
+        self.settings = settings
         self.balloon = balloon
         self.obstacle_manager = obstacle_manager
         self.powerup_manager = powerup_manager
-        self.balloon.obstacle_manager = obstacle_manager  # Pass obstacle_manager to balloon
+        self.pixel_collisions = self.settings.PIXEL_COLLISIONS
+        self.collisions = 0  # obstacles touched during the last check
+        self.pickups = 0     # power-ups collected during the last check
 
     def check_collisions(self):
         """Check and handle all collisions between:
         - Balloon and obstacles
         - Balloon and power-ups
         - Applies shield protection or power-up effects as needed.
+
+        One AABB scan per manager finds the entities touching the balloon, and
+        only those run the per-pixel mask test; hit entities are removed in one
+        batch per manager afterwards. There is no spatial index, so a check
+        costs O(obstacles + power-ups) however few of them are near the balloon.
         """
-        for obstacle in self.obstacle_manager.obstacles[:]:
-            if self.balloon.collides_with(obstacle):
-                if not self.balloon.shield_active:
-                    self.balloon.crash()
+        balloon = self.balloon
+        rect = (balloon.x, balloon.y, balloon.width, balloon.height)
+        pixel = self.pixel_collisions
+
+        absorbed = []
+        collisions = 0
+        for obstacle in self._overlapping(self.obstacle_manager, self.obstacle_manager.obstacles, rect):
+            if not pixel or masks_overlap(balloon, obstacle):
+                collisions += 1
+                if not balloon.shield_active:
+                    balloon.crash()
                 else:
                     print("Shield absorbed collision!")
-                    self.obstacle_manager.obstacles.remove(obstacle)
+                    absorbed.append(obstacle)
 
-        for powerup in self.powerup_manager.powerups[:]:
-            if self.balloon.collides_with(powerup):
-                self.balloon.apply_powerup(powerup)
-                self.powerup_manager.powerups.remove(powerup)
\ No newline at end of file
+        collected = []
+        for powerup in self._overlapping(self.powerup_manager, self.powerup_manager.powerups, rect):
+            if not pixel or masks_overlap(balloon, powerup):
+                balloon.apply_powerup(powerup)
+                collected.append(powerup)
+
+        self.collisions = collisions
+        self.pickups = len(collected)
+        if absorbed:
+            self.obstacle_manager.remove_many(absorbed)
+        if collected:
+            self.powerup_manager.remove_many(collected)
+
+    def reset(self):
+        """Clear the last check's counters for a new session."""
+        self.collisions = 0
+        self.pickups = 0
+
+    def _overlapping(self, manager, entities, rect):
+        """Return the entities of a manager whose bounding boxes overlap rect.
+
+        Managers with their own rectangle query (e.g. the vectorized obstacle
+        backend) are asked directly, otherwise the list is scanned once with
+        the AABB test inlined. For a single query rectangle this beats any
+        grid, which would have to be rebuilt from every entity each tick.
+
+        Args:
+            manager: Obstacle or power-up manager
+            entities (iterable): Active entities of the manager
+            rect (tuple): (x, y, width, height) query rectangle
+
+        Returns:
+            list: Overlapping entities in manager order
+        """
+        query_rect = getattr(manager, "query_rect", None)
+        if query_rect is not None:
+            return query_rect(*rect)
+        x, y, width, height = rect
+        right, bottom = x + width, y + height
+        return [e for e in entities
+                if e.y < bottom and e.y + e.height > y and e.x < right and e.x + e.width > x]
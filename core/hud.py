@@ -0,0 +1,94 @@
+from collections import OrderedDict
+import pygame
+
+# ---------------------------
+# Text Surface Cache
+# ---------------------------
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)."""
+
+    def __init__(self, max_entries=128):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries (int): Number of surfaces kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Return the antialiased surface for text, rasterizing it only on a cache miss.
+
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color (tuple): RGB text color
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces."""
+        self.surfaces.clear()
+
+
+# ---------------------------
+# HUD Panel
+# ---------------------------
+class HudPanel:
+    """HUD lines composed into one surface that is rebuilt only when a displayed value changes."""
+    LINE_SPACING = 20
+
+    def __init__(self, font, text_cache, color=(0, 0, 0)):
+        """Initialize the panel.
+
+        Args:
+            font (pygame.font.Font): HUD font
+            text_cache (TextCache): Shared text surface cache
+            color (tuple): RGB text color
+        """
+        self.font = font
+        self.text_cache = text_cache
+        self.color = color
+        self.lines = None
+        self.surface = None
+
+    def render(self, lines):
+        """Return the panel surface for the given lines, recomposing it if they changed.
+
+        Args:
+            lines (tuple[str]): HUD lines from top to bottom
+
+        Returns:
+            pygame.Surface: Panel surface with a transparent background
+        """
+        if lines != self.lines:
+            self.surface = self._compose(lines)
+            self.lines = lines
+        return self.surface
+
+    def _compose(self, lines):
+        texts = [self.text_cache.render(self.font, line, self.color) for line in lines]
+        width = max(text.get_width() for text in texts)
+        height = self.LINE_SPACING * (len(texts) - 1) + texts[-1].get_height()
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 0))
+        for i, text in enumerate(texts):
+            # Lines never overlap, so adding onto the transparent panel copies them exactly
+            panel.blit(text, (0, i * self.LINE_SPACING), special_flags=pygame.BLEND_RGBA_ADD)
+        return panel
@@ -0,0 +1,47 @@
+# ---------------------------
+# Entity Object Pool
+# ---------------------------
+class EntityPool:
+    """Free lists of released entities, reused instead of allocating new instances.
+
+    Pooled classes take (x, y, settings) in their constructor and implement
+    reset(x, y) to restore their freshly spawned state.
+    """
+
+    def __init__(self):
+        self.free = {}
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, cls, x, y, settings):
+        """Return a reset instance of cls from the pool, creating one if none is free.
+
+        Args:
+            cls (type): Entity class to spawn
+            x (int): X-coordinate position
+            y (int): Y-coordinate position
+            settings (type): GameSettings class or a class derived from it
+
+        Returns:
+            Entity: Ready-to-use entity
+        """
+        free = self.free.get(cls)
+        if free:
+            entity = free.pop()
+            entity.reset(x, y)
+            self.reused += 1
+            return entity
+        self.created += 1
+        return cls(x, y, settings)
+
+    def release(self, entity):
+        """Return an entity that left the game to its free list.
+
+        Args:
+            entity (Entity): Entity no longer referenced by a manager
+        """
+        free = self.free.get(type(entity))
+        if free is None:
+            self.free[type(entity)] = [entity]
+        else:
+            free.append(entity)
@@ -0,0 +1,193 @@
+import csv
+import json
+import time
+from array import array
+
+# ---------------------------
+# Frame Phases
+# ---------------------------
+PHASES = ("handle_input", "balloon", "obstacles", "powerups", "collisions", "render", "hud", "flip")
+INPUT, BALLOON, OBSTACLES, POWERUPS, COLLISIONS, RENDER, HUD, FLIP = range(len(PHASES))
+
+
+class FrameProfiler:
+    """Per-phase frame timings kept in a fixed-size ring buffer.
+
+    The game calls begin_frame(), lap(phase) after each subsystem and
+    end_frame(). Each lap stores the time since the previous lap, so the phases
+    of a frame are contiguous. While disabled every call returns immediately,
+    which keeps the instrumentation cheap enough to leave in production builds.
+    """
+    OVERLAY_REFRESH_FRAMES = 30
+
+    def __init__(self, capacity=600, enabled=False):
+        """Allocate the ring buffer.
+
+        Args:
+            capacity (int): Number of frames kept
+            enabled (bool): Start recording immediately
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.phase_count = len(PHASES)
+        self.timings = array("d", bytes(8 * capacity * self.phase_count))
+        self.frame_starts = array("d", bytes(8 * capacity))
+        self.obstacle_counts = array("I", bytes(4 * capacity))
+        self.powerup_counts = array("I", bytes(4 * capacity))
+        self.frames = 0  # frames recorded since the last reset
+        self._row = 0
+        self._last = 0.0
+        self._overlay_lines = ()
+
+    def reset(self):
+        """Forget all recorded frames."""
+        self.frames = 0
+        self._overlay_lines = ()
+
+    def set_enabled(self, enabled):
+        """Start or stop recording; starting clears the buffer.
+
+        Args:
+            enabled (bool): New state
+        """
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+
+    # ---------------------------
+    # Recording
+    # ---------------------------
+    def begin_frame(self):
+        """Start timing a frame."""
+        if not self.enabled:
+            return
+        row = (self.frames % self.capacity) * self.phase_count
+        self._row = row
+        timings = self.timings
+        for i in range(row, row + self.phase_count):
+            timings[i] = 0.0
+        self._last = time.perf_counter()
+        self.frame_starts[self.frames % self.capacity] = self._last
+
+    def lap(self, phase):
+        """Attribute the time since the previous lap to a phase.
+
+        Args:
+            phase (int): Phase index, e.g. profiler.RENDER
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.timings[self._row + phase] += now - self._last
+        self._last = now
+
+    def end_frame(self, obstacle_count, powerup_count):
+        """Finish the frame and store the entity counts.
+
+        Args:
+            obstacle_count (int): Active obstacles
+            powerup_count (int): Active power-ups
+        """
+        if not self.enabled:
+            return
+        slot = self.frames % self.capacity
+        self.obstacle_counts[slot] = obstacle_count
+        self.powerup_counts[slot] = powerup_count
+        self.frames += 1
+
+    # ---------------------------
+    # Analysis
+    # ---------------------------
+    def _slots(self):
+        """Ring slots of the recorded frames, oldest first."""
+        count = min(self.frames, self.capacity)
+        first = self.frames - count
+        return [(first + i) % self.capacity for i in range(count)]
+
+    def percentiles(self, phase, points=(50, 95, 99)):
+        """Return timing percentiles of a phase over the buffered frames.
+
+        Args:
+            phase (int): Phase index
+            points (tuple): Percentiles to compute
+
+        Returns:
+            tuple: Milliseconds per requested percentile (zeros if nothing is recorded)
+        """
+        values = sorted(self.timings[slot * self.phase_count + phase] for slot in self._slots())
+        if not values:
+            return tuple(0.0 for _ in points)
+        last = len(values) - 1
+        return tuple(values[min(last, round(p / 100 * last))] * 1000 for p in points)
+
+    def overlay_lines(self):
+        """Return the overlay text, refreshed every OVERLAY_REFRESH_FRAMES frames.
+
+        Returns:
+            tuple[str]: Lines with p50/p95/p99 per phase and the latest entity counts
+        """
+        if not self._overlay_lines or self.frames % self.OVERLAY_REFRESH_FRAMES == 0:
+            lines = ["phase         p50    p95    p99 ms"]
+            for phase, name in enumerate(PHASES):
+                lines.append("{:<12} {:6.2f} {:6.2f} {:6.2f}".format(name, *self.percentiles(phase)))
+            slot = (self.frames - 1) % self.capacity if self.frames else 0
+            lines.append("obstacles {}  power-ups {}".format(self.obstacle_counts[slot],
+                                                             self.powerup_counts[slot]))
+            self._overlay_lines = tuple(lines)
+        return self._overlay_lines
+
+    def draw_overlay(self, surface, font, text_cache, position=(10, 100), color=(0, 0, 0), lines=None):
+        """Draw the rolling percentile overlay.
+
+        Args:
+            surface (pygame.Surface): Target surface
+            font (pygame.font.Font): Overlay font
+            text_cache (TextCache): Cache for the rendered lines
+            position (tuple): Top-left corner of the overlay
+            color (tuple): RGB text color
+            lines (tuple[str]): Lines captured earlier with overlay_lines(), defaults to the current ones
+        """
+        x, y = position
+        for i, line in enumerate(lines if lines is not None else self.overlay_lines()):
+            surface.blit(text_cache.render(font, line, color), (x, y + i * 18))
+
+    # ---------------------------
+    # Export
+    # ---------------------------
+    def export_csv(self, path):
+        """Write one row per buffered frame with per-phase milliseconds and entity counts.
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame_start_s",) + tuple(name + "_ms" for name in PHASES) +
+                            ("obstacles", "powerups"))
+            for slot in self._slots():
+                row = slot * self.phase_count
+                writer.writerow([self.frame_starts[slot]] +
+                                [self.timings[row + p] * 1000 for p in range(self.phase_count)] +
+                                [self.obstacle_counts[slot], self.powerup_counts[slot]])
+
+    def export_chrome_trace(self, path):
+        """Write the buffered frames in Chrome trace event format (chrome://tracing, Perfetto).
+
+        Args:
+            path (str): Output file path
+        """
+        events = []
+        for slot in self._slots():
+            row = slot * self.phase_count
+            start = self.frame_starts[slot] * 1e6
+            for phase, name in enumerate(PHASES):
+                duration = self.timings[row + phase] * 1e6
+                if duration:
+                    events.append({"name": name, "ph": "X", "ts": start, "dur": duration,
+                                   "pid": 1, "tid": 1})
+                start += duration
+            events.append({"name": "entities", "ph": "C", "ts": self.frame_starts[slot] * 1e6, "pid": 1,
+                           "args": {"obstacles": self.obstacle_counts[slot],
+                                    "powerups": self.powerup_counts[slot]}})
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
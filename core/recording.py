@@ -0,0 +1,168 @@
+import hashlib
+import json
+import struct
+from array import array
+
+# ------------------------------
+# Session Recording Format
+# ------------------------------
+# Header: magic, version, seed, length of the JSON settings overrides, overrides
+# Frames: float32 dt + input bits per frame (5 bytes)
+# Footer: magic, frame count, final height, state hash
+MAGIC = b"BREC"
+FOOTER_MAGIC = b"BEND"
+VERSION = 1
+HEADER = struct.Struct("<4sHqI")
+FRAME = struct.Struct("<fB")
+FOOTER = struct.Struct("<4sId16s")
+
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+
+_FLOAT32 = struct.Struct("<f")
+
+
+def quantize_dt(dt):
+    """Round dt to the float32 value stored in a recording, so live play and replay step identically.
+
+    Args:
+        dt (float): Delta time in seconds
+
+    Returns:
+        float: dt as stored in the recording
+    """
+    return _FLOAT32.unpack(_FLOAT32.pack(dt))[0]
+
+
+def settings_overrides(settings, base):
+    """Return the settings that differ between a derived settings class and its base.
+
+    Args:
+        settings (type): Settings class used by the session
+        base (type): GameSettings
+
+    Returns:
+        dict: Setting name -> value for every differing setting
+    """
+    return {name: getattr(settings, name) for name in dir(base)
+            if name.isupper() and getattr(settings, name) != getattr(base, name)}
+
+
+def state_hash(game):
+    """Hash the simulation state of a GameLoop: balloon, obstacles, power-ups and height.
+
+    Args:
+        game (GameLoop): Game to hash
+
+    Returns:
+        bytes: 16-byte digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    balloon = game.balloon
+    digest.update(struct.pack("<5d?", balloon.x, balloon.fuel, balloon.shield_timer,
+                              balloon.slowdown_timer, game.current_height, balloon.has_crashed()))
+    for obstacle in game.obstacle_manager.obstacles:
+        digest.update(struct.pack("<4d", obstacle.x, obstacle.y, obstacle.speed_x, obstacle.speed_y))
+    for powerup in game.powerup_manager.powerups:
+        digest.update(type(powerup).__name__.encode())
+        digest.update(struct.pack("<2d", powerup.x, powerup.y))
+    return digest.digest()
+
+
+class RecordingWriter:
+    """Streams the per-frame dt and left/right input of one session to a compact binary file."""
+
+    def __init__(self, path, seed, overrides=None):
+        """Create the file and write the header.
+
+        Args:
+            path (str): Output file path
+            seed (int): Session RNG seed
+            overrides (dict): Settings overrides the session runs with
+        """
+        self.path = path
+        self.frames = 0
+        encoded = json.dumps(overrides or {}, sort_keys=True).encode()
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, len(encoded)))
+        self.file.write(encoded)
+
+    def record(self, dt, left, right):
+        """Append one frame.
+
+        Args:
+            dt (float): Delta time, already passed through quantize_dt
+            left (bool): Left input held
+            right (bool): Right input held
+        """
+        bits = (INPUT_LEFT if left else 0) | (INPUT_RIGHT if right else 0)
+        self.file.write(FRAME.pack(dt, bits))
+        self.frames += 1
+
+    def close(self, final_height, final_hash):
+        """Write the footer used by replay verification and close the file.
+
+        Args:
+            final_height (float): Height reached at the end of the session
+            final_hash (bytes): state_hash() at the end of the session
+        """
+        self.file.write(FOOTER.pack(FOOTER_MAGIC, self.frames, final_height, final_hash))
+        self.file.close()
+
+
+class Recording:
+    """A recorded session loaded into memory.
+
+    Attributes:
+        seed (int): Session RNG seed
+        overrides (dict): Settings overrides of the session
+        dts (array): Per-frame delta times
+        inputs (bytes): Per-frame input bits
+        final_height (float): Recorded final height
+        final_hash (bytes): Recorded final state hash
+    """
+
+    def __init__(self, seed, overrides, dts, inputs, final_height, final_hash):
+        self.seed = seed
+        self.overrides = overrides
+        self.dts = dts
+        self.inputs = inputs
+        self.final_height = final_height
+        self.final_hash = final_hash
+
+    def __len__(self):
+        return len(self.dts)
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording file.
+
+        Args:
+            path (str): File written by RecordingWriter
+
+        Returns:
+            Recording: Parsed recording
+
+        Raises:
+            ValueError: If the file is not a complete recording
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER.size + FOOTER.size:
+            raise ValueError("{} is too short to be a recording".format(path))
+        magic, version, seed, overrides_size = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a version {} recording".format(path, VERSION))
+        offset = HEADER.size
+        overrides = json.loads(data[offset:offset + overrides_size])
+        offset += overrides_size
+        footer_magic, frames, final_height, final_hash = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+        if footer_magic != FOOTER_MAGIC or offset + frames * FRAME.size != len(data) - FOOTER.size:
+            raise ValueError("{} is truncated or corrupt".format(path))
+
+        dts = array("f")
+        inputs = bytearray(frames)
+        for i, (dt, bits) in enumerate(FRAME.iter_unpack(data[offset:offset + frames * FRAME.size])):
+            dts.append(dt)
+            inputs[i] = bits
+        return cls(seed, overrides, dts, bytes(inputs), final_height, final_hash)
@@ -0,0 +1,211 @@
+import threading
+import time
+
+import pygame
+
+from core.dynamic_resolution import WorldScaler
+from core.profiler import RENDER, HUD, FLIP
+
+
+def _no_lap(phase):
+    pass
+
+
+# ---------------------------
+# Frame Snapshots
+# ---------------------------
+class FrameSnapshot:
+    """Everything needed to draw one frame, detached from the live game state.
+
+    Attributes:
+        sprites (list): (image, (x, y)) pairs of the on-screen sprites in draw order, owned by the snapshot
+        height (float): Current height in pixels, selects the sky band
+        background_height (float): Interpolated height driving the parallax scroll
+        hud_lines (tuple[str]): HUD panel lines
+        slowdown_text (str): Centered slowdown message, None when inactive
+        overlay_lines (tuple[str]): Profiler overlay lines, None when hidden
+    """
+    __slots__ = ("sprites", "height", "background_height", "hud_lines", "slowdown_text", "overlay_lines")
+
+    def __init__(self, sprites, height, background_height, hud_lines, slowdown_text=None, overlay_lines=None):
+        self.sprites = sprites
+        self.height = height
+        self.background_height = background_height
+        self.hud_lines = hud_lines
+        self.slowdown_text = slowdown_text
+        self.overlay_lines = overlay_lines
+
+
+# ---------------------------
+# Snapshot Renderer
+# ---------------------------
+class SnapshotRenderer:
+    """Draws FrameSnapshots; used directly in sequential mode and by the render thread when pipelined."""
+
+    def __init__(self, screen, settings, font, slowdown_font, text_cache, hud_panel, profiler,
+                 background=None, dirty_renderer=None, resolution=None):
+        """Initialize the renderer.
+
+        Args:
+            screen (pygame.Surface): Display surface
+            settings (type): GameSettings class or a class derived from it
+            font (pygame.font.Font): HUD and overlay font
+            slowdown_font (pygame.font.Font): Font of the slowdown message
+            text_cache (TextCache): Text surface cache, only touched by the drawing thread
+            hud_panel (HudPanel): Cached HUD panel
+            profiler (FrameProfiler): Profiler drawing the overlay
+            background (ParallaxBackground): Layered background, None for a flat sky
+            dirty_renderer (DirtyRectRenderer): Dirty-rect presenter, None for full flips
+            resolution (ResolutionController): Picks the world render scale from the draw times,
+                None to always draw at native resolution; ignored with a dirty_renderer
+        """
+        self.screen = screen
+        self.settings = settings
+        self.font = font
+        self.slowdown_font = slowdown_font
+        self.text_cache = text_cache
+        self.hud_panel = hud_panel
+        self.profiler = profiler
+        self.background = background
+        self.dirty_renderer = dirty_renderer
+        self.resolution = resolution if dirty_renderer is None else None
+        self.scaler = WorldScaler(screen.get_size()) if self.resolution is not None else None
+
+    def draw(self, snapshot, lap=_no_lap):
+        """Draw and present one frame.
+
+        With a resolution controller the background and sprites are drawn into
+        an internal surface at the current scale and stretched onto the
+        window; the HUD and overlays are always drawn at native resolution.
+
+        Args:
+            snapshot (FrameSnapshot): Frame to draw
+            lap (callable): Profiler lap callback, a no-op off the main thread
+        """
+        start = time.perf_counter()
+        scale = self.resolution.scale if self.resolution is not None else 1.0
+        if self.dirty_renderer is not None:
+            if self.background is not None:
+                self.dirty_renderer.set_background(self.background.sky(snapshot.height))
+            target = self.dirty_renderer.begin_frame()
+        elif scale != 1.0:
+            target = self.scaler.surface(scale)
+        else:
+            target = self.screen
+        if self.dirty_renderer is None:
+            if self.background is not None:
+                self.background.draw(target, snapshot.background_height, scale)
+            else:
+                target.fill(self.settings.SKY_COLOR)
+
+        if scale != 1.0:
+            self.scaler.draw_sprites(target, snapshot.sprites, scale)
+            self.scaler.present(target, self.screen)
+            target = self.screen
+        else:
+            target.blits(snapshot.sprites, doreturn=False)
+        lap(RENDER)
+
+        target.blit(self.hud_panel.render(snapshot.hud_lines), (10, 10))
+        if snapshot.slowdown_text is not None:
+            text = self.text_cache.render(self.slowdown_font, snapshot.slowdown_text, (255, 0, 0))
+            target.blit(text, text.get_rect(center=(self.settings.SCREEN_WIDTH // 2,
+                                                    self.settings.SCREEN_HEIGHT // 2)))
+        if snapshot.overlay_lines is not None:
+            self.profiler.draw_overlay(target, self.font, self.text_cache, lines=snapshot.overlay_lines)
+        lap(HUD)
+
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.present()
+        else:
+            pygame.display.flip()
+        lap(FLIP)
+        if self.resolution is not None:
+            self.resolution.record((time.perf_counter() - start) * 1000)
+
+
+# ---------------------------
+# Render Thread
+# ---------------------------
+class RenderPipeline:
+    """Draws snapshots on a worker thread while the simulation computes the next frame.
+
+    Two slots form the double buffer: the snapshot being drawn by the worker
+    and at most one published snapshot waiting for it. submit() blocks while a
+    snapshot is still waiting, so the simulation runs at most one frame ahead.
+    pygame releases the GIL while blitting and flipping, which lets both
+    threads progress. Some platforms (macOS) only allow display calls from the
+    main thread; the sequential mode is the default for that reason.
+    """
+
+    def __init__(self, renderer):
+        """Start the render thread.
+
+        Args:
+            renderer (SnapshotRenderer): Renderer used by the worker
+        """
+        self.renderer = renderer
+        self.condition = threading.Condition()
+        self.pending = None
+        self.busy = False
+        self.stopping = False
+        self.error = None
+        self.frames = 0
+        self.thread = threading.Thread(target=self._render_loop, name="render", daemon=True)
+        self.thread.start()
+
+    def submit(self, snapshot):
+        """Publish the next frame, waiting while the previous one has not been picked up.
+
+        Args:
+            snapshot (FrameSnapshot): Frame to draw
+
+        Raises:
+            RuntimeError: If the render thread failed
+        """
+        with self.condition:
+            while self.pending is not None and self.error is None:
+                self.condition.wait()
+            if self.error is not None:
+                raise RuntimeError("render thread failed") from self.error
+            self.pending = snapshot
+            self.condition.notify_all()
+
+    def flush(self):
+        """Wait until every submitted frame has been presented."""
+        with self.condition:
+            while (self.pending is not None or self.busy) and self.error is None:
+                self.condition.wait()
+
+    def close(self):
+        """Present the remaining frames and stop the render thread."""
+        self.flush()
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        self.thread.join()
+
+    def _render_loop(self):
+        condition = self.condition
+        while True:
+            with condition:
+                while self.pending is None and not self.stopping:
+                    condition.wait()
+                if self.pending is None:
+                    return
+                snapshot = self.pending
+                self.pending = None
+                self.busy = True
+                condition.notify_all()
+            try:
+                self.renderer.draw(snapshot)
+            except Exception as error:  # surfaced to the simulation thread on the next submit
+                with condition:
+                    self.error = error
+                    self.busy = False
+                    condition.notify_all()
+                return
+            with condition:
+                self.busy = False
+                self.frames += 1
+                condition.notify_all()
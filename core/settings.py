@@ -6,7 +6,10 @@ class GameSettings:
     """Central configuration class storing game constants and settings.
     
     Attributes:
-        FPS (int): Target frames per second
+        FPS (int): Target rendered frames per second
+        TICK_RATE (int): Simulation ticks per second, independent of FPS
+        MAX_CATCH_UP_STEPS (int): Most simulation ticks run in one rendered frame
+        RENDER_INTERPOLATION (bool): Draw entities between their last two tick positions
         SCREEN_WIDTH (int): Game window width in pixels
         SCREEN_HEIGHT (int): Game window height in pixels
         BACKGROUND_SPEED (int): Background scroll speed (pixels/sec)
@@ -20,10 +23,42 @@ class GameSettings:
         OBSTACLE_SPAWN_INTERVAL (int): Obstacle spawn interval (milliseconds)
         POWERUP_SPAWN_INTERVAL (int): Power-up spawn interval (milliseconds)
         SLOWDOWN_DURATION (int): Slowdown power-up duration (milliseconds)
-        SLOWDOWN_OBSTACLE_SPEED (int): Obstacle speed when slowdown power-up is active
-        SLOWDOWN_ACTIVE (bool): Flag to indicate if slowdown is active
+        SLOWDOWN_FACTOR (float): Time scale of obstacles while the slowdown power-up is active
+        OBSTACLE_BACKEND (str): Obstacle storage backend, "objects" or "numpy"
+        ASSET_PRELOAD_THREAD (bool): Decode the sprites on a background thread while the window is created
+        USE_SPRITE_ATLAS (bool): Pack all sprites into one atlas surface at startup
+        SKY_COLOR (tuple): Background sky RGB color, used when the parallax background is disabled
+        PARALLAX_ENABLED (bool): Draw the pre-rendered sky gradient and scrolling scenery layers
+        PARALLAX_FACTORS (tuple): Scroll speed of each scenery layer relative to the climb, far to near
+        BACKGROUND_BAND_HEIGHT (int): Altitude band height (meters) after which the background is re-rendered
+        SKY_BANDS (int): Bands until the sky reaches SKY_GRADIENT_HIGH
+        SKY_GRADIENT_LOW (tuple): (top, bottom) RGB sky colors at the ground
+        SKY_GRADIENT_HIGH (tuple): (top, bottom) RGB sky colors at high altitude
+        RENDER_MODE (str): "full" (fill and flip every frame) or "dirty" (dirty rectangles)
+        RENDER_THREADED (bool): Draw frame snapshots on a render thread while the next frame is simulated
+        DIRTY_RECT_MAX_COVERAGE (float): Screen fraction of dirty rects above which a full flip is used
+        DYNAMIC_RESOLUTION (bool): Draw the world at a reduced internal resolution when rendering is slow
+            ("full" render mode only); the HUD stays at native resolution
+        RESOLUTION_SCALES (tuple[float]): Internal resolution steps, largest first
+        RESOLUTION_BUDGET_MS (float): Render time per frame the dynamic resolution aims to stay under
+        RESOLUTION_WINDOW (int): Frames averaged before each resolution decision
+        PROFILER_ENABLED (bool): Record per-phase frame timings from startup
+        PROFILER_FRAMES (int): Frames kept in the profiler ring buffer
+        PIXEL_COLLISIONS (bool): Confirm AABB hits with the sprites' alpha masks
+        TELEMETRY_ENABLED (bool): Stream per-frame telemetry records while playing with a window
+        TELEMETRY_DIR (str): Directory holding the telemetry logs and the high score
+        TELEMETRY_QUEUE_SIZE (int): Records buffered for the writer thread before new ones are dropped
+        OBSTACLE_SPAWN_CURVE (tuple): Optional (height in meters, interval in milliseconds) points
+            overriding OBSTACLE_SPAWN_INTERVAL as the balloon climbs
+        POWERUP_SPAWN_CURVE (tuple): Optional (height in meters, interval in milliseconds) points
+            overriding POWERUP_SPAWN_INTERVAL as the balloon climbs
+        SPECTATOR_PORT (int): Default TCP port of the spectator stream
+        SPECTATOR_RATE (float): Snapshots per second sent to spectators
     """
     FPS = 60
+    TICK_RATE = 60               # fixed simulation rate; FPS can be lowered on weak machines
+    MAX_CATCH_UP_STEPS = 5
+    RENDER_INTERPOLATION = True
     SCREEN_WIDTH = 1200
     SCREEN_HEIGHT = 800
     BACKGROUND_SPEED = 150       # pixels per second (scroll speed downward)
@@ -39,4 +74,52 @@ class GameSettings:
     OBSTACLE_SPAWN_INTERVAL = 2000 # milliseconds
     POWERUP_SPAWN_INTERVAL = 7000  # milliseconds
     SLOWDOWN_DURATION = 4000     # milliseconds the slowdown lasts
-    SLOWDOWN_ACTIVE = False      # Add this flag to track slowdown state
+    SLOWDOWN_FACTOR = 0.5        # obstacles move at half speed during slowdown
+    OBSTACLE_BACKEND = "objects" # "objects" (Bird/Cloud instances) or "numpy" (vectorized arrays)
+    PIXEL_COLLISIONS = True      # AABB hits are confirmed per pixel
+    ASSET_PRELOAD_THREAD = True
+    USE_SPRITE_ATLAS = False     # pack sprites into a single atlas surface
+    SKY_COLOR = (135, 206, 235)
+    PARALLAX_ENABLED = True
+    PARALLAX_FACTORS = (0.2, 0.5)  # far haze and stars, near clouds
+    BACKGROUND_BAND_HEIGHT = 200   # meters per altitude band
+    SKY_BANDS = 8
+    SKY_GRADIENT_LOW = ((100, 170, 235), (135, 206, 235))
+    SKY_GRADIENT_HIGH = ((5, 8, 35), (40, 60, 140))
+    RENDER_MODE = "full"         # "full" or "dirty"
+    RENDER_THREADED = False      # display calls off the main thread are unsupported on some platforms
+    DIRTY_RECT_MAX_COVERAGE = 0.5
+    DYNAMIC_RESOLUTION = False
+    RESOLUTION_SCALES = (1.0, 0.75, 0.5)
+    RESOLUTION_BUDGET_MS = 12.0  # leaves a third of a 60 FPS frame for the simulation
+    RESOLUTION_WINDOW = 30
+    PROFILER_ENABLED = False     # F3 toggles the overlay and recording at runtime
+    PROFILER_FRAMES = 600        # ring buffer size (10 seconds at 60 FPS)
+    OBSTACLE_SPAWN_CURVE = None  # e.g. ((0, 2000), (500, 800)) spawns faster higher up
+    POWERUP_SPAWN_CURVE = None
+    TELEMETRY_ENABLED = True
+    TELEMETRY_DIR = "telemetry"
+    TELEMETRY_QUEUE_SIZE = 4096
+    SPECTATOR_PORT = 8765
+    SPECTATOR_RATE = 30
+
+    @classmethod
+    def derive(cls, **overrides):
+        """Return a settings class with some values overridden, leaving this class untouched.
+
+        Game objects take the returned class as their ``settings`` argument, so
+        several sessions can run with different values side by side.
+
+        Args:
+            **overrides: Setting names and their new values
+
+        Returns:
+            type: Subclass of this settings class carrying the overrides
+
+        Raises:
+            AttributeError: If an override does not name an existing setting
+        """
+        unknown = [name for name in overrides if not name.isupper() or not hasattr(cls, name)]
+        if unknown:
+            raise AttributeError("Unknown setting(s): {}".format(", ".join(sorted(unknown))))
+        return type(cls.__name__, (cls,), dict(overrides))
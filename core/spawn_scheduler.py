@@ -0,0 +1,109 @@
+from bisect import bisect_right
+
+from core.timers import TimerService
+
+# ---------------------------
+# Spawn Scheduler
+# ---------------------------
+class SpawnScheduler:
+    """Spawn timing as a repeating timer on the session TimerService.
+
+    Each expiry counts one due spawn and re-arms the timer one interval after
+    the expired deadline, so long frames yield a batch and the average rate
+    stays exact at any frame rate. The interval can follow a rate curve keyed
+    on the climbed height. Managers collect the due spawns with take(); a
+    scheduler without session timers keeps a private TimerService that due()
+    advances.
+    """
+
+    def __init__(self, interval, curve=None, timers=None, key="spawn"):
+        """Initialize the scheduler and arm its timer.
+
+        Args:
+            interval (float): Spawn interval in milliseconds when no curve is given
+            curve (sequence[tuple]): Optional (height in meters, interval in milliseconds)
+                points; the interval is interpolated linearly between points and
+                held constant outside them
+            timers (TimerService): Session timers advancing the schedule, a private one advanced
+                by due() if omitted
+            key (hashable): Timer key, unique per scheduler on a shared TimerService
+
+        Raises:
+            ValueError: If the interval or an interval on the curve is not positive
+        """
+        self.interval = interval
+        self.timers = timers if timers is not None else TimerService()
+        self.owns_timers = timers is None
+        self.key = key
+        self.pending = 0    # spawns that came due and were not taken yet
+        self.height = 0     # height of the last take(), selects the next interval
+        self.curve_heights = []
+        self.curve_intervals = []
+        if curve:
+            points = sorted(curve)
+            self.curve_heights = [height for height, _ in points]
+            self.curve_intervals = [interval for _, interval in points]
+        if min(self.curve_intervals or [interval]) <= 0:
+            raise ValueError("Spawn intervals must be positive milliseconds")
+        self.timers.schedule(key, self.interval_at(0), self._due)
+
+    def interval_at(self, height):
+        """Return the spawn interval at a height.
+
+        Args:
+            height (float): Climbed height in meters
+
+        Returns:
+            float: Interval in milliseconds
+        """
+        heights = self.curve_heights
+        if not heights:
+            return self.interval
+        i = bisect_right(heights, height)
+        if i == 0:
+            return self.curve_intervals[0]
+        if i == len(heights):
+            return self.curve_intervals[-1]
+        h0, h1 = heights[i - 1], heights[i]
+        v0, v1 = self.curve_intervals[i - 1], self.curve_intervals[i]
+        return v0 + (v1 - v0) * (height - h0) / (h1 - h0)
+
+    def _due(self):
+        self.pending += 1
+        return self.interval_at(self.height)
+
+    def take(self, height=0):
+        """Return how many spawns came due since the last call.
+
+        Args:
+            height (float): Climbed height in meters for the following intervals
+
+        Returns:
+            int: Number of entities to spawn
+        """
+        self.height = height
+        count = self.pending
+        self.pending = 0
+        return count
+
+    def due(self, dt, height=0):
+        """Advance a private TimerService by dt and return the spawns that came due.
+
+        Session timers are advanced by their owner, so with them this is take().
+
+        Args:
+            dt (float): Delta time in seconds
+            height (float): Climbed height in meters for the following intervals
+
+        Returns:
+            int: Number of entities to spawn
+        """
+        if self.owns_timers:
+            self.timers.advance(dt * 1000)
+        return self.take(height)
+
+    def reset(self):
+        """Drop the due spawns and restart the interval from now."""
+        self.pending = 0
+        self.height = 0
+        self.timers.schedule(self.key, self.interval_at(0), self._due)
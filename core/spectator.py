@@ -0,0 +1,463 @@
+import errno
+import socket
+import struct
+import time
+
+import pygame
+
+from core.assets import assets, GAME_IMAGES
+from core.background import ParallaxBackground
+from core.hud import TextCache, HudPanel
+from core.settings import GameSettings
+
+# ------------------------------
+# Spectator Wire Format
+# ------------------------------
+# Every message: uint32 payload length, then the payload starting with a type byte.
+# HELLO    (host -> viewer): version, screen width and height
+# SNAPSHOT (host -> viewer): sequence, base sequence (NO_BASE for a keyframe),
+#          world (balloon x/y, height, fuel, flags), upserts, removals
+# ACK      (viewer -> host): sequence of the last applied snapshot
+#
+# Entities are keyed by a uint16 network id. An upsert is either absolute
+# (tag = kind code, x and y as int16) or, when the entity exists in the base
+# snapshot and moved less than 128 px, relative (tag = RELATIVE, int8 dx/dy).
+# Entities unchanged since the base are not sent at all.
+VERSION = 1
+MSG_HELLO = 0
+MSG_SNAPSHOT = 1
+MSG_ACK = 2
+NO_BASE = 0xFFFFFFFF
+RELATIVE = 0xFF
+
+LENGTH = struct.Struct("<I")
+HELLO = struct.Struct("<BHHH")
+SNAPSHOT = struct.Struct("<BII")
+WORLD = struct.Struct("<hhIBB")
+COUNT = struct.Struct("<H")
+ABSOLUTE = struct.Struct("<HBhh")
+DELTA = struct.Struct("<HBbb")
+REMOVAL = struct.Struct("<H")
+ACK = struct.Struct("<BI")
+
+FLAG_SHIELD = 1
+FLAG_SLOWDOWN = 2
+FLAG_CRASHED = 4
+
+# Kind codes shared by host and viewers
+BIRD, CLOUD, FUEL, SHIELD, SLOWDOWN = range(5)
+KIND_IMAGES = {BIRD: "bird.png", CLOUD: "cloud.png", FUEL: "fuel.png",
+               SHIELD: "shield.png", SLOWDOWN: "slowdown.png"}
+POWERUP_KINDS = {"FuelPowerUp": FUEL, "ShieldPowerUp": SHIELD, "SlowdownPowerUp": SLOWDOWN}
+OBSTACLE_KINDS = {"Bird": BIRD, "Cloud": CLOUD}
+
+
+def _quantize(value):
+    return max(-32768, min(32767, int(round(value))))
+
+
+def encode_snapshot(seq, base_seq, world, entities, base_entities):
+    """Encode a snapshot as a delta against a base state.
+
+    Args:
+        seq (int): Sequence number of this snapshot
+        base_seq (int): Sequence number of the base, NO_BASE for a keyframe
+        world (tuple): (balloon x, balloon y, height, fuel, flags), already quantized
+        entities (dict): Network id -> (kind, x, y), already quantized
+        base_entities (dict): Entities of the base snapshot, empty for a keyframe
+
+    Returns:
+        bytes: Length-prefixed message
+    """
+    parts = [SNAPSHOT.pack(MSG_SNAPSHOT, seq, base_seq), WORLD.pack(*world)]
+    upserts = []
+    for net_id, state in entities.items():
+        base = base_entities.get(net_id)
+        if base == state:
+            continue
+        kind, x, y = state
+        if base is not None and base[0] == kind and -128 <= x - base[1] <= 127 and -128 <= y - base[2] <= 127:
+            upserts.append(DELTA.pack(net_id, RELATIVE, x - base[1], y - base[2]))
+        else:
+            upserts.append(ABSOLUTE.pack(net_id, kind, x, y))
+    removals = [REMOVAL.pack(net_id) for net_id in base_entities if net_id not in entities]
+    parts.append(COUNT.pack(len(upserts)))
+    parts.extend(upserts)
+    parts.append(COUNT.pack(len(removals)))
+    parts.extend(removals)
+    payload = b"".join(parts)
+    return LENGTH.pack(len(payload)) + payload
+
+
+def decode_snapshot(payload, states):
+    """Decode a snapshot payload on top of its base state.
+
+    Args:
+        payload (bytes): Message payload without the length prefix
+        states (dict): Sequence -> (world, entities) of previously decoded snapshots
+
+    Returns:
+        tuple: (seq, world, entities)
+
+    Raises:
+        KeyError: If the base snapshot is unknown
+    """
+    _, seq, base_seq = SNAPSHOT.unpack_from(payload)
+    offset = SNAPSHOT.size
+    world = WORLD.unpack_from(payload, offset)
+    offset += WORLD.size
+    entities = {} if base_seq == NO_BASE else dict(states[base_seq][1])
+    (count,) = COUNT.unpack_from(payload, offset)
+    offset += COUNT.size
+    for _ in range(count):
+        if payload[offset + 2] == RELATIVE:
+            net_id, _, dx, dy = DELTA.unpack_from(payload, offset)
+            kind, x, y = entities[net_id]
+            entities[net_id] = (kind, x + dx, y + dy)
+            offset += DELTA.size
+        else:
+            net_id, kind, x, y = ABSOLUTE.unpack_from(payload, offset)
+            entities[net_id] = (kind, x, y)
+            offset += ABSOLUTE.size
+    (count,) = COUNT.unpack_from(payload, offset)
+    offset += COUNT.size
+    for _ in range(count):
+        (net_id,) = REMOVAL.unpack_from(payload, offset)
+        entities.pop(net_id, None)
+        offset += REMOVAL.size
+    return seq, world, entities
+
+
+class _NetworkIds:
+    """Assigns network ids that stay stable while an entity stays alive.
+
+    Entities with a ``uid`` (NumPy obstacle views) are keyed by it, other
+    entities by identity; the previous snapshot's entities are kept referenced
+    so an identity cannot be reused while it is still mapped. Ids are 15 bits
+    wide and tagged with ``prefix``, so two managers never share an id.
+    """
+
+    def __init__(self, prefix=0):
+        self.prefix = prefix
+        self.ids = {}
+        self.next_id = 0
+
+    def assign(self, entities):
+        """Return (network id, entity) pairs for the current entities."""
+        previous = self.ids
+        current = {}
+        pairs = []
+        for entity in entities:
+            key = entity.uid if hasattr(entity, "uid") else id(entity)
+            entry = previous.get(key)
+            if entry is None or (not hasattr(entity, "uid") and entry[1] is not entity):
+                entry = (self.prefix | self.next_id, entity)
+                self.next_id = (self.next_id + 1) & 0x7FFF
+            current[key] = entry
+            pairs.append((entry[0], entity))
+        self.ids = current
+        return pairs
+
+
+# ---------------------------
+# Host
+# ---------------------------
+class _Viewer:
+    __slots__ = ("sock", "address", "inbox", "outbox", "acked")
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.inbox = b""
+        self.outbox = bytearray()
+        self.acked = None  # last acknowledged sequence
+
+
+class SpectatorServer:
+    """Streams a GameLoop's world state to spectators over TCP.
+
+    The game thread calls publish() once per rendered frame; all socket work
+    is non-blocking. Each viewer gets a delta against the last snapshot it
+    acknowledged, or a keyframe when that one has left the history. Viewers
+    whose unsent backlog exceeds MAX_BACKLOG skip frames instead of slowing
+    the game down.
+    """
+    HISTORY = 64
+    MAX_BACKLOG = 64 * 1024
+
+    def __init__(self, game, host="127.0.0.1", port=0, rate=30):
+        """Start listening.
+
+        Args:
+            game (GameLoop): Game whose state is streamed
+            host (str): Interface to bind
+            port (int): TCP port, 0 picks a free one
+            rate (float): Snapshots per second
+        """
+        self.game = game
+        self.interval = 1.0 / rate
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.address = self.listener.getsockname()
+        self.viewers = []
+        self.seq = 0
+        self.history = {}  # seq -> entities
+        self.obstacle_ids = _NetworkIds()
+        self.powerup_ids = _NetworkIds(0x8000)
+        self.last_publish = 0.0
+        self.bytes_sent = 0
+
+    def capture(self):
+        """Quantize the game state.
+
+        Returns:
+            tuple: (world, entities) as passed to encode_snapshot
+        """
+        game = self.game
+        balloon = game.balloon
+        flags = ((FLAG_SHIELD if balloon.shield_active else 0) |
+                 (FLAG_SLOWDOWN if balloon.slowdown_active else 0) |
+                 (FLAG_CRASHED if balloon.has_crashed() else 0))
+        world = (_quantize(balloon.x), _quantize(balloon.y), max(0, int(game.current_height)),
+                 max(0, min(255, int(balloon.fuel))), flags)
+        entities = {}
+        for net_id, obstacle in self.obstacle_ids.assign(game.obstacle_manager.obstacles):
+            kind = OBSTACLE_KINDS.get(type(obstacle).__name__)
+            entities[net_id] = (obstacle.kind if kind is None else kind,
+                                _quantize(obstacle.x), _quantize(obstacle.y))
+        for net_id, powerup in self.powerup_ids.assign(game.powerup_manager.powerups):
+            entities[net_id] = (POWERUP_KINDS[type(powerup).__name__],
+                                         _quantize(powerup.x), _quantize(powerup.y))
+        return world, entities
+
+    def publish(self, force=False):
+        """Accept viewers, read acks and send the current snapshot if the rate allows.
+
+        Args:
+            force (bool): Send regardless of the snapshot rate
+        """
+        self._accept()
+        self._read_acks()
+        now = time.perf_counter()
+        if self.viewers and (force or now - self.last_publish >= self.interval):
+            self.last_publish = now
+            self.seq += 1
+            world, entities = self.capture()
+            self.history[self.seq] = entities
+            self.history.pop(self.seq - self.HISTORY, None)
+            encoded = {}  # base seq -> message, shared by viewers on the same base
+            for viewer in self.viewers:
+                if len(viewer.outbox) > self.MAX_BACKLOG:
+                    continue
+                base = viewer.acked if viewer.acked in self.history else NO_BASE
+                message = encoded.get(base)
+                if message is None:
+                    base_entities = {} if base == NO_BASE else self.history[base]
+                    message = encoded[base] = encode_snapshot(self.seq, base, world, entities, base_entities)
+                viewer.outbox += message
+        self._flush()
+
+    def close(self):
+        """Disconnect all viewers and stop listening."""
+        for viewer in self.viewers:
+            viewer.sock.close()
+        self.viewers = []
+        self.listener.close()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, address = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            viewer = _Viewer(sock, address)
+            settings = self.game.settings
+            payload = HELLO.pack(MSG_HELLO, VERSION, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+            viewer.outbox += LENGTH.pack(len(payload)) + payload
+            self.viewers.append(viewer)
+
+    def _read_acks(self):
+        for viewer in list(self.viewers):
+            try:
+                data = viewer.sock.recv(4096)
+            except (BlockingIOError, InterruptedError):
+                continue
+            except OSError:
+                data = b""
+            if not data:
+                self._drop(viewer)
+                continue
+            viewer.inbox += data
+            for payload in _split_messages(viewer):
+                if payload[0] == MSG_ACK:
+                    viewer.acked = ACK.unpack(payload)[1]
+
+    def _flush(self):
+        for viewer in list(self.viewers):
+            if not viewer.outbox:
+                continue
+            try:
+                sent = viewer.sock.send(viewer.outbox)
+            except (BlockingIOError, InterruptedError):
+                continue
+            except OSError:
+                self._drop(viewer)
+                continue
+            del viewer.outbox[:sent]
+            self.bytes_sent += sent
+
+    def _drop(self, viewer):
+        viewer.sock.close()
+        self.viewers.remove(viewer)
+
+
+def _split_messages(connection):
+    """Pop the complete length-prefixed payloads from a connection's inbox."""
+    inbox = connection.inbox
+    offset = 0
+    payloads = []
+    while len(inbox) - offset >= LENGTH.size:
+        (length,) = LENGTH.unpack_from(inbox, offset)
+        if len(inbox) - offset - LENGTH.size < length:
+            break
+        start = offset + LENGTH.size
+        payloads.append(inbox[start:start + length])
+        offset = start + length
+    connection.inbox = inbox[offset:]
+    return payloads
+
+
+# ---------------------------
+# Viewer
+# ---------------------------
+class SpectatorClient:
+    """Receives snapshots from a SpectatorServer and keeps the latest decoded state.
+
+    Attributes:
+        screen_size (tuple): Host screen size from the HELLO message, None until received
+        world (tuple): (balloon x, balloon y, height, fuel, flags) of the latest snapshot
+        entities (dict): Network id -> (kind, x, y) of the latest snapshot
+    """
+    HISTORY = 64
+
+    def __init__(self, host="127.0.0.1", port=8765, timeout=5.0):
+        """Connect to a host.
+
+        Args:
+            host (str): Host address
+            port (int): Host TCP port
+            timeout (float): Connection timeout in seconds
+        """
+        self.sock = socket.create_connection((host, port), timeout)
+        self.sock.setblocking(False)
+        self.inbox = b""
+        self.states = {}  # seq -> (world, entities)
+        self.screen_size = None
+        self.seq = None
+        self.world = None
+        self.entities = {}
+        self.bytes_received = 0
+        self.connected = True
+
+    def poll(self):
+        """Read everything available without blocking and apply complete snapshots.
+
+        Returns:
+            bool: True if a new snapshot was applied
+        """
+        updated = False
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as error:
+                if error.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                data = b""
+            if not data:
+                self.connected = False
+                break
+            self.bytes_received += len(data)
+            self.inbox += data
+        for payload in _split_messages(self):
+            if payload[0] == MSG_HELLO:
+                _, _, width, height = HELLO.unpack(payload)
+                self.screen_size = (width, height)
+            elif payload[0] == MSG_SNAPSHOT:
+                seq, world, entities = decode_snapshot(payload, self.states)
+                self.states[seq] = (world, entities)
+                self.states.pop(seq - self.HISTORY, None)
+                self.seq, self.world, self.entities = seq, world, entities
+                updated = True
+        if updated:
+            try:
+                self.sock.sendall(LENGTH.pack(ACK.size) + ACK.pack(MSG_ACK, self.seq))
+            except OSError:
+                self.connected = False
+        return updated
+
+    def close(self):
+        self.sock.close()
+
+
+def run_viewer(host="127.0.0.1", port=GameSettings.SPECTATOR_PORT, settings=GameSettings):
+    """Open a window showing a hosted game; the viewer only draws received snapshots.
+
+    Args:
+        host (str): Host address
+        port (int): Host TCP port
+        settings (type): GameSettings class or a class derived from it, for the background and FPS
+    """
+    client = SpectatorClient(host, port)
+    while client.screen_size is None and client.connected:
+        client.poll()
+        time.sleep(0.01)
+    if not client.connected:
+        raise ConnectionError("Spectator host {}:{} closed the connection".format(host, port))
+
+    pygame.init()
+    screen = pygame.display.set_mode(client.screen_size)
+    pygame.display.set_caption("Balloon Game - Spectating {}:{}".format(host, port))
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont(None, 24)
+    hud_panel = HudPanel(font, TextCache())
+    background = ParallaxBackground(settings) if settings.PARALLAX_ENABLED else None
+    assets.preload(GAME_IMAGES)
+    assets.convert()
+    images = {kind: assets.get(name) for kind, name in KIND_IMAGES.items()}
+    balloon_image = assets.get("balloon.png")
+    shield_image = assets.get("balloon-shield.png")
+
+    running = True
+    while running and client.connected:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
+                running = False
+        client.poll()
+        if client.world is not None:
+            x, y, height, fuel, flags = client.world
+            if background is not None:
+                background.draw(screen, height)
+            else:
+                screen.fill(settings.SKY_COLOR)
+            screen.blit(balloon_image, (x, y))
+            if flags & FLAG_SHIELD:
+                screen.blit(shield_image, (x - 2, y - 2))
+            # obstacles below power-ups, as on the host
+            for kind, ex, ey in sorted(client.entities.values(), key=lambda entity: entity[0] >= FUEL):
+                screen.blit(images[kind], (ex, ey))
+            lines = ("Spectating: {}m".format(height // 10), "Fuel: {}".format(fuel),
+                     "Shield: {}".format("on" if flags & FLAG_SHIELD else "off"))
+            if flags & FLAG_CRASHED:
+                lines += ("Game Over",)
+            screen.blit(hud_panel.render(lines), (10, 10))
+            pygame.display.flip()
+        clock.tick(settings.FPS)
+    client.close()
+    pygame.quit()
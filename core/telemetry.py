@@ -0,0 +1,258 @@
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # numpy only speeds up TelemetryLog.as_array()
+    np = None
+
+# ------------------------------
+# Telemetry Log Format
+# ------------------------------
+# Header: magic, version, record size, session start (unix seconds)
+# Records: frame, dt, height (m), obstacles, power-ups, obstacle hits,
+#          power-up pickups, crash code, padding (24 bytes each)
+MAGIC = b"BTEL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHd")
+RECORD = struct.Struct("<IffIIBBBx")
+FIELDS = ("frame", "dt", "height", "obstacles", "powerups", "collisions", "pickups", "crash")
+
+CRASH_NONE = 0
+CRASH_COLLISION = 1
+CRASH_FUEL = 2
+CRASH_CODES = {"collision": CRASH_COLLISION, "fuel": CRASH_FUEL}
+
+# High score: magic, height in pixels, CRC32 of the packed height
+HIGH_SCORE = struct.Struct("<4sdI")
+HIGH_SCORE_MAGIC = b"BHSC"
+HIGH_SCORE_FILE = "highscore.bin"
+LEGACY_HIGH_SCORE_FILE = "highest_height.txt"
+
+
+class TelemetryWriter:
+    """Append-only telemetry log written by a background thread.
+
+    record() only enqueues the values with put_nowait(), so the game loop never
+    waits on the disk; when the bounded queue is full the record is dropped and
+    counted in ``dropped``. The writer thread packs and writes records in batches.
+    """
+    BATCH = 256
+
+    def __init__(self, path, queue_size=4096):
+        """Create the log file and start the writer thread.
+
+        Args:
+            path (str): Output file path, must not exist yet
+            queue_size (int): Records buffered before new ones are dropped
+
+        Raises:
+            FileExistsError: If path exists; logs are never overwritten
+        """
+        self.path = path
+        self.frames = 0
+        self.dropped = 0
+        self.queue = queue.Queue(queue_size)
+        self.file = open(path, "xb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, time.time()))
+        self.thread = threading.Thread(target=self._write_loop, name="telemetry-writer", daemon=True)
+        self.thread.start()
+
+    def record(self, dt, height, obstacles, powerups, collisions=0, pickups=0, crash=CRASH_NONE):
+        """Queue one frame record without blocking.
+
+        Args:
+            dt (float): Frame delta time in seconds
+            height (float): Current height in meters
+            obstacles (int): Active obstacles
+            powerups (int): Active power-ups
+            collisions (int): Obstacles the balloon touched this frame
+            pickups (int): Power-ups collected this frame
+            crash (int): CRASH_* code, CRASH_NONE unless the balloon crashed this frame
+        """
+        try:
+            self.queue.put_nowait((self.frames, dt, height, obstacles, powerups, collisions, pickups, crash))
+        except queue.Full:
+            self.dropped += 1
+        self.frames += 1
+
+    def close(self):
+        """Write the remaining records and close the file."""
+        if self.file is None:
+            return
+        self.queue.put(None)
+        self.thread.join()
+        self.file.close()
+        self.file = None
+
+    def _write_loop(self):
+        pack = RECORD.pack
+        get = self.queue.get
+        get_nowait = self.queue.get_nowait
+        while True:
+            item = get()
+            batch = []
+            while item is not None:
+                batch.append(pack(*item))
+                if len(batch) >= self.BATCH:
+                    break
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self.file.write(b"".join(batch))
+                self.file.flush()  # hand the batch to the OS so a crash keeps it
+            if item is None:
+                return
+
+
+class TelemetryLog:
+    """Memory-mapped reader for a telemetry log.
+
+    A trailing partial record left by a crash is ignored.
+    """
+
+    def __init__(self, path):
+        """Map a log file.
+
+        Args:
+            path (str): Log file written by TelemetryWriter
+
+        Raises:
+            ValueError: If the file is not a telemetry log of this version
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            raise ValueError("Not a telemetry log: {}".format(path))
+        magic, version, record_size, self.start_time = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError("Unsupported telemetry log: {}".format(path))
+        self.count = (len(self.data) - HEADER.size) // RECORD.size
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("record index out of range")
+        return RECORD.unpack_from(self.data, HEADER.size + index * RECORD.size)
+
+    def __iter__(self):
+        end = HEADER.size + self.count * RECORD.size
+        return RECORD.iter_unpack(memoryview(self.data)[HEADER.size:end])
+
+    def as_array(self):
+        """Return the records as a NumPy structured array viewing the mapped file.
+
+        Returns:
+            numpy.ndarray: One row per record with the FIELDS columns
+        """
+        if np is None:
+            raise ImportError("TelemetryLog.as_array() requires numpy to be installed.")
+        dtype = np.dtype({"names": list(FIELDS) + ["_pad"],
+                          "formats": ["<u4", "<f4", "<f4", "<u4", "<u4", "u1", "u1", "u1", "u1"]})
+        return np.frombuffer(self.data, dtype=dtype, count=self.count, offset=HEADER.size)
+
+    def summary(self):
+        """Aggregate the log.
+
+        Returns:
+            dict: Frame count, play time, max height, total collisions, pickups and crashes
+        """
+        frames = play_time = max_height = collisions = pickups = crashes = 0
+        for _, dt, height, _, _, hits, picked, crash in self:
+            frames += 1
+            play_time += dt
+            max_height = max(max_height, height)
+            collisions += hits
+            pickups += picked
+            crashes += crash != CRASH_NONE
+        return {"frames": frames, "play_time": play_time, "max_height": max_height,
+                "collisions": collisions, "pickups": pickups, "crashes": crashes}
+
+    def close(self):
+        self.data.close()
+
+
+class TelemetryStore:
+    """Directory holding the telemetry logs and the crash-safe high score."""
+
+    def __init__(self, directory):
+        """Create the store directory if needed.
+
+        Args:
+            directory (str): Store directory
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def open_log(self, queue_size=4096):
+        """Start a new session log.
+
+        Args:
+            queue_size (int): Writer queue bound
+
+        Returns:
+            TelemetryWriter: Writer for session-<timestamp>-<pid>.tlm, with a -<n> suffix
+            when another log of this process started within the same second
+        """
+        base = os.path.join(self.directory, "session-{}-{}".format(time.strftime("%Y%m%d-%H%M%S"), os.getpid()))
+        suffix = 0
+        while True:
+            try:
+                return TelemetryWriter(base + ("-{}.tlm".format(suffix) if suffix else ".tlm"), queue_size)
+            except FileExistsError:
+                suffix += 1
+
+    def load_high_score(self, legacy_path=LEGACY_HIGH_SCORE_FILE):
+        """Return the stored high score, migrating the old text file on first use.
+
+        Args:
+            legacy_path (str): highest_height.txt written by earlier versions
+
+        Returns:
+            float: Highest height in pixels, 0 if none is stored
+        """
+        path = os.path.join(self.directory, HIGH_SCORE_FILE)
+        try:
+            with open(path, "rb") as file:
+                magic, height, checksum = HIGH_SCORE.unpack(file.read(HIGH_SCORE.size))
+            if magic == HIGH_SCORE_MAGIC and checksum == zlib.crc32(struct.pack("<d", height)):
+                return height
+        except (OSError, struct.error):
+            pass
+        if legacy_path and os.path.exists(legacy_path):
+            with open(legacy_path, "r") as file:
+                height = float(file.read() or 0)
+            self.save_high_score(height)
+            return height
+        return 0
+
+    def save_high_score(self, height):
+        """Store the high score atomically: write a temporary file, fsync it and rename it over the old one.
+
+        Args:
+            height (float): Highest height in pixels
+        """
+        path = os.path.join(self.directory, HIGH_SCORE_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(HIGH_SCORE.pack(HIGH_SCORE_MAGIC, height, zlib.crc32(struct.pack("<d", height))))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+        if hasattr(os, "O_DIRECTORY"):  # persist the rename itself on POSIX
+            directory = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
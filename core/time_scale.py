@@ -0,0 +1,154 @@
+from core.timers import TimerService
+
+# ---------------------------
+# Time Groups
+# ---------------------------
+BALLOON = "balloon"
+OBSTACLES = "obstacles"
+POWERUPS = "powerups"
+
+
+class TimeScale:
+    """Global and per-group time scaling for a game session.
+
+    Every entity group advances with its own scaled dt instead of having its
+    speed fields rewritten, so slowdown, pause and fast-forward are O(1) state
+    changes. Effects are keyed: applying the same key again refreshes its
+    duration, while effects with different keys stack multiplicatively on the
+    groups they cover.
+
+    The session's TimerService runs on world time, so pausing or scaling the
+    session also holds or speeds up every timed effect, power-up and spawn.
+    """
+
+    def __init__(self):
+        self.scale = 1.0      # global speed, e.g. 2.0 for fast-forward
+        self.paused = False
+        self.effects = {}     # key -> (factor, groups); durations are ("effect", key) timers
+        self._factors = {}    # group -> product of the active effect factors
+        self.timers = TimerService()
+
+    def set_scale(self, scale):
+        """Set the global speed of the session.
+
+        Args:
+            scale (float): 1.0 for real time, below 1 for slow motion, above 1 for fast-forward
+        """
+        self.scale = scale
+
+    def pause(self):
+        """Freeze every group and every effect timer."""
+        self.paused = True
+
+    def resume(self):
+        """Continue after pause()."""
+        self.paused = False
+
+    # ---------------------------
+    # Effects
+    # ---------------------------
+    def add_effect(self, key, factor, groups, duration=None):
+        """Scale the time of some groups, refreshing the effect if the key is already active.
+
+        Args:
+            key (str): Effect identity, e.g. "slowdown"
+            factor (float): Time multiplier for the covered groups
+            groups (tuple): Group names the effect applies to
+            duration (float): World milliseconds until the effect expires, None until removed
+        """
+        self.effects[key] = (factor, tuple(groups))
+        self._recompute()
+        if duration is None:
+            self.timers.cancel(("effect", key))
+        else:
+            self.timers.schedule(("effect", key), duration, lambda: self.remove_effect(key))
+
+    def remove_effect(self, key):
+        """End an effect early; unknown keys are ignored.
+
+        Args:
+            key (str): Effect identity
+        """
+        if self.effects.pop(key, None) is not None:
+            self.timers.cancel(("effect", key))
+            self._recompute()
+
+    def remaining(self, key):
+        """Return the milliseconds left on an effect.
+
+        Args:
+            key (str): Effect identity
+
+        Returns:
+            float: Remaining time, 0 if inactive and infinity if it has no duration
+        """
+        if key not in self.effects:
+            return 0
+        timer = ("effect", key)
+        return self.timers.remaining(timer) if self.timers.active(timer) else float("inf")
+
+    def clear(self):
+        """Drop all effects and return to unpaused real time; other timers keep running."""
+        self.scale = 1.0
+        self.paused = False
+        for key in self.effects:
+            self.timers.cancel(("effect", key))
+        self.effects.clear()
+        self._factors = {}
+
+    def reset(self):
+        """Return to a fresh session: no effects, real time and no pending timers at all."""
+        self.clear()
+        self.timers.reset()
+
+    def _recompute(self):
+        factors = {}
+        for factor, groups in self.effects.values():
+            for group in groups:
+                factors[group] = factors.get(group, 1.0) * factor
+        self._factors = factors
+
+    # ---------------------------
+    # Scaled Time
+    # ---------------------------
+    def update(self, dt):
+        """Advance the session timers by the world time that passed, expiring effects and firing callbacks.
+
+        Args:
+            dt (float): Real delta time in seconds
+        """
+        self.timers.advance(self.world_dt(dt) * 1000)
+
+    def world_dt(self, dt):
+        """Return dt after the global scale and pause.
+
+        Args:
+            dt (float): Real delta time in seconds
+
+        Returns:
+            float: World delta time in seconds
+        """
+        return 0.0 if self.paused else dt * self.scale
+
+    def factor(self, group):
+        """Return the combined effect multiplier of a group.
+
+        Args:
+            group (str): Group name
+
+        Returns:
+            float: Multiplier applied on top of world time
+        """
+        return self._factors.get(group, 1.0)
+
+    def dt(self, group, dt):
+        """Return the delta time a group advances by.
+
+        Args:
+            group (str): Group name
+            dt (float): Real delta time in seconds
+
+        Returns:
+            float: Scaled delta time in seconds
+        """
+        return self.world_dt(dt) * self._factors.get(group, 1.0)
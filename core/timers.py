@@ -0,0 +1,135 @@
+import heapq
+import itertools
+
+_STALE = object()  # key of replaced and cancelled heap entries
+
+
+# ---------------------------
+# Timer Service
+# ---------------------------
+class TimerService:
+    """Keyed one-shot and repeating timers on a min-heap of deadlines.
+
+    advance() only pops the timers that expired, so a frame costs
+    O(expired * log n) however many timers are pending. Every timer has a key:
+    scheduling an active key again refreshes it (or extends it with
+    ``stack=True``) and cancel() removes it. Replaced and cancelled heap
+    entries are skipped lazily when they surface, and the heap is rebuilt once
+    they make up most of it.
+    """
+
+    def __init__(self):
+        self.now = 0.0      # milliseconds advanced so far
+        self.heap = []      # [deadline, order, key, callback] entries, including stale ones
+        self.timers = {}    # key -> live heap entry
+        self._order = itertools.count()  # breaks deadline ties in scheduling order
+
+    def schedule(self, key, delay, callback=None, stack=False):
+        """Start a timer, refreshing it if the key is already active.
+
+        The callback runs from advance() once the deadline passes. If it
+        returns a number, the timer repeats that many milliseconds after the
+        expired deadline, so repeating timers keep an exact average rate.
+
+        Args:
+            key (hashable): Timer identity, e.g. "shield"
+            delay (float): Milliseconds until the deadline
+            callback (callable): Called without arguments on expiry, may return the next delay
+            stack (bool): Add delay to the remaining time of an active timer instead of resetting it
+
+        Raises:
+            ValueError: If delay is not positive
+        """
+        if delay <= 0:
+            raise ValueError("Timer delay must be positive, got {!r} for {!r}".format(delay, key))
+        current = self.timers.get(key)
+        deadline = self.now + delay
+        if current is not None:
+            if stack:
+                deadline = current[0] + delay
+            if callback is None:
+                callback = current[3]
+            current[2] = _STALE
+        entry = [deadline, next(self._order), key, callback]
+        self.timers[key] = entry
+        heapq.heappush(self.heap, entry)
+        self._compact()
+
+    def cancel(self, key):
+        """Stop a timer without running its callback; unknown keys are ignored.
+
+        Args:
+            key (hashable): Timer identity
+
+        Returns:
+            bool: True if an active timer was cancelled
+        """
+        entry = self.timers.pop(key, None)
+        if entry is None:
+            return False
+        entry[2] = _STALE
+        self._compact()
+        return True
+
+    def active(self, key):
+        """Return True while a timer is pending.
+
+        Args:
+            key (hashable): Timer identity
+        """
+        return key in self.timers
+
+    def remaining(self, key):
+        """Return the milliseconds left on a timer.
+
+        Args:
+            key (hashable): Timer identity
+
+        Returns:
+            float: Time until the deadline, 0 if the timer is not active
+        """
+        entry = self.timers.get(key)
+        return 0 if entry is None else max(0.0, entry[0] - self.now)
+
+    def advance(self, elapsed):
+        """Move time forward and run the callbacks of the expired timers in deadline order.
+
+        Args:
+            elapsed (float): Milliseconds that passed
+
+        Raises:
+            ValueError: If a repeating callback returns a delay that is not positive,
+                which would expire again at once and never let the loop end
+        """
+        self.now += elapsed
+        while self.heap and self.heap[0][0] <= self.now:  # callbacks may compact and replace the heap
+            entry = heapq.heappop(self.heap)
+            deadline, _, key, callback = entry
+            if key is _STALE:
+                continue
+            del self.timers[key]
+            delay = callback() if callback is not None else None
+            if delay is not None and key not in self.timers:  # the callback may have rescheduled it
+                if delay <= 0:
+                    raise ValueError("Repeat delay must be positive, got {!r} for {!r}".format(delay, key))
+                entry = [deadline + delay, next(self._order), key, callback]
+                self.timers[key] = entry
+                heapq.heappush(self.heap, entry)
+
+    def clear(self):
+        """Cancel every timer."""
+        self.heap = []
+        self.timers = {}
+
+    def reset(self):
+        """Cancel every timer and restart the clock at zero, as for a new session."""
+        self.clear()
+        self.now = 0.0
+
+    def __len__(self):
+        return len(self.timers)
+
+    def _compact(self):
+        if len(self.heap) > 2 * len(self.timers) + 16:
+            self.heap = [entry for entry in self.heap if entry[2] is not _STALE]
+            heapq.heapify(self.heap)
@@ -0,0 +1,353 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is only required for the vectorized environments
+    np = None
+
+from core.assets import assets
+from core.settings import GameSettings
+from core.recording import INPUT_LEFT, INPUT_RIGHT, quantize_dt
+from core.vector_obstacles import BIRD, CLOUD, OBSTACLE_TYPES, step_obstacles
+
+# ------------------------------------
+# Power-up type codes
+# ------------------------------------
+FUEL = 0
+SHIELD = 1
+SLOWDOWN = 2
+
+POWERUP_SIZE = 50     # PowerUp default width and height
+BALLOON_WIDTH = 100   # Balloon bounding box
+BALLOON_HEIGHT = 160
+
+
+def mask_array(mask):
+    """Convert a collision mask to a boolean array indexed [y, x].
+
+    Args:
+        mask (pygame.mask.Mask): Mask of the opaque pixels
+
+    Returns:
+        numpy.ndarray: (height, width) array, True where the sprite is opaque
+    """
+    width, height = mask.get_size()
+    return np.array([[mask.get_at((x, y)) for x in range(width)] for y in range(height)], dtype=bool)
+
+
+class BalloonVectorEnv:
+    """K independent balloon games advanced together by one step(actions) call.
+
+    Balloon, obstacle and power-up state of all games live in shared NumPy
+    arrays of shape (K,) or (K, slots). The rules follow the game:
+
+    - Balloon.update: fuel burn (crash on the frame after it runs out), shield
+      and slowdown countdowns, horizontal clamping
+    - Bird/Cloud movement: step_obstacles, the same vectorized rule the NumPy
+      obstacle backend uses
+    - ObstacleManager/PowerUpManager spawning, with the spawn curves and
+      every spawn that came due this step, and off-screen culling
+    - CollisionManager: obstacles are checked before power-ups; a shield
+      absorbs and removes obstacles, otherwise the balloon crashes. With
+      PIXEL_COLLISIONS, AABB hits are confirmed on the same alpha masks
+
+    Slowdown is applied as a 0.5 time scale on obstacle movement while it is
+    active. Actions use the recording input bits: 0 none, INPUT_LEFT,
+    INPUT_RIGHT or both. Finished games are reset automatically.
+    """
+
+    def __init__(self, num_envs, seed=None, settings=GameSettings, dt=None,
+                 max_obstacles=16, max_powerups=8, max_steps=None):
+        """Allocate the shared state arrays and reset every game.
+
+        Args:
+            num_envs (int): Number of games K
+            seed (int): Seed of the shared random generator
+            settings (type): GameSettings class or a class derived from it
+            dt (float): Step length in seconds, defaults to the game's TICK_RATE tick
+            max_obstacles (int): Obstacle slots per game; spawns into a full game are skipped
+            max_powerups (int): Power-up slots per game
+            max_steps (int): Optional episode length after which a game is truncated
+        """
+        if np is None:
+            raise ImportError("BalloonVectorEnv requires numpy to be installed.")
+        self.num_envs = num_envs
+        self.settings = settings
+        self.dt = dt if dt is not None else quantize_dt(1.0 / settings.TICK_RATE)
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+
+        k, m, p = num_envs, max_obstacles, max_powerups
+        self.balloon_x = np.zeros(k)
+        self.balloon_y = settings.SCREEN_HEIGHT - BALLOON_HEIGHT - 100
+        self.fuel = np.zeros(k)
+        self.shield_timer = np.zeros(k)
+        self.slowdown_timer = np.zeros(k)
+        self.height = np.zeros(k)
+        self.steps = np.zeros(k, dtype=np.int64)
+        self.obstacle_spawn_timer = np.zeros(k)
+        self.powerup_spawn_timer = np.zeros(k)
+
+        self.obstacle_x = np.zeros((k, m))
+        self.obstacle_y = np.zeros((k, m))
+        self.obstacle_speed_x = np.zeros((k, m))
+        self.obstacle_speed_y = np.zeros((k, m))
+        self.obstacle_width = np.zeros((k, m))
+        self.obstacle_height = np.zeros((k, m))
+        self.obstacle_kind = np.zeros((k, m), dtype=np.int8)
+        self.obstacle_alive = np.zeros((k, m), dtype=bool)
+
+        self.powerup_x = np.zeros((k, p))
+        self.powerup_y = np.zeros((k, p))
+        self.powerup_kind = np.zeros((k, p), dtype=np.int8)
+        self.powerup_alive = np.zeros((k, p), dtype=bool)
+
+        # Per-type obstacle constants indexed by type code
+        self._type_width = np.array([OBSTACLE_TYPES[t][0] for t in (BIRD, CLOUD)], dtype=float)
+        self._type_height = np.array([OBSTACLE_TYPES[t][1] for t in (BIRD, CLOUD)], dtype=float)
+        self._type_speed = np.array([getattr(settings, OBSTACLE_TYPES[t][2]) for t in (BIRD, CLOUD)], dtype=float)
+
+        # Spawn interval curves as sorted (height in meters, interval in ms) columns for np.interp
+        self._obstacle_curve = self._curve(settings.OBSTACLE_SPAWN_CURVE)
+        self._powerup_curve = self._curve(settings.POWERUP_SPAWN_CURVE)
+
+        # Alpha masks cropped to the hitboxes like the entities' own, indexed by type code
+        self._balloon_mask = None
+        if settings.PIXEL_COLLISIONS:
+            self._balloon_mask = mask_array(assets.mask("balloon.png", (BALLOON_WIDTH, BALLOON_HEIGHT)))
+            self._obstacle_masks = [mask_array(assets.mask(name, OBSTACLE_TYPES[t][:2]))
+                                    for t, name in ((BIRD, "bird.png"), (CLOUD, "cloud.png"))]
+            self._powerup_masks = [mask_array(assets.mask(name, (POWERUP_SIZE, POWERUP_SIZE)))
+                                   for name in ("fuel.png", "shield.png", "slowdown.png")]
+
+        self.reset()
+
+    # ------------------------------------
+    # Episode control
+    # ------------------------------------
+    def reset(self, mask=None):
+        """Reset the selected games (all by default) to the Balloon/manager start state.
+
+        Args:
+            mask (numpy.ndarray): Boolean (K,) selection of games to reset
+
+        Returns:
+            numpy.ndarray: Observations of all games
+        """
+        if mask is None:
+            mask = np.ones(self.num_envs, dtype=bool)
+        s = self.settings
+        self.balloon_x[mask] = s.SCREEN_WIDTH // 2 - BALLOON_WIDTH // 2
+        self.fuel[mask] = s.FUEL_MAX_FILL
+        self.shield_timer[mask] = 0
+        self.slowdown_timer[mask] = 0
+        self.height[mask] = 0
+        self.steps[mask] = 0
+        self.obstacle_spawn_timer[mask] = 0
+        self.powerup_spawn_timer[mask] = 0
+        self.obstacle_alive[mask] = False
+        self.powerup_alive[mask] = False
+        return self.observe()
+
+    def step(self, actions):
+        """Advance every game by one frame.
+
+        Args:
+            actions (array-like): (K,) input bits per game
+
+        Returns:
+            tuple: (observations, rewards, dones, info). Rewards are meters climbed
+            this step. info holds "final_height" (meters, NaN for running games)
+            and "cause" (0 running, 1 collision, 2 fuel, 3 truncated) of the
+            games that finished before being reset.
+        """
+        s = self.settings
+        dt = self.dt
+        actions = np.asarray(actions)
+
+        # GameLoop.apply_input
+        speed = s.BALLOON_HORIZONTAL_SPEED * dt
+        self.balloon_x -= np.where(actions & INPUT_LEFT, speed, 0.0)
+        self.balloon_x += np.where(actions & INPUT_RIGHT, speed, 0.0)
+
+        # Balloon.update
+        out_of_fuel = self.fuel <= 0
+        self.fuel -= np.where(out_of_fuel, 0.0, s.FUEL_CONSUMPTION_RATE * dt)
+        np.maximum(self.shield_timer - dt * 1000, 0, out=self.shield_timer)
+        np.maximum(self.slowdown_timer - dt * 1000, 0, out=self.slowdown_timer)
+        slowed = self.slowdown_timer > 0
+        np.clip(self.balloon_x, 0, s.SCREEN_WIDTH - BALLOON_WIDTH, out=self.balloon_x)
+
+        # ObstacleManager.update with slowdown as a time scale on movement
+        self._spawn_obstacles(dt)
+        obstacle_dt = np.where(slowed, s.SLOWDOWN_FACTOR * dt, dt)[:, None]
+        step_obstacles(self.obstacle_x, self.obstacle_y, self.obstacle_speed_x, self.obstacle_speed_y,
+                       self.obstacle_width, obstacle_dt, s.SCREEN_WIDTH)
+        self.obstacle_alive &= self.obstacle_y <= s.SCREEN_HEIGHT
+
+        # PowerUpManager.update
+        self._spawn_powerups(dt)
+        self.powerup_y += s.BACKGROUND_SPEED * dt
+        self.powerup_alive &= self.powerup_y <= s.SCREEN_HEIGHT
+
+        # CollisionManager.check_collisions
+        collided = self._collide_obstacles()
+        self._collect_powerups()
+
+        # GameLoop.update height tracking
+        climbed = s.BACKGROUND_SPEED * dt
+        self.height += climbed
+        self.steps += 1
+
+        cause = np.zeros(self.num_envs, dtype=np.int8)
+        cause[collided] = 1
+        cause[out_of_fuel] = 2  # Balloon.update crashes on fuel before collisions are checked
+        if self.max_steps is not None:
+            cause[(cause == 0) & (self.steps >= self.max_steps)] = 3
+        dones = cause != 0
+        rewards = np.full(self.num_envs, climbed / 10)
+
+        final_height = np.where(dones, self.height / 10, np.nan)
+        if dones.any():
+            self.reset(dones)
+        return self.observe(), rewards, dones, {"final_height": final_height, "cause": cause}
+
+    # ------------------------------------
+    # Rules
+    # ------------------------------------
+    @staticmethod
+    def _curve(points):
+        if not points:
+            return None
+        heights, intervals = zip(*sorted(points))
+        return np.array(heights, dtype=float), np.array(intervals, dtype=float)
+
+    def _due_spawns(self, timer, interval, curve, dt):
+        """Advance a (K,) spawn timer and return how many spawns came due in each game.
+
+        The interval follows the curve at each game's height like
+        SpawnScheduler.interval_at, and every elapsed interval counts, so a
+        long step spawns a batch as the managers do.
+        """
+        timer += dt * 1000
+        if curve is not None:
+            interval = np.interp(self.height / 10, *curve)  # held constant outside the points
+        due = np.floor_divide(timer, interval)
+        np.fmod(timer, interval, out=timer)  # keep the remainder; an infinite interval never spawns
+        return due.astype(np.int64)
+
+    def _free_slots(self, alive, due):
+        """Return (env indices, slot indices) of the first free slot in each due game that has one."""
+        has_free = ~alive.all(axis=1) & due
+        envs = np.flatnonzero(has_free)
+        return envs, np.argmin(alive[envs], axis=1)
+
+    def _spawn_obstacles(self, dt):
+        s = self.settings
+        due = self._due_spawns(self.obstacle_spawn_timer, s.OBSTACLE_SPAWN_INTERVAL, self._obstacle_curve, dt)
+        for batch in range(due.max(initial=0)):
+            self._spawn_obstacle_slots(*self._free_slots(self.obstacle_alive, due > batch))
+
+    def _spawn_obstacle_slots(self, envs, slots):
+        s = self.settings
+        if not len(envs):
+            return
+        kinds = self.rng.integers(0, 2, len(envs))
+        self.obstacle_x[envs, slots] = self.rng.integers(0, s.SCREEN_WIDTH - 50, len(envs), endpoint=True)
+        self.obstacle_y[envs, slots] = -50
+        self.obstacle_kind[envs, slots] = kinds
+        self.obstacle_speed_x[envs, slots] = self._type_speed[kinds]
+        self.obstacle_speed_y[envs, slots] = s.OBSTACLE_SPEED
+        self.obstacle_width[envs, slots] = self._type_width[kinds]
+        self.obstacle_height[envs, slots] = self._type_height[kinds]
+        self.obstacle_alive[envs, slots] = True
+
+    def _spawn_powerups(self, dt):
+        s = self.settings
+        due = self._due_spawns(self.powerup_spawn_timer, s.POWERUP_SPAWN_INTERVAL, self._powerup_curve, dt)
+        for batch in range(due.max(initial=0)):
+            self._spawn_powerup_slots(*self._free_slots(self.powerup_alive, due > batch))
+
+    def _spawn_powerup_slots(self, envs, slots):
+        s = self.settings
+        if not len(envs):
+            return
+        self.powerup_x[envs, slots] = self.rng.integers(50, s.SCREEN_WIDTH - 50, len(envs), endpoint=True)
+        self.powerup_y[envs, slots] = -50
+        self.powerup_kind[envs, slots] = self.rng.integers(0, 3, len(envs))
+        self.powerup_alive[envs, slots] = True
+
+    def _overlaps(self, x, y, width, height):
+        """Entity.collides_with of every balloon against (K, slots) boxes."""
+        bx = self.balloon_x[:, None]
+        by = self.balloon_y
+        return ((bx < x + width) & (bx + BALLOON_WIDTH > x) &
+                (by < y + height) & (by + BALLOON_HEIGHT > y))
+
+    def _confirm_pixels(self, hits, x, y, kinds, masks):
+        """masks_overlap on every AABB hit: clear the hits whose opaque pixels do not touch the balloon's."""
+        balloon = self._balloon_mask
+        height, width = balloon.shape
+        by = int(self.balloon_y)
+        for env, slot in zip(*np.nonzero(hits)):
+            mask = masks[kinds[env, slot]]
+            dx = int(x[env, slot]) - int(self.balloon_x[env])
+            dy = int(y[env, slot]) - by
+            x0, x1 = max(0, dx), min(width, dx + mask.shape[1])
+            y0, y1 = max(0, dy), min(height, dy + mask.shape[0])
+            if x0 >= x1 or y0 >= y1 or not (balloon[y0:y1, x0:x1] & mask[y0 - dy:y1 - dy, x0 - dx:x1 - dx]).any():
+                hits[env, slot] = False
+        return hits
+
+    def _collide_obstacles(self):
+        hits = self.obstacle_alive & self._overlaps(self.obstacle_x, self.obstacle_y,
+                                                    self.obstacle_width, self.obstacle_height)
+        if self._balloon_mask is not None and hits.any():
+            self._confirm_pixels(hits, self.obstacle_x, self.obstacle_y, self.obstacle_kind, self._obstacle_masks)
+        shielded = self.shield_timer > 0
+        self.obstacle_alive &= ~(hits & shielded[:, None])
+        return hits.any(axis=1) & ~shielded
+
+    def _collect_powerups(self):
+        s = self.settings
+        hits = self.powerup_alive & self._overlaps(self.powerup_x, self.powerup_y,
+                                                   POWERUP_SIZE, POWERUP_SIZE)
+        if self._balloon_mask is not None and hits.any():
+            self._confirm_pixels(hits, self.powerup_x, self.powerup_y, self.powerup_kind, self._powerup_masks)
+        if not hits.any():
+            return
+        kinds = self.powerup_kind
+        fuel_count = (hits & (kinds == FUEL)).sum(axis=1)
+        np.minimum(self.fuel + s.FUEL_POWER_UP * fuel_count, s.FUEL_MAX_FILL, out=self.fuel)
+        self.shield_timer[(hits & (kinds == SHIELD)).any(axis=1)] = s.SHIELD_DURATION
+        self.slowdown_timer[(hits & (kinds == SLOWDOWN)).any(axis=1)] = s.SLOWDOWN_DURATION
+        self.powerup_alive &= ~hits
+
+    # ------------------------------------
+    # Observations
+    # ------------------------------------
+    def observe(self):
+        """Return a (K, features) float32 observation matrix.
+
+        Features: balloon x, fuel, shield and slowdown seconds, then per
+        obstacle slot (alive, dx, dy, width, height) and per power-up slot
+        (alive, dx, dy, kind), with positions relative to the balloon and
+        lengths normalized by the screen width.
+
+        Returns:
+            numpy.ndarray: Observations
+        """
+        s = self.settings
+        scale = 1.0 / s.SCREEN_WIDTH
+        bx = self.balloon_x[:, None]
+        by = self.balloon_y
+        balloon = np.stack([self.balloon_x * scale, self.fuel / s.FUEL_MAX_FILL,
+                            self.shield_timer / 1000, self.slowdown_timer / 1000], axis=1)
+        alive = self.obstacle_alive
+        obstacles = np.stack([alive, (self.obstacle_x - bx) * scale, (self.obstacle_y - by) * scale,
+                              self.obstacle_width * scale, self.obstacle_height * scale], axis=2)
+        obstacles[~alive] = 0
+        alive = self.powerup_alive
+        powerups = np.stack([alive, (self.powerup_x - bx) * scale, (self.powerup_y - by) * scale,
+                             self.powerup_kind], axis=2)
+        powerups[~alive] = 0
+        return np.concatenate([balloon, obstacles.reshape(self.num_envs, -1),
+                               powerups.reshape(self.num_envs, -1)], axis=1).astype(np.float32)
@@ -0,0 +1,373 @@
+import random
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only required for the vectorized backend
+    np = None
+
+from core.settings import GameSettings
+from core.assets import assets
+from core.spawn_scheduler import SpawnScheduler
+from core.time_scale import TimeScale, OBSTACLES
+
+# ------------------------------------
+# Obstacle type codes
+# ------------------------------------
+BIRD = 0
+CLOUD = 1
+
+# (width, height, horizontal speed setting) per type code, mirroring Bird and Cloud
+OBSTACLE_TYPES = {
+    BIRD: (50, 50, "OBSTACLE_SPEED_BIRD"),
+    CLOUD: (100, 60, "OBSTACLE_SPEED_CLOUD"),
+}
+
+
+def step_obstacles(x, y, speed_x, speed_y, width, dt, screen_width):
+    """Move obstacles and bounce them off the horizontal screen edges in place.
+
+    Vectorized form of Bird.update / Cloud.update operating on whole arrays.
+
+    Args:
+        x, y, speed_x, speed_y, width (numpy.ndarray): Obstacle columns
+        dt (float): Delta time in seconds
+        screen_width (int): Screen width in pixels
+    """
+    y += speed_y * dt
+    x += speed_x * dt
+    bounce = (x <= 0) | (x + width >= screen_width)
+    np.negative(speed_x, out=speed_x, where=bounce)
+
+
+class ObstacleView:
+    """Lightweight entity-like view on one row of a VectorObstacleManager.
+
+    Exposes the attributes Entity.collides_with and the power-ups rely on, so
+    CollisionManager and Balloon work unchanged against the array backend.
+    A view is valid until the next VectorObstacleManager.update compacts the arrays.
+    """
+    __slots__ = ("manager", "index")
+
+    def __init__(self, manager, index):
+        self.manager = manager
+        self.index = index
+
+    def _column(name):
+        def getter(self):
+            return float(getattr(self.manager, name)[self.index])
+
+        def setter(self, value):
+            getattr(self.manager, name)[self.index] = value
+        return property(getter, setter)
+
+    x = _column("x")
+    y = _column("y")
+    width = _column("width")
+    height = _column("height")
+    speed_x = _column("speed_x")
+    speed_y = _column("speed_y")
+    prev_x = _column("prev_x")
+    prev_y = _column("prev_y")
+    del _column
+
+    @property
+    def kind(self):
+        return int(self.manager.kind[self.index])
+
+    @property
+    def uid(self):
+        """int: Spawn counter value, stable while the row moves during compaction."""
+        return int(self.manager.uid[self.index])
+
+    @property
+    def image(self):
+        return self.manager.images[self.kind]
+
+    @property
+    def mask(self):
+        return self.manager.masks[self.kind]
+
+    def collides_with(self, other):
+        """AABB check mirroring Entity.collides_with."""
+        return (self.x < other.x + other.width and
+                self.x + self.width > other.x and
+                self.y < other.y + other.height and
+                self.y + self.height > other.y)
+
+    def render_position(self, alpha=1.0):
+        """Interpolated position, see Entity.render_position."""
+        if alpha >= 1.0:
+            return self.x, self.y
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def draw(self, surface, alpha=1.0):
+        surface.blit(self.image, self.render_position(alpha))
+
+    def __eq__(self, other):
+        return (isinstance(other, ObstacleView) and
+                other.manager is self.manager and other.index == self.index)
+
+    def __hash__(self):
+        return hash((id(self.manager), self.index))
+
+
+class ObstacleArray:
+    """List-like sequence of live obstacles backed by the manager's arrays."""
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def _live_indices(self):
+        m = self.manager
+        return np.flatnonzero(m.alive[:m.count]).tolist()
+
+    def __iter__(self):
+        m = self.manager
+        return (ObstacleView(m, i) for i in self._live_indices())
+
+    def __len__(self):
+        m = self.manager
+        return int(np.count_nonzero(m.alive[:m.count]))
+
+    def __getitem__(self, item):
+        views = [ObstacleView(self.manager, i) for i in self._live_indices()]
+        return views[item]
+
+    def remove(self, obstacle):
+        """Mark an obstacle as removed; the row is compacted on the next update.
+
+        Args:
+            obstacle (ObstacleView): Obstacle to remove
+        """
+        m = self.manager
+        if obstacle.manager is not m or not m.alive[obstacle.index]:
+            raise ValueError("obstacle not in manager")
+        m.alive[obstacle.index] = False
+
+
+class VectorObstacleManager:
+    """Struct-of-arrays obstacle manager with vectorized movement, bounce and culling.
+
+    Drop-in replacement for ObstacleManager: spawning follows the same rules,
+    while positions, speeds, sizes and types live in contiguous NumPy arrays.
+    """
+    INITIAL_CAPACITY = 64
+
+    def __init__(self, settings=GameSettings, rng=None, time_scale=None):
+        if np is None:
+            raise ImportError("The 'numpy' obstacle backend requires numpy to be installed.")
+        self.settings = settings
+        self.rng = rng or random  # per-session random.Random, or the global module
+        self.time_scale = time_scale or TimeScale()
+        self.owns_time_scale = time_scale is None  # a private time scale is advanced by update()
+        # batch spawns draw from a NumPy generator seeded by the session rng
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.spawner = SpawnScheduler(settings.OBSTACLE_SPAWN_INTERVAL, settings.OBSTACLE_SPAWN_CURVE,
+                                      self.time_scale.timers, ("spawn", OBSTACLES))
+        self.count = 0
+        self.spawned = 0  # next uid
+        kinds = sorted(OBSTACLE_TYPES)
+        self.type_width = np.array([OBSTACLE_TYPES[k][0] for k in kinds], dtype=np.float64)
+        self.type_height = np.array([OBSTACLE_TYPES[k][1] for k in kinds], dtype=np.float64)
+        self.type_speed_x = np.array([getattr(settings, OBSTACLE_TYPES[k][2]) for k in kinds],
+                                     dtype=np.float64)
+        self.images = {BIRD: assets.get("bird.png"), CLOUD: assets.get("cloud.png")}
+        # sprite sizes by kind for culling; the images are larger than the hitboxes
+        self.image_width = np.array([self.images[k].get_width() for k in kinds], dtype=np.float64)
+        self.image_height = np.array([self.images[k].get_height() for k in kinds], dtype=np.float64)
+        self.masks = {BIRD: assets.mask("bird.png", OBSTACLE_TYPES[BIRD][:2]),
+                      CLOUD: assets.mask("cloud.png", OBSTACLE_TYPES[CLOUD][:2])}
+        self._allocate(self.INITIAL_CAPACITY)
+        self.obstacles = ObstacleArray(self)
+
+    def _allocate(self, capacity):
+        """(Re)allocate the column arrays, keeping the first self.count rows."""
+        n = self.count
+        columns = {}
+        for name in ("x", "y", "prev_x", "prev_y", "speed_x", "speed_y", "width", "height"):
+            column = np.zeros(capacity, dtype=np.float64)
+            if n:
+                column[:n] = getattr(self, name)[:n]
+            columns[name] = column
+        kind = np.zeros(capacity, dtype=np.int8)
+        uid = np.zeros(capacity, dtype=np.int64)
+        alive = np.zeros(capacity, dtype=bool)
+        if n:
+            kind[:n] = self.kind[:n]
+            uid[:n] = self.uid[:n]
+            alive[:n] = self.alive[:n]
+        for name, column in columns.items():
+            setattr(self, name, column)
+        self.kind = kind
+        self.uid = uid
+        self.alive = alive
+
+    def update(self, dt, height=0):
+        """Update obstacle state including:
+        - Advancing the time scale if the manager created its own
+        - Spawning every obstacle whose spawn timer expired in one batch
+        - Moving and bouncing all obstacles in one vectorized step with the obstacle group's scaled dt
+        - Removing off-screen and collided obstacles
+
+        Args:
+            dt (float): World delta time in seconds
+            height (float): Climbed height in meters, selects the spawn rate on the curve
+        """
+        if self.owns_time_scale:
+            self.time_scale.update(dt)
+        due = self.spawner.take(height)
+        if due:
+            self.spawn_many(due)
+
+        n = self.count
+        if not n:
+            return
+        self.prev_x[:n] = self.x[:n]  # start of the tick, for render interpolation
+        self.prev_y[:n] = self.y[:n]
+        step_obstacles(self.x[:n], self.y[:n], self.speed_x[:n], self.speed_y[:n],
+                       self.width[:n], dt * self.time_scale.factor(OBSTACLES), self.settings.SCREEN_WIDTH)
+
+        keep = self.alive[:n] & (self.y[:n] <= self.settings.SCREEN_HEIGHT)
+        if not keep.all():
+            kept = int(np.count_nonzero(keep))
+            for name in ("x", "y", "prev_x", "prev_y", "speed_x", "speed_y", "width", "height", "kind", "uid"):
+                column = getattr(self, name)
+                column[:kept] = column[:n][keep]
+            self.alive[:kept] = True
+            self.alive[kept:n] = False
+            self.count = kept
+
+    def query_rect(self, x, y, width, height):
+        """Return views of the live obstacles overlapping a rectangle.
+
+        Args:
+            x (float): Rectangle x-coordinate
+            y (float): Rectangle y-coordinate
+            width (float): Rectangle width
+            height (float): Rectangle height
+
+        Returns:
+            list[ObstacleView]: Overlapping obstacles in array order
+        """
+        n = self.count
+        ox, oy = self.x[:n], self.y[:n]
+        hit = (self.alive[:n] &
+               (ox < x + width) & (ox + self.width[:n] > x) &
+               (oy < y + height) & (oy + self.height[:n] > y))
+        return [ObstacleView(self, i) for i in np.flatnonzero(hit).tolist()]
+
+    def remove_many(self, obstacles):
+        """Mark several obstacles as removed; rows are compacted on the next update.
+
+        Args:
+            obstacles (iterable[ObstacleView]): Obstacles to remove
+        """
+        self.alive[[o.index for o in obstacles]] = False
+
+    def reset(self):
+        """Drop every obstacle, keeping the allocated columns, and restart the spawn timer for a new session."""
+        self.alive[:self.count] = False
+        self.count = 0
+        self.spawner.reset()
+
+    def spawn_obstacle(self):
+        """Spawn a randomly chosen obstacle at a random x and y = -50"""
+        self.spawn_many(1)
+
+    def spawn_many(self, count):
+        """Spawn a batch of random obstacles at y = -50 with array operations only.
+
+        Args:
+            count (int): Number of obstacles to spawn
+        """
+        kinds = self.np_rng.integers(0, len(OBSTACLE_TYPES), count)
+        xs = self.np_rng.integers(0, self.settings.SCREEN_WIDTH - 50, count, endpoint=True)
+        self.add_obstacles(kinds, xs, np.full(count, -50.0))
+
+    def add_obstacle(self, kind, x, y):
+        """Append one obstacle row.
+
+        Args:
+            kind (int): BIRD or CLOUD
+            x (float): X-coordinate position
+            y (float): Y-coordinate position
+        """
+        if self.count == len(self.x):
+            self._allocate(2 * len(self.x))
+        width, height, speed_setting = OBSTACLE_TYPES[kind]
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.speed_x[i] = getattr(self.settings, speed_setting)
+        self.speed_y[i] = self.settings.OBSTACLE_SPEED
+        self.width[i] = width
+        self.height[i] = height
+        self.kind[i] = kind
+        self.uid[i] = self.spawned
+        self.spawned += 1
+        self.alive[i] = True
+        self.count += 1
+
+    def add_obstacles(self, kinds, xs, ys):
+        """Append several obstacle rows at once.
+
+        Args:
+            kinds (numpy.ndarray): BIRD or CLOUD per row
+            xs (numpy.ndarray): X-coordinate positions
+            ys (numpy.ndarray): Y-coordinate positions
+        """
+        start = self.count
+        end = start + len(kinds)
+        if end > len(self.x):
+            capacity = len(self.x)
+            while capacity < end:
+                capacity *= 2
+            self._allocate(capacity)
+        self.x[start:end] = self.prev_x[start:end] = xs
+        self.y[start:end] = self.prev_y[start:end] = ys
+        self.speed_x[start:end] = self.type_speed_x[kinds]
+        self.speed_y[start:end] = self.settings.OBSTACLE_SPEED
+        self.width[start:end] = self.type_width[kinds]
+        self.height[start:end] = self.type_height[kinds]
+        self.kind[start:end] = kinds
+        self.uid[start:end] = np.arange(self.spawned, self.spawned + len(kinds))
+        self.spawned += len(kinds)
+        self.alive[start:end] = True
+        self.count = end
+
+    def collect(self, items, alpha=1.0):
+        """Append the live, on-screen obstacles to a display list.
+
+        Interpolation and culling run as array operations; only the visible
+        rows are turned into (image, position) pairs.
+
+        Args:
+            items (list): Display list of (image, position) pairs
+            alpha (float): Interpolation factor between the previous and current tick
+
+        Returns:
+            list: items
+        """
+        n = self.count
+        xs, ys = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            prev_x, prev_y = self.prev_x[:n], self.prev_y[:n]
+            xs = prev_x + (xs - prev_x) * alpha
+            ys = prev_y + (ys - prev_y) * alpha
+        kinds = self.kind[:n]
+        visible = (self.alive[:n] & (xs < self.settings.SCREEN_WIDTH) & (ys < self.settings.SCREEN_HEIGHT) &
+                   (xs + self.image_width[kinds] > 0) & (ys + self.image_height[kinds] > 0))
+        images = self.images
+        items.extend((images[kind], (x, y)) for kind, x, y in
+                     zip(kinds[visible].tolist(), xs[visible].tolist(), ys[visible].tolist()))
+        return items
+
+    def draw(self, surface, alpha=1.0):
+        """Draw the visible obstacles in one Surface.blits() call.
+
+        Args:
+            surface (pygame.Surface): Game display surface
+            alpha (float): Interpolation factor between the previous and current tick
+        """
+        surface.blits(self.collect([], alpha), doreturn=False)
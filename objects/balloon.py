@@ -1,64 +1,92 @@
-import pygame
-import os  # Ensure os is imported
+from core.assets import assets
 from core.entity import Entity
 from core.settings import GameSettings
-
-balloon_img = pygame.image.load(os.path.join("assets", "balloon.png"))
-balloon_shield_img = pygame.image.load(os.path.join("assets", "balloon-shield.png"))
+from core.time_scale import TimeScale
 
 class Balloon(Entity):
     """Player-controlled hot air balloon entity with fuel management and power-up capabilities."""
-    def __init__(self):
-        """Initialize balloon at center-bottom position with full fuel and default state."""
+    __slots__ = ("settings", "time_scale", "owns_time_scale", "image", "shield_image", "mask", "fuel", "crashed_flag", "crash_cause")
+
+    def __init__(self, settings=GameSettings, time_scale=None):
+        """Initialize balloon at center-bottom position with full fuel and default state.
+
+        Args:
+            settings (type): GameSettings class or a class derived from it
+            time_scale (TimeScale): Session time scale holding the slowdown effect and the shield timer,
+                a private one advanced by update() if omitted
+        """
+        self.settings = settings
+        self.time_scale = time_scale or TimeScale()
+        self.owns_time_scale = time_scale is None
         width, height = 100, 160
-        x = GameSettings.SCREEN_WIDTH // 2 - width // 2
-        y = GameSettings.SCREEN_HEIGHT - height - 100
+        x = self.settings.SCREEN_WIDTH // 2 - width // 2
+        y = self.settings.SCREEN_HEIGHT - height - 100
         super().__init__(x, y, width, height)
-        self.fuel = GameSettings.FUEL_MAX_FILL
-        self.shield_active = False
-        self.shield_timer = 0
-        self.slowdown_active = False
-        self.slowdown_timer = 0
+        self.image = assets.get("balloon.png")
+        self.shield_image = assets.get("balloon-shield.png")
+        self.mask = assets.mask("balloon.png", (width, height))
+        self.fuel = self.settings.FUEL_MAX_FILL
+        self.crashed_flag = False
+        self.crash_cause = None
+
+    def reset(self):
+        """Return the balloon to its starting position with full fuel, no shield and no crash."""
+        self.x = self.prev_x = self.settings.SCREEN_WIDTH // 2 - self.width // 2
+        self.y = self.prev_y = self.settings.SCREEN_HEIGHT - self.height - 100
+        self.fuel = self.settings.FUEL_MAX_FILL
         self.crashed_flag = False
+        self.crash_cause = None
+        self.time_scale.timers.cancel("shield")
 
     def update(self, dt):
         """Update balloon state including:
         - Fuel consumption
-        - Shield timer
-        - Slowdown timer
         - Horizontal boundaries
         - Crash condition
+        - Shield and slowdown timers, when the balloon owns its time scale
         
         Args:
             dt (float): Delta time in seconds
         """
+        if self.owns_time_scale:
+            self.time_scale.update(dt)
         if self.fuel > 0:
-            self.fuel -= GameSettings.FUEL_CONSUMPTION_RATE * dt
+            self.fuel -= self.settings.FUEL_CONSUMPTION_RATE * dt
         else:
-            self.crash()
-
-        if self.shield_active:
-            self.shield_timer -= dt * 1000
-            if self.shield_timer <= 0:
-                self.shield_active = False
-
-        if self.slowdown_active:
-            self.slowdown_timer -= dt * 1000
-            if self.slowdown_timer <= 0:
-                self.slowdown_active = False
-                GameSettings.SLOWDOWN_ACTIVE = False  # Reset the global slowdown flag
-                for obstacle in self.obstacle_manager.obstacles:
-                    if hasattr(obstacle, 'speed_x'):
-                        obstacle.speed_x *= 2  # Reset the horizontal speed of each obstacle
-                    if hasattr(obstacle, 'speed_y'):
-                        obstacle.speed_y *= 2  # Reset the vertical speed of each obstacle
-                    if hasattr(obstacle, 'speed'):
-                        obstacle.speed *= 2  # Reset the speed of each obstacle
+            self.crash("fuel")
 
         if self.x < 0:
             self.x = 0
-        if self.x + self.width > GameSettings.SCREEN_WIDTH:
-            self.x = GameSettings.SCREEN_WIDTH - self.width
+        if self.x + self.width > self.settings.SCREEN_WIDTH:
+            self.x = self.settings.SCREEN_WIDTH - self.width
+
+    @property
+    def shield_active(self):
+        """bool: True while the shield timer runs on the session timers."""
+        return self.time_scale.timers.active("shield")
+
+    @property
+    def shield_timer(self):
+        """float: Milliseconds left on the shield, 0 when inactive."""
+        return self.time_scale.timers.remaining("shield")
+
+    def activate_shield(self, duration):
+        """Protect the balloon from collisions, refreshing an active shield.
+
+        Args:
+            duration (float): Shield duration in milliseconds
+        """
+        self.time_scale.timers.schedule("shield", duration)
+
+    @property
+    def slowdown_active(self):
+        """bool: True while the slowdown effect runs on the session time scale."""
+        return "slowdown" in self.time_scale.effects
+
+    @property
+    def slowdown_timer(self):
+        """float: Milliseconds left on the slowdown effect, 0 when inactive."""
+        return self.time_scale.remaining("slowdown")
 
     def move_left(self, dt):
         """Move balloon left based on horizontal speed and delta time.
@@ -66,7 +94,7 @@ class Balloon(Entity):
         Args:
             dt (float): Delta time in seconds
         """
-        self.x -= GameSettings.BALLOON_HORIZONTAL_SPEED * dt
+        self.x -= self.settings.BALLOON_HORIZONTAL_SPEED * dt
 
     def move_right(self, dt):
         """Move balloon right based on horizontal speed and delta time.
@@ -74,7 +102,7 @@ class Balloon(Entity):
         Args:
             dt (float): Delta time in seconds
         """
-        self.x += GameSettings.BALLOON_HORIZONTAL_SPEED * dt
+        self.x += self.settings.BALLOON_HORIZONTAL_SPEED * dt
 
     def apply_powerup(self, powerup):
         """Apply power-up effect to balloon.
@@ -84,8 +112,14 @@ class Balloon(Entity):
         """
         powerup.apply(self)
 
-    def crash(self):
-        """Set crash state ending the game."""
+    def crash(self, cause="collision"):
+        """Set crash state ending the game.
+
+        Args:
+            cause (str): Reason for the crash, e.g. "collision" or "fuel"
+        """
+        if not self.crashed_flag:
+            self.crash_cause = cause
         self.crashed_flag = True
 
     def has_crashed(self):
@@ -96,13 +130,31 @@ class Balloon(Entity):
         """
         return self.crashed_flag
 
-    def draw(self, surface):
+    def collect(self, items, alpha=1.0):
+        """Append the balloon and its shield overlay to a display list.
+
+        Args:
+            items (list): Display list of (image, position) pairs
+            alpha (float): Interpolation factor between the previous and current tick
+
+        Returns:
+            list: items
+        """
+        x, y = self.render_position(alpha)
+        items.append((self.image, (x, y)))
+        if self.shield_active:
+            items.append((self.shield_image, (x-2, y-2)))
+        return items
+
+    def draw(self, surface, alpha=1.0):
         """Draw the balloon image; if shield is active, draw the shielded balloon image.
 
         Args:
             surface (pygame.Surface): Game display surface
+            alpha (float): Interpolation factor between the previous and current tick
         """
-        surface.blit(balloon_img, (self.x, self.y))
+        x, y = self.render_position(alpha)
+        surface.blit(self.image, (x, y))
 
         if self.shield_active:
-            surface.blit(balloon_shield_img, (self.x-2, self.y-2))
\ No newline at end of file
+            surface.blit(self.shield_image, (x-2, y-2))
\ No newline at end of file
@@ -1,112 +1,126 @@
-import pygame
-import random
-import os  # Ensure os is imported
+from core.assets import assets
 from core.entity import Entity
 from core.settings import GameSettings
 
-bird_img = pygame.image.load(os.path.join("assets", "bird.png"))
-cloud_img = pygame.image.load(os.path.join("assets", "cloud.png"))
-
 # ------------------------------------
 # Obstacle Base Class 
 # ------------------------------------
 class Obstacle(Entity):
     """Base class for scrolling obstacles with horizontal movement behavior."""
-    def __init__(self, x, y, image, speed, width, height):
+    __slots__ = ("settings", "speed", "image", "mask")
+    def __init__(self, x, y, image, speed, width, height, settings=GameSettings):
         super().__init__(x, y, width, height)
+        self.settings = settings
         self.speed = speed  # horizontal speed component
         self.image = image
-        if GameSettings.SLOWDOWN_ACTIVE:
-            self.speed /= 2  # Apply slowdown effect if active
+        self.mask = None  # no per-pixel mask, collisions stay AABB
 
     def update(self, dt):
         """Update obstacle position including:
         - Horizontal movement with screen boundary bouncing
         - Vertical scrolling with background speed
         """
+        self.save_position()
         # Horizontal movement.
         self.x += self.speed * dt
         # Vertical movement (scrolling down to simulate ascent).
-        self.y += GameSettings.OBSTACLE_SPEED * dt  # Use GameSettings.OBSTACLE_SPEED
+        self.y += self.settings.OBSTACLE_SPEED * dt  # Use settings.OBSTACLE_SPEED
 
         # Bounce off horizontal screen boundaries.
         if self.x <= 0:
             self.x = 0
             self.speed = abs(self.speed)
-        elif self.x + self.width >= GameSettings.SCREEN_WIDTH:
-            self.x = GameSettings.SCREEN_WIDTH - self.width
+        elif self.x + self.width >= self.settings.SCREEN_WIDTH:
+            self.x = self.settings.SCREEN_WIDTH - self.width
             self.speed = -abs(self.speed)
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         """Draw the entity image from in self.image
 
         Args:
             surface (pygame.Surface): Game display surface
+            alpha (float): Interpolation factor between the previous and current tick
         """
-        surface.blit(self.image, (self.x, self.y))
+        surface.blit(self.image, self.render_position(alpha))
 
 
 # ------------------------------------
 # Obstacle Subclasses
 # ------------------------------------
-import pygame
-from core.entity import Entity
-from core.settings import GameSettings
-
-bird_img = pygame.image.load(os.path.join("assets", "bird.png"))
-
 class Bird(Entity):
     """Bird obstacle class."""
-    def __init__(self, x, y):
+    __slots__ = ("settings", "image", "mask", "speed_x", "speed_y")
+
+    def __init__(self, x, y, settings=GameSettings):
         width, height = 50, 50
         super().__init__(x, y, width, height)
-        self.image = bird_img
-        self.speed_x = GameSettings.OBSTACLE_SPEED_BIRD
-        self.speed_y = GameSettings.OBSTACLE_SPEED
-        if GameSettings.SLOWDOWN_ACTIVE:
-            self.speed_x /= 2  # Apply slowdown effect if active
-            self.speed_y /= 2  # Apply slowdown effect if active
+        self.settings = settings
+        self.image = assets.get("bird.png")
+        self.mask = assets.mask("bird.png", (width, height))
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Restore the freshly spawned state so a pooled instance can be reused.
+
+        Args:
+            x (int): X-coordinate position
+            y (int): Y-coordinate position
+        """
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
+        self.speed_x = self.settings.OBSTACLE_SPEED_BIRD
+        self.speed_y = self.settings.OBSTACLE_SPEED
 
     def update(self, dt):
         """Update bird position based on game speed settings."""
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.y += self.speed_y * dt
         self.x += self.speed_x * dt
 
         # Bounce off the edges of the screen
-        if self.x <= 0 or self.x + self.width >= GameSettings.SCREEN_WIDTH:
+        if self.x <= 0 or self.x + self.width >= self.settings.SCREEN_WIDTH:
             self.speed_x = -self.speed_x
 
-    def draw(self, surface):
-        """Draw bird on the screen."""
-        surface.blit(self.image, (self.x, self.y))
-
-import pygame
-from core.entity import Entity
-from core.settings import GameSettings
-
-cloud_img = pygame.image.load(os.path.join("assets", "cloud.png"))
+    def draw(self, surface, alpha=1.0):
+        """Draw bird on the screen, interpolated between the last two ticks."""
+        surface.blit(self.image, self.render_position(alpha))
 
 class Cloud(Entity):
     """Cloud obstacle class."""
-    def __init__(self, x, y):
+    __slots__ = ("settings", "image", "mask", "speed_x", "speed_y")
+
+    def __init__(self, x, y, settings=GameSettings):
         width, height = 100, 60
         super().__init__(x, y, width, height)
-        self.image = cloud_img
-        self.speed_x = GameSettings.OBSTACLE_SPEED_CLOUD
-        self.speed_y = GameSettings.OBSTACLE_SPEED
-        if GameSettings.SLOWDOWN_ACTIVE:
-            self.speed_x /= 2  # Apply slowdown effect if active
-            self.speed_y /= 2  # Apply slowdown effect if active
+        self.settings = settings
+        self.image = assets.get("cloud.png")
+        self.mask = assets.mask("cloud.png", (width, height))
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Restore the freshly spawned state so a pooled instance can be reused.
+
+        Args:
+            x (int): X-coordinate position
+            y (int): Y-coordinate position
+        """
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
+        self.speed_x = self.settings.OBSTACLE_SPEED_CLOUD
+        self.speed_y = self.settings.OBSTACLE_SPEED
 
     def update(self, dt):
         """Update cloud position based on game speed settings."""
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.y += self.speed_y * dt
         self.x += self.speed_x * dt
 
         # Bounce off the edges of the screen
-        if self.x <= 0 or self.x + self.width >= GameSettings.SCREEN_WIDTH:
+        if self.x <= 0 or self.x + self.width >= self.settings.SCREEN_WIDTH:
             self.speed_x = -self.speed_x
 
-    def draw(self, surface):
-        """Draw cloud on the screen."""
-        surface.blit(self.image, (self.x, self.y))
\ No newline at end of file
+    def draw(self, surface, alpha=1.0):
+        """Draw cloud on the screen, interpolated between the last two ticks."""
+        surface.blit(self.image, self.render_position(alpha))
\ No newline at end of file
@@ -1,20 +1,30 @@
-import pygame
-import os  # Ensure os is imported
+from core.assets import assets
 from core.entity import Entity
 from core.settings import GameSettings
-
-fuel_img = pygame.image.load(os.path.join("assets", "fuel.png"))
-shield_img = pygame.image.load(os.path.join("assets", "shield.png"))
-slowdown_img = pygame.image.load(os.path.join("assets", "slowdown.png"))
+from core.time_scale import OBSTACLES
 
 # ------------------------------------
 # Power Up Base Class
 # ------------------------------------
 class PowerUp(Entity):
     """Base class for power-up items with vertical scrolling behavior."""
-    def __init__(self, x, y, image, width=50, height=50):
+    __slots__ = ("settings", "image", "mask")
+
+    def __init__(self, x, y, image, width=50, height=50, settings=GameSettings, mask=None):
         super().__init__(x, y, width, height)
+        self.settings = settings
         self.image = image
+        self.mask = mask  # collision mask, None for AABB-only collisions
+
+    def reset(self, x, y):
+        """Move a pooled power-up back to its spawn position.
+
+        Args:
+            x (int): X-coordinate position
+            y (int): Y-coordinate position
+        """
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
 
     def update(self, dt):
         """Make the power-up "fall" downwards.
@@ -22,15 +32,17 @@ class PowerUp(Entity):
         Args:
             dt (Float): Delta time in seconds
         """
-        self.y += GameSettings.BACKGROUND_SPEED * dt
+        self.prev_y = self.y
+        self.y += self.settings.BACKGROUND_SPEED * dt
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         """Draw power-up image on specified surface. Image is stored in self.image.
         
         Args:
             surface (pygame.Surface): Game display surface
+            alpha (float): Interpolation factor between the previous and current tick
         """
-        surface.blit(self.image, (self.x, self.y))
+        surface.blit(self.image, self.render_position(alpha))
 
     def apply(self, balloon):
         """Abstract method to apply power-up effect to balloon.
@@ -45,8 +57,11 @@ class PowerUp(Entity):
 # ------------------------------------
 class ShieldPowerUp(PowerUp):
     """Power-up that grants temporary invincibility to the balloon."""
-    def __init__(self, x, y):
-        super().__init__(x, y, shield_img)
+    __slots__ = ()
+
+    def __init__(self, x, y, settings=GameSettings):
+        super().__init__(x, y, assets.get("shield.png"), settings=settings,
+                         mask=assets.mask("shield.png", (50, 50)))
 
     def apply(self, balloon):
         """Activate shield protection on balloon.
@@ -54,14 +69,16 @@ class ShieldPowerUp(PowerUp):
         Args:
             balloon (Balloon): Balloon to apply effect to
         """
-        balloon.shield_active = True
-        balloon.shield_timer = GameSettings.SHIELD_DURATION
-        print("Shield activated for {} ms!".format(GameSettings.SHIELD_DURATION))
+        balloon.activate_shield(self.settings.SHIELD_DURATION)
+        print("Shield activated for {} ms!".format(self.settings.SHIELD_DURATION))
 
 class FuelPowerUp(PowerUp):
     """Power-up that refills balloon's fuel supply."""
-    def __init__(self, x, y):
-        super().__init__(x, y, fuel_img)
+    __slots__ = ()
+
+    def __init__(self, x, y, settings=GameSettings):
+        super().__init__(x, y, assets.get("fuel.png"), settings=settings,
+                         mask=assets.mask("fuel.png", (50, 50)))
 
     def apply(self, balloon):
         """Increase balloon's fuel level.
@@ -69,15 +86,18 @@ class FuelPowerUp(PowerUp):
         Args:
             balloon (Balloon): Balloon to apply effect to
         """
-        balloon.fuel += GameSettings.FUEL_POWER_UP # Increase fuel
-        if balloon.fuel > GameSettings.FUEL_MAX_FILL:
-            balloon.fuel = GameSettings.FUEL_MAX_FILL
+        balloon.fuel += self.settings.FUEL_POWER_UP # Increase fuel
+        if balloon.fuel > self.settings.FUEL_MAX_FILL:
+            balloon.fuel = self.settings.FUEL_MAX_FILL
         print("Fuel increased!")
 
 class SlowdownPowerUp(PowerUp):
     """Power-up that slows down obstacles."""
-    def __init__(self, x, y):
-        super().__init__(x, y, slowdown_img)
+    __slots__ = ()
+
+    def __init__(self, x, y, settings=GameSettings):
+        super().__init__(x, y, assets.get("slowdown.png"), settings=settings,
+                         mask=assets.mask("slowdown.png", (50, 50)))
 
     def apply(self, balloon):
         """Slow down obstacles.
@@ -85,14 +105,7 @@ class SlowdownPowerUp(PowerUp):
         Args:
             balloon (Balloon): Balloon to apply effect to
         """
-        balloon.slowdown_active = True
-        balloon.slowdown_timer = GameSettings.SLOWDOWN_DURATION
-        GameSettings.SLOWDOWN_ACTIVE = True  # Set the global slowdown flag
-        for obstacle in balloon.obstacle_manager.obstacles:
-            if hasattr(obstacle, 'speed_x'):
-                obstacle.speed_x /= 2  # Halve the horizontal speed of each obstacle
-            if hasattr(obstacle, 'speed_y'):
-                obstacle.speed_y /= 2  # Halve the vertical speed of each obstacle
-            if hasattr(obstacle, 'speed'):
-                obstacle.speed /= 2  # Halve the speed of each obstacle
-        print("Obstacles slowed down for {} ms!".format(GameSettings.SLOWDOWN_DURATION))
\ No newline at end of file
+        # Picking up another slowdown refreshes the duration instead of stacking
+        balloon.time_scale.add_effect("slowdown", self.settings.SLOWDOWN_FACTOR, (OBSTACLES,),
+                                      self.settings.SLOWDOWN_DURATION)
+        print("Obstacles slowed down for {} ms!".format(self.settings.SLOWDOWN_DURATION))
\ No newline at end of file
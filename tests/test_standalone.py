@@ -0,0 +1,36 @@
+import pytest
+
+from core.game_managers import ObstacleManager, PowerUpManager
+from core.settings import GameSettings
+from objects.balloon import Balloon
+
+DT = 1 / 60
+
+
+def test_standalone_managers_spawn_after_one_interval():
+    obstacles, powerups = ObstacleManager(), PowerUpManager()
+    frames = int(max(GameSettings.OBSTACLE_SPAWN_INTERVAL, GameSettings.POWERUP_SPAWN_INTERVAL) / 1000 / DT) + 1
+    for _ in range(frames):
+        obstacles.update(DT)
+        powerups.update(DT)
+    assert obstacles.pool.created >= 1
+    assert powerups.pool.created >= 1
+
+
+def test_standalone_vector_manager_spawns_after_one_interval():
+    pytest.importorskip("numpy")
+    from core.vector_obstacles import VectorObstacleManager
+    obstacles = VectorObstacleManager()
+    for _ in range(int(GameSettings.OBSTACLE_SPAWN_INTERVAL / 1000 / DT) + 1):
+        obstacles.update(DT)
+    assert obstacles.spawned >= 1
+
+
+def test_standalone_balloon_shield_and_slowdown_expire():
+    balloon = Balloon()
+    balloon.activate_shield(500)
+    balloon.time_scale.add_effect("slowdown", 0.5, ("obstacles",), 500)
+    for _ in range(int(0.5 / DT) + 2):
+        balloon.update(DT)
+    assert not balloon.shield_active
+    assert not balloon.slowdown_active
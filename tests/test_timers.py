@@ -0,0 +1,49 @@
+import pytest
+
+from core.settings import GameSettings
+from core.spawn_scheduler import SpawnScheduler
+from core.timers import TimerService
+
+
+def test_repeating_timer_keeps_its_rate():
+    timers = TimerService()
+    fired = []
+    timers.schedule("tick", 100, lambda: fired.append(timers.now) or 100)
+    timers.advance(350)
+    assert len(fired) == 3
+    assert timers.remaining("tick") == pytest.approx(50)
+
+
+def test_non_positive_delay_is_rejected():
+    timers = TimerService()
+    with pytest.raises(ValueError):
+        timers.schedule("spawn", 0)
+    with pytest.raises(ValueError):
+        timers.schedule("spawn", -5)
+
+
+def test_non_positive_repeat_delay_raises_instead_of_hanging():
+    timers = TimerService()
+    timers.schedule("spawn", 10, lambda: 0)
+    with pytest.raises(ValueError):
+        timers.advance(20)
+
+
+def test_spawn_scheduler_rejects_zero_intervals():
+    with pytest.raises(ValueError):
+        SpawnScheduler(0, timers=TimerService())
+    with pytest.raises(ValueError):
+        SpawnScheduler(1000, curve=[(0, 1000), (500, 0)], timers=TimerService())
+
+
+def test_zero_spawn_interval_does_not_hang_the_game():
+    from balloon_game import GameLoop
+    with pytest.raises(ValueError):
+        GameLoop(settings=GameSettings.derive(OBSTACLE_SPAWN_INTERVAL=0, TELEMETRY_ENABLED=False))
+
+
+def test_standalone_scheduler_advances_its_own_timers():
+    scheduler = SpawnScheduler(1000)
+    assert scheduler.due(0.5) == 0
+    assert scheduler.due(0.5) == 1
+    assert scheduler.due(2.0) == 2